@@ -0,0 +1,69 @@
+# ==========================================================
+# BENCHMARK: mesin batch vs. loop skalar
+# Mengecek kecocokan hasil lalu membandingkan throughput (skenario/detik)
+# Jalankan: python benchmarks/bench_batch.py [jumlah_skenario]
+# ==========================================================
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import perhitungan_orbit as po
+
+TOLERANSI_RELATIF = 1e-11
+
+
+def buat_skenario(n, seed=0):
+    rng = np.random.default_rng(seed)
+    r1 = rng.uniform(po.RADIUS_BUMI, 5e7, n)
+    r2 = rng.uniform(po.RADIUS_BUMI, po.RADIUS_ATAS_MAX, n)
+    massa_kosong = rng.uniform(500.0, 100_000.0, n)
+    return r1, r2, massa_kosong
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    r1, r2, massa_kosong = buat_skenario(n)
+
+    mulai = time.perf_counter()
+    massa_s = np.empty((n, po.jumlah_bahan_bakar))
+    biaya_s = np.empty((n, po.jumlah_bahan_bakar))
+    for k in range(n):
+        massa_s[k], biaya_s[k] = po.hitung_skalar(float(r1[k]), float(r2[k]), float(massa_kosong[k]))
+    waktu_skalar = time.perf_counter() - mulai
+
+    mulai = time.perf_counter()
+    massa_b, biaya_b = po.hitung_batch(r1, r2, massa_kosong)
+    waktu_batch = time.perf_counter() - mulai
+
+    # pow/sqrt NumPy (SIMD) bisa berbeda 1 ulp dari libm, jadi bandingkan
+    # selisih relatif, bukan kesamaan bit
+    selisih = max(
+        np.max(np.abs(massa_b - massa_s) / np.maximum(np.abs(massa_s), 1e-300)),
+        np.max(np.abs(biaya_b - biaya_s) / np.maximum(np.abs(biaya_s), 1e-300)),
+    )
+    cocok = selisih <= TOLERANSI_RELATIF
+    print("Skenario             :", n)
+    print("Selisih relatif maks :", selisih)
+    print("Cocok (<= %g)     :" % TOLERANSI_RELATIF, cocok)
+    print("Skalar               :", round(n / waktu_skalar), "skenario/detik")
+    print("Batch (NumPy)        :", round(n / waktu_batch), "skenario/detik")
+    print("Percepatan           : ×", round(waktu_skalar / waktu_batch, 1))
+
+    # Perbandingan mode solver pada jalur batch
+    for mode in ("tetap", "toleransi", "tertutup"):
+        mulai = time.perf_counter()
+        po.hitung_batch(r1, r2, massa_kosong, mode=mode)
+        waktu = time.perf_counter() - mulai
+        print("Batch mode %-10s:" % mode, round(n / waktu), "skenario/detik")
+
+    if not cocok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# ==========================================================
+# BENCHMARK: cache kutipan vs. perhitungan langsung
+# Mengecek kecocokan hasil mode_batch dengan dan tanpa --cache, lalu
+# membandingkan waktu run dingin (semua miss) dan hangat (semua hit).
+#
+# Kunci cache dikuantisasi (KUANTUM_RADIUS, KUANTUM_MASSA, KUANTUM_ISP),
+# jadi hasil ber-cache SAMA PERSIS dengan hasil tanpa cache untuk masukan
+# yang sudah dibulatkan ke kuantum itu, dan berbeda sedikit dari hasil
+# untuk masukan mentah:
+#   massa bahan bakar : selisih relatif <= TOLERANSI_MASSA
+#   R3                : selisih <= TOLERANSI_R3 meter (R3 peka terhadap
+#                       massa_kosong di bagian kurva biaya yang landai)
+# R3 ber-cache juga harus terjangkau untuk masukan mentah (biaya <= anggaran).
+# Jalankan: python benchmarks/bench_cache.py [jumlah_skenario]
+# ==========================================================
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cache_kutipan
+import mode_batch
+import perhitungan_orbit as po
+
+TOLERANSI_MASSA = 1e-5     # relatif
+TOLERANSI_R3 = 250.0       # meter
+
+
+def buat_record(n, seed=0):
+    rng = np.random.default_rng(seed)
+    r1 = rng.uniform(po.RADIUS_BUMI, 5e7, n)
+    r2 = rng.uniform(po.RADIUS_BUMI, po.RADIUS_ATAS_MAX, n)
+    massa_kosong = rng.uniform(500.0, 100_000.0, n)
+    anggaran = 10.0 ** rng.uniform(2.0, 8.0, n)
+    return [{"R1": a, "R2": b, "massa_kosong": c, "anggaran": d}
+            for a, b, c, d in zip(r1, r2, massa_kosong, anggaran)]
+
+
+def dibulatkan(record):
+    # masukan yang sudah berada tepat di kuantum kunci cache
+    return {
+        "R1": round(record["R1"] / cache_kutipan.KUANTUM_RADIUS) * cache_kutipan.KUANTUM_RADIUS,
+        "R2": round(record["R2"] / cache_kutipan.KUANTUM_RADIUS) * cache_kutipan.KUANTUM_RADIUS,
+        "massa_kosong": round(record["massa_kosong"] / cache_kutipan.KUANTUM_MASSA) * cache_kutipan.KUANTUM_MASSA,
+        "anggaran": record["anggaran"],
+    }
+
+
+def kolom(hasil, nama):
+    return np.array([h[nama] for h in hasil], dtype=np.float64)
+
+
+def r3(hasil):
+    # orbit_maks None (ada bahan bakar terjangkau) -> NaN agar bisa dibandingkan
+    return np.array([h["orbit_maks"] if h["orbit_maks"] is not None else [np.nan] * po.jumlah_bahan_bakar
+                     for h in hasil], dtype=np.float64)
+
+
+def selisih_r3(a, b):
+    sama_nan = np.isnan(a) == np.isnan(b)
+    if not sama_nan.all():
+        return np.inf
+    beda = np.abs(a - b)[~np.isnan(a)]
+    return float(beda.max()) if beda.size else 0.0
+
+
+def jumlah_melebihi(hasil, record):
+    # R3 yang biayanya (dengan masukan mentah) melebihi anggaran
+    r3_ = r3(hasil)
+    ada = ~np.isnan(r3_)
+    r1 = np.array([r["R1"] for r in record])[:, None]
+    massa_kosong = np.array([r["massa_kosong"] for r in record])[:, None]
+    anggaran = np.array([r["anggaran"] for r in record])[:, None]
+    biaya = po.biaya_ke_orbit(r1, np.where(ada, r3_, r1), massa_kosong,
+                              np.asarray(po.isp_bahan_bakar, dtype=np.float64) * po.gravitasi_bumi,
+                              np.asarray(po.harga_bahan_bakar, dtype=np.float64))
+    return int(np.count_nonzero(ada & (biaya > anggaran)))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3_000
+    record = buat_record(n)
+
+    with tempfile.TemporaryDirectory() as direktori:
+        jalur = os.path.join(direktori, "kutipan.sqlite")
+        with cache_kutipan.CacheKutipan(jalur) as cache:
+            mulai = time.perf_counter()
+            dingin = list(mode_batch.jalankan_batch(iter(record), cache=cache))
+            waktu_dingin = time.perf_counter() - mulai
+            mulai = time.perf_counter()
+            hangat = list(mode_batch.jalankan_batch(iter(record), cache=cache))
+            waktu_hangat = time.perf_counter() - mulai
+            bulat = [dibulatkan(r) for r in record]
+            hangat_bulat = list(mode_batch.jalankan_batch(iter(bulat), cache=cache))
+
+    mulai = time.perf_counter()
+    langsung = list(mode_batch.jalankan_batch(iter(record)))
+    waktu_langsung = time.perf_counter() - mulai
+    langsung_bulat = list(mode_batch.jalankan_batch(iter(bulat)))
+
+    massa_cache = kolom(hangat, "massa_bahan_bakar")
+    # hit == miss, dan cache == perhitungan langsung untuk masukan terkuantisasi (bit demi bit)
+    hit_sama_miss = massa_cache.tobytes() == kolom(dingin, "massa_bahan_bakar").tobytes() \
+        and selisih_r3(r3(hangat), r3(dingin)) == 0.0
+    sama_bulat = kolom(hangat_bulat, "massa_bahan_bakar").tobytes() \
+        == kolom(langsung_bulat, "massa_bahan_bakar").tobytes() \
+        and selisih_r3(r3(hangat_bulat), r3(langsung_bulat)) == 0.0
+
+    massa_langsung = kolom(langsung, "massa_bahan_bakar")
+    selisih_massa = float(np.max(np.abs(massa_cache - massa_langsung)
+                                 / np.maximum(np.abs(massa_langsung), 1e-300)))
+    beda_r3 = selisih_r3(r3(hangat), r3(langsung))
+    dalam_toleransi = selisih_massa <= TOLERANSI_MASSA and beda_r3 <= TOLERANSI_R3
+    melebihi = jumlah_melebihi(hangat, record)
+
+    print("Skenario                      :", n)
+    print("Hit identik dengan miss       :", hit_sama_miss)
+    print("Identik (masukan terkuantisasi):", sama_bulat)
+    print("Selisih relatif massa (mentah):", selisih_massa, "(toleransi", TOLERANSI_MASSA, ")")
+    print("Selisih R3 maks (mentah)      :", round(beda_r3, 3), "m (toleransi", TOLERANSI_R3, "m)")
+    print("R3 melebihi anggaran (mentah) :", melebihi)
+    print("Tanpa cache                   :", round(n / waktu_langsung), "skenario/detik")
+    print("Cache dingin (miss)           :", round(n / waktu_dingin), "skenario/detik")
+    print("Cache hangat (hit)            :", round(n / waktu_hangat), "skenario/detik")
+
+    if not (hit_sama_miss and sama_bulat and dalam_toleransi and melebihi == 0):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
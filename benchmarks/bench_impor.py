@@ -0,0 +1,56 @@
+# ==========================================================
+# BENCHMARK: waktu import pustaka + panggilan pertama
+# Tiap pengukuran dijalankan di proses Python baru agar tidak ada cache.
+# Jalankan: python benchmarks/bench_impor.py [ulangan]
+# ==========================================================
+
+import os
+import subprocess
+import sys
+
+AKAR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+KODE_UKUR = r"""
+import sys, time
+t0 = time.perf_counter()
+import perhitungan_orbit as po
+t1 = time.perf_counter()
+po.hitung_skalar(6_771_000.0, 42_164_000.0, 22_800.0)
+t2 = time.perf_counter()
+numpy_dimuat = "numpy" in sys.modules
+po.cari_orbit_maks(6_771_000.0, 42_164_000.0, 22_800.0, 1000.0)
+t3 = time.perf_counter()
+print(t1 - t0, t2 - t1, t3 - t2, int(numpy_dimuat))
+"""
+
+
+def ukur_sekali():
+    keluaran = subprocess.run([sys.executable, "-c", KODE_UKUR], cwd=AKAR, check=True,
+                              capture_output=True, text=True).stdout.split()
+    return [float(x) for x in keluaran[:3]], bool(int(keluaran[3]))
+
+
+def main():
+    ulangan = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    hasil = []
+    numpy_dimuat = False
+    for _ in range(ulangan):
+        waktu, dimuat = ukur_sekali()
+        hasil.append(waktu)
+        numpy_dimuat = numpy_dimuat or dimuat
+
+    def median(kolom):
+        nilai = sorted(h[kolom] for h in hasil)
+        return nilai[len(nilai) // 2]
+
+    print("Ulangan                          :", ulangan)
+    print("Import perhitungan_orbit (median):", round(median(0) * 1e3, 3), "ms")
+    print("Panggilan skalar pertama         :", round(median(1) * 1e3, 3), "ms")
+    print("NumPy dimuat sebelum jalur array :", numpy_dimuat)
+    print("R3 pertama (termasuk import NumPy):", round(median(2) * 1e3, 3), "ms")
+    if numpy_dimuat:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# ==========================================================
+# BENCHMARK: layanan kutipan asyncio di localhost
+# Menjalankan layanan pada port bebas, lalu banyak klien keep-alive
+# mengirim permintaan bersamaan; laporkan throughput, latensi p50/p99,
+# dan ukuran micro-batch rata-rata.
+# Jalankan: python benchmarks/bench_layanan.py [klien] [permintaan_per_klien]
+# ==========================================================
+
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import layanan_kutipan as lk
+
+
+async def klien(port, jumlah, latensi, rng):
+    pembaca, penulis = await asyncio.open_connection("127.0.0.1", port)
+    for _ in range(jumlah):
+        badan = json.dumps({
+            "R1": rng.uniform(6_571_000, 8_371_000),
+            "R2": rng.uniform(6_771_000, 42_164_000),
+            "massa_kosong": rng.uniform(950, 100_000),
+            "anggaran": rng.uniform(1e4, 1e8),
+        }).encode()
+        mulai = time.perf_counter()
+        penulis.write(b"POST /kutipan HTTP/1.1\r\nHost: localhost\r\nContent-Length: %d\r\n\r\n"
+                      % len(badan) + badan)
+        await penulis.drain()
+        await pembaca.readline()
+        panjang = 0
+        while True:
+            baris = await pembaca.readline()
+            if baris == b"\r\n":
+                break
+            if baris.lower().startswith(b"content-length:"):
+                panjang = int(baris.split(b":")[1])
+        json.loads(await pembaca.readexactly(panjang))
+        latensi.append(time.perf_counter() - mulai)
+    penulis.close()
+
+
+async def utama(jumlah_klien, per_klien):
+    server, penggabung = await lk.mulai_layanan(port=0)
+    port = server.sockets[0].getsockname()[1]
+    latensi = []
+    rng = random.Random(0)
+    mulai = time.perf_counter()
+    await asyncio.gather(*(klien(port, per_klien, latensi, rng) for _ in range(jumlah_klien)))
+    waktu = time.perf_counter() - mulai
+    server.close()
+    await server.wait_closed()
+    await penggabung.berhenti()
+
+    latensi.sort()
+    statistik = penggabung.statistik()
+    print("Klien x permintaan     :", jumlah_klien, "x", per_klien)
+    print("Throughput             :", round(len(latensi) / waktu), "permintaan/detik")
+    print("Latensi p50 / p99      :", round(latensi[len(latensi) // 2] * 1e3, 2), "/",
+          round(latensi[int(len(latensi) * 0.99)] * 1e3, 2), "ms")
+    print("Ukuran batch rata-rata :", round(statistik["rata_rata_ukuran_batch"], 1))
+    print("Ditolak (503)          :", statistik["jumlah_ditolak"])
+
+
+if __name__ == "__main__":
+    jumlah_klien = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    per_klien = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    asyncio.run(utama(jumlah_klien, per_klien))
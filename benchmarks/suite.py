@@ -0,0 +1,193 @@
+# ==========================================================
+# SUITE BENCHMARK jalur panas ΔV, bahan bakar, dan R3
+# Kasus:
+#   kutipan_tunggal      : satu kutipan skalar (hitung_skalar)
+#   kutipan_tetap20      : idem dengan solver lama 20 iterasi (pembanding)
+#   batch_1 / _1e3 / _1e6: throughput hitung_batch pada beberapa ukuran
+#   r3_dekat             : cari_orbit_maks LEO -> GEO
+#   r3_jauh              : cari_orbit_maks LEO -> RADIUS_ATAS_MAX
+#   kurva_biaya_buat     : membangun kurva biaya satu sesi
+#   tambah_anggaran      : evaluasi ulang R3 lewat kurva untuk anggaran baru
+# Setiap kasus diukur ULANGAN kali (masing-masing >= MINIMUM_DETIK) dan
+# diambil mediannya, yang jauh lebih stabil antar-run daripada nilai
+# tercepat; hasil dalam operasi/detik (untuk batch: skenario/detik).
+#
+# Jalankan:
+#   python benchmarks/suite.py                    # bandingkan dengan baseline
+#   python benchmarks/suite.py --simpan-baseline  # tulis baseline baru
+#   python benchmarks/suite.py --margin 0.2       # gagal bila turun > 20%
+# Kasus yang lebih berisik memakai margin sendiri (MARGIN_KASUS) yang
+# tidak pernah lebih ketat daripada --margin. Kasus yang tampak turun
+# diukur ulang sampai KONFIRMASI kali; hanya penurunan yang bertahan di
+# setiap pengukuran yang dilaporkan sebagai regresi. Baseline disimpan
+# sebagai median dari RUN_BASELINE run penuh.
+# ==========================================================
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+AKAR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, AKAR)
+
+import perhitungan_orbit as po
+
+JALUR_BASELINE = os.path.join(AKAR, "benchmarks", "baseline.json")
+MARGIN = 0.30
+ULANGAN = 9
+MINIMUM_DETIK = 0.2
+# kasus mikrodetik yang didominasi overhead Python / alokasi NumPy
+MARGIN_KASUS = {
+    "batch_1": 0.40,
+    "r3_jauh": 0.40,
+    "tambah_anggaran": 0.40,
+}
+KONFIRMASI = 2
+RUN_BASELINE = 3
+
+LEO = 6_771_000.0
+GEO = 42_164_000.0
+MASSA = 22_800.0
+
+
+def ukur(fungsi, operasi, ulangan=ULANGAN, minimum_detik=MINIMUM_DETIK):
+    """Median operasi/detik dari beberapa ulangan; fungsi diulang sampai >= minimum_detik."""
+    fungsi()  # pemanasan (import malas, cache, dsb.)
+    putaran = 1
+    while True:
+        mulai = time.perf_counter()
+        for _ in range(putaran):
+            fungsi()
+        waktu = time.perf_counter() - mulai
+        if waktu >= minimum_detik:
+            break
+        putaran *= 2
+    waktu_per_panggilan = [waktu / putaran]
+    for _ in range(ulangan - 1):
+        mulai = time.perf_counter()
+        for _ in range(putaran):
+            fungsi()
+        waktu_per_panggilan.append((time.perf_counter() - mulai) / putaran)
+    return operasi / float(np.median(waktu_per_panggilan))
+
+
+def skenario(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(po.RADIUS_BUMI, 5e7, n),
+            rng.uniform(po.RADIUS_BUMI, po.RADIUS_ATAS_MAX, n),
+            rng.uniform(500.0, 100_000.0, n))
+
+
+def kasus_benchmark():
+    """Daftar (nama, fungsi, jumlah_operasi_per_panggilan)."""
+    kasus = [
+        ("kutipan_tunggal", lambda: po.hitung_skalar(LEO, GEO, MASSA), 1),
+        ("kutipan_tetap20", lambda: po.hitung_skalar(LEO, GEO, MASSA, mode="tetap"), 1),
+    ]
+    for nama, n in (("batch_1", 1), ("batch_1e3", 1_000), ("batch_1e6", 1_000_000)):
+        r1, r2, mk = skenario(n)
+        kasus.append((nama, lambda r1=r1, r2=r2, mk=mk: po.hitung_batch(r1, r2, mk), n))
+
+    kasus.append(("r3_dekat", lambda: po.cari_orbit_maks(LEO, GEO, MASSA, 100_000.0), 1))
+    kasus.append(("r3_jauh", lambda: po.cari_orbit_maks(LEO, po.RADIUS_ATAS_MAX, MASSA, 100_000.0), 1))
+
+    kasus.append(("kurva_biaya_buat", lambda: po.buat_kurva_biaya(LEO, GEO, MASSA), 1))
+    kurva = po.buat_kurva_biaya(LEO, GEO, MASSA)
+    anggaran = np.geomspace(1e3, 1e7, 64)
+    kasus.append(("tambah_anggaran",
+                  lambda: [po.orbit_maks_dari_kurva(kurva, a) for a in anggaran], len(anggaran)))
+    return kasus
+
+
+def jalankan(saring=None, nama_saja=None):
+    """Ukur kasus yang lolos saringan (atau hanya nama_saja bila diberikan)."""
+    hasil = {}
+    for nama, fungsi, operasi in kasus_benchmark():
+        if saring and saring not in nama:
+            continue
+        if nama_saja is not None and nama not in nama_saja:
+            continue
+        hasil[nama] = ukur(fungsi, operasi)
+        print("%-18s %14.1f op/detik" % (nama, hasil[nama]), flush=True)
+    return hasil
+
+
+def _turun(nama, nilai, baseline, margin):
+    acuan = baseline.get("hasil", {}).get(nama)
+    if acuan is None:
+        return None
+    rasio = nilai / acuan
+    return rasio, rasio < 1.0 - max(margin, MARGIN_KASUS.get(nama, 0.0))
+
+
+def bandingkan(hasil, baseline, margin):
+    """Kembalikan daftar nama kasus yang throughput-nya turun melebihi margin."""
+    turun = []
+    for nama, nilai in hasil.items():
+        banding = _turun(nama, nilai, baseline, margin)
+        if banding is None:
+            continue
+        rasio, regresi = banding
+        if regresi:
+            turun.append(nama)
+        print("%-18s %6.2fx baseline  %s" % (nama, rasio, "TURUN" if regresi else "OK"))
+    return turun
+
+
+def konfirmasi(turun, baseline, margin, ulangan=KONFIRMASI):
+    """Ukur ulang kasus yang turun; kembalikan yang tetap turun di setiap pengukuran."""
+    for _ in range(ulangan):
+        if not turun:
+            break
+        print("\nUkur ulang:", ", ".join(turun))
+        hasil = jalankan(nama_saja=turun)
+        turun = [nama for nama in turun if _turun(nama, hasil[nama], baseline, margin)[1]]
+    return turun
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suite benchmark jalur panas perpindahan orbit")
+    parser.add_argument("--baseline", default=JALUR_BASELINE)
+    parser.add_argument("--simpan-baseline", action="store_true")
+    parser.add_argument("--margin", type=float, default=MARGIN,
+                        help="penurunan throughput relatif yang masih diterima (0.3 = 30%%)")
+    parser.add_argument("--saring", help="hanya kasus yang namanya memuat teks ini")
+    args = parser.parse_args(argv)
+
+    if args.simpan_baseline:
+        # median per kasus dari beberapa run penuh, agar baseline tidak
+        # ikut menyimpan satu run yang kebetulan cepat atau lambat
+        semua = [jalankan(args.saring) for _ in range(RUN_BASELINE)]
+        hasil = {nama: float(np.median([run[nama] for run in semua])) for nama in semua[0]}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "mesin": platform.machine(),
+                "hasil": hasil,
+            }, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print("Baseline disimpan ke", args.baseline)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("Baseline belum ada; jalankan dengan --simpan-baseline dulu.")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    hasil = jalankan(args.saring)
+    print()
+    turun = konfirmasi(bandingkan(hasil, baseline, args.margin), baseline, args.margin)
+    if turun:
+        print("\nRegresi throughput (> %d%%): %s" % (round(args.margin * 100), ", ".join(turun)))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
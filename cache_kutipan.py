@@ -0,0 +1,417 @@
+# ==========================================================
+# CACHE KUTIPAN (SQLite di disk, LRU, aman multi-proses)
+# Menyimpan massa bahan bakar per bahan bakar dan hasil R3 agar transfer
+# yang sering dikutip (mis. LEO -> GEO untuk massa bus standar) tidak
+# dihitung ulang di setiap proses / setiap run.
+#
+# Kunci memakai nilai terkuantisasi (R1, R2, massa_kosong, Isp) dan mode
+# solver (ditambah AKHIRAN_DORONG_RENDAH untuk bahan bakar yang dihitung
+# dengan ΔV spiral Edelbaum, bawaan po.kolom_dorong_rendah). Harga TIDAK
+# masuk kunci: yang disimpan adalah massa, dan biaya = massa × harga
+# dihitung setelah lookup, jadi perubahan harga tidak membatalkan entri.
+# Untuk R3 anggaran diubah menjadi batas massa (anggaran / harga)
+# sehingga kunci R3 pun bebas harga.
+#
+# Nilai yang disimpan selalu dihitung dari nilai kunci yang sudah
+# dikuantisasi, sehingga hit dan miss memberi hasil yang identik. Hasil
+# ber-cache sama persis dengan hasil tanpa cache untuk masukan yang
+# dibulatkan ke kuantum (1 m, 1 g, 0.001 s), tetapi BUKAN untuk masukan
+# mentah: pada skenario acak (benchmarks/bench_cache.py) massa bahan bakar
+# berbeda hingga ~1e-6 relatif dan R3 hingga puluhan meter (sampai ~100 m
+# di bagian kurva biaya yang landai, tempat R3 peka terhadap pembulatan
+# massa_kosong). Karena itu setiap R3 dari cache diperiksa ulang dengan
+# masukan mentah (po.mundur_ke_terjangkau_batch): R3 selalu di sisi yang
+# terjangkau untuk anggaran mentah, dan R2 terjangkau memberi R2 mentah.
+#
+#   import cache_kutipan
+#   with cache_kutipan.CacheKutipan("kutipan.sqlite") as cache:
+#       massa, biaya = cache.kutip(6_771_000, 42_164_000, 22_800)
+#       r3 = cache.orbit_maks(6_771_000, 42_164_000, 22_800, 1e5)
+#       print(cache.statistik())
+# ==========================================================
+
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+import instrumentasi as _ins
+import perhitungan_orbit as po
+
+# Resolusi kuantisasi kunci
+KUANTUM_RADIUS = 1.0      # meter (sama dengan PRESISI_R3)
+KUANTUM_MASSA = 1e-3      # kg
+KUANTUM_ISP = 1e-3        # detik
+
+KAPASITAS = 1_000_000     # entri maksimum per tabel (massa, r3)
+BATAS_TUNGGU = 30.0       # detik menunggu kunci tulis proses lain
+KUNCI_PER_KUERI = 150     # 150 × 6 parameter < batas lama SQLite (999)
+SENTUHAN_TERTUNDA_MAKS = 256   # hit yang dikumpulkan sebelum waktu aksesnya ditulis
+AKHIRAN_DORONG_RENDAH = "+edelbaum"   # kolom mode untuk entri ΔV spiral
+
+_SKEMA = """
+CREATE TABLE IF NOT EXISTS massa (
+    r1 INTEGER, r2 INTEGER, mk INTEGER, isp INTEGER, mode TEXT,
+    nilai REAL, akses INTEGER,
+    PRIMARY KEY (r1, r2, mk, isp, mode)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS massa_akses ON massa (akses);
+CREATE TABLE IF NOT EXISTS r3 (
+    r1 INTEGER, r2 INTEGER, mk INTEGER, isp INTEGER, mode TEXT, batas_massa REAL,
+    nilai REAL, akses INTEGER,
+    PRIMARY KEY (r1, r2, mk, isp, mode, batas_massa)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS r3_akses ON r3 (akses);
+CREATE TABLE IF NOT EXISTS statistik (nama TEXT PRIMARY KEY, nilai INTEGER NOT NULL);
+"""
+
+_KOLOM_KUNCI = {
+    "massa": ("r1", "r2", "mk", "isp", "mode"),
+    "r3": ("r1", "r2", "mk", "isp", "mode", "batas_massa"),
+}
+
+
+class CacheKutipan:
+    """Cache persisten massa bahan bakar & R3 dengan penggusuran LRU.
+
+    jalur     : berkas SQLite (dibuat bila belum ada)
+    kapasitas : entri maksimum per tabel; entri yang paling lama tidak
+                diakses digusur lebih dulu
+    mode      : mode solver (bawaan: po.MODE_SOLVER), bagian dari kunci
+
+    Hasil = hasil tanpa cache untuk R1, R2 dibulatkan ke KUANTUM_RADIUS,
+    massa_kosong ke KUANTUM_MASSA, dan Isp ke KUANTUM_ISP. Terhadap masukan
+    mentah, massa berbeda ~1e-6 relatif dan R3 hingga ~100 m (lihat
+    kepala modul); R3 diperiksa ulang terhadap masukan mentah sehingga
+    biayanya tidak pernah melebihi anggaran.
+
+    Beberapa proses boleh membuka berkas yang sama: SQLite berjalan dalam
+    mode WAL (pembaca tidak memblokir penulis) dan setiap penulisan adalah
+    satu transaksi IMMEDIATE. Koneksi dibuka ulang otomatis setelah fork.
+    Objek boleh dipakai dari thread selain pembuatnya, tetapi hanya satu
+    thread dalam satu waktu.
+
+    Agar hit cukup berupa satu SELECT, pembaruan waktu akses (LRU) dan
+    penghitung hit dikumpulkan lalu ditulis bersama miss berikutnya, setiap
+    SENTUHAN_TERTUNDA_MAKS kunci, atau saat sinkronkan() / tutup().
+    """
+
+    def __init__(self, jalur, kapasitas=KAPASITAS, mode=None):
+        if kapasitas < 1:
+            raise ValueError("kapasitas cache harus >= 1")
+        self.jalur = jalur
+        self.kapasitas = int(kapasitas)
+        self.mode = po.MODE_SOLVER if mode is None else mode
+        self.hit = {"massa": 0, "r3": 0}
+        self.miss = {"massa": 0, "r3": 0}
+        self._tertunda = {"massa": {}, "r3": {}}
+        self._koneksi = None
+        self._pid = None
+        self._buka()
+
+    # ------------------------------------------------------
+    # Koneksi
+    # ------------------------------------------------------
+
+    def _buka(self):
+        # boleh dipakai dari thread lain (mis. thread pekerja layanan_kutipan),
+        # asal tidak bersamaan
+        koneksi = sqlite3.connect(self.jalur, timeout=BATAS_TUNGGU, isolation_level=None,
+                                  check_same_thread=False)
+        koneksi.execute("PRAGMA journal_mode=WAL")
+        koneksi.execute("PRAGMA synchronous=NORMAL")
+        koneksi.executescript(_SKEMA)
+        self._koneksi = koneksi
+        self._pid = os.getpid()
+
+    def _db(self):
+        # koneksi SQLite tidak boleh dipakai bersama proses anak hasil fork;
+        # sentuhan tertunda milik proses induk juga tidak ikut ditulis anak
+        if self._pid != os.getpid():
+            self._tertunda = {"massa": {}, "r3": {}}
+            self._buka()
+        return self._koneksi
+
+    def tutup(self):
+        if self._koneksi is not None and self._pid == os.getpid():
+            self.sinkronkan()
+            self._koneksi.close()
+        self._koneksi = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.tutup()
+
+    # ------------------------------------------------------
+    # Lookup / simpan (umum untuk kedua tabel)
+    # ------------------------------------------------------
+
+    def _cari(self, tabel, kunci):
+        """dict kunci -> nilai untuk kunci yang ada di tabel."""
+        kolom = _KOLOM_KUNCI[tabel]
+        db = self._db()
+        ditemukan = {}
+        unik = list(dict.fromkeys(kunci))
+        for awal in range(0, len(unik), KUNCI_PER_KUERI):
+            bagian = unik[awal:awal + KUNCI_PER_KUERI]
+            tanda = ",".join(["(" + ",".join("?" * len(kolom)) + ")"] * len(bagian))
+            # JOIN ke VALUES (bukan "(...) IN (VALUES ...)", yang dijalankan
+            # SQLite sebagai scan seluruh tabel) agar tiap kunci dicari lewat
+            # primary key
+            kueri = ("SELECT " + ",".join("t." + k for k in kolom) + ", t.nilai FROM (VALUES "
+                     + tanda + ") AS c JOIN " + tabel + " AS t ON ("
+                     + ",".join("t." + k for k in kolom) + ") = ("
+                     + ",".join("c.column" + str(j + 1) for j in range(len(kolom))) + ")")
+            for baris in db.execute(kueri, [v for k in bagian for v in k]):
+                ditemukan[baris[:-1]] = baris[-1]
+        return ditemukan
+
+    def _simpan(self, tabel, hit, baru):
+        """Catat hit (sentuhan LRU ditunda) dan tulis entri baru."""
+        tertunda = self._tertunda[tabel]
+        for k in hit:
+            tertunda[k] = tertunda.get(k, 0) + 1
+        if _ins.AKTIF:
+            _ins.tambah("cache_" + tabel, "hit", len(hit))
+            _ins.tambah("cache_" + tabel, "miss", len(baru))
+        if baru or len(tertunda) >= SENTUHAN_TERTUNDA_MAKS:
+            self._tulis(tabel, baru)
+
+    def _tulis(self, tabel, baru=None):
+        """Satu transaksi: sentuh waktu akses hit tertunda, sisipkan entri baru, gusur LRU."""
+        kolom = _KOLOM_KUNCI[tabel]
+        cocok = " AND ".join(k + "=?" for k in kolom)
+        tertunda = self._tertunda[tabel]
+        if not baru and not tertunda:
+            return
+        sekarang = time.time_ns()
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            if tertunda:
+                db.executemany("UPDATE " + tabel + " SET akses=? WHERE " + cocok,
+                               [(sekarang,) + k for k in tertunda])
+            disisip = 0
+            if baru:
+                disisip = db.executemany(
+                    "INSERT OR IGNORE INTO " + tabel + " (" + ",".join(kolom) + ", nilai, akses)"
+                    " VALUES (" + ",".join("?" * (len(kolom) + 2)) + ")",
+                    [k + (v, sekarang) for k, v in baru.items()]).rowcount
+            jumlah = self._tambah_statistik(db, "jumlah_" + tabel, disisip)
+            digusur = 0
+            if jumlah > self.kapasitas:
+                digusur = db.execute(
+                    "DELETE FROM " + tabel + " WHERE (" + ",".join(kolom) + ") IN (SELECT "
+                    + ",".join(kolom) + " FROM " + tabel + " ORDER BY akses LIMIT ?)",
+                    (jumlah - self.kapasitas,)).rowcount
+                self._tambah_statistik(db, "jumlah_" + tabel, -digusur)
+                self._tambah_statistik(db, "gusur_" + tabel, digusur)
+            self._tambah_statistik(db, "hit_" + tabel, sum(tertunda.values()))
+            self._tambah_statistik(db, "miss_" + tabel, len(baru) if baru else 0)
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        tertunda.clear()
+        if _ins.AKTIF and digusur:
+            _ins.tambah("cache_" + tabel, "gusur", digusur)
+
+    def sinkronkan(self):
+        """Tulis sentuhan LRU & statistik hit yang masih tertunda."""
+        for tabel in _KOLOM_KUNCI:
+            self._tulis(tabel)
+
+    @staticmethod
+    def _tambah_statistik(db, nama, jumlah):
+        db.execute("INSERT INTO statistik (nama, nilai) VALUES (?, ?) "
+                   "ON CONFLICT(nama) DO UPDATE SET nilai = nilai + excluded.nilai",
+                   (nama, int(jumlah)))
+        return db.execute("SELECT nilai FROM statistik WHERE nama=?", (nama,)).fetchone()[0]
+
+    # ------------------------------------------------------
+    # Massa bahan bakar & biaya
+    # ------------------------------------------------------
+
+    def _mode_kolom(self, spiral):
+        # nilai kolom mode per bahan bakar; entri dorong rendah terpisah dari Hohmann
+        return [self.mode + AKHIRAN_DORONG_RENDAH if s else self.mode for s in spiral.tolist()]
+
+    def massa_batch(self, jari_orbit_awal, jari_orbit_akhir, massa_kosong, isp=None,
+                    dorong_rendah=None):
+        """Massa bahan bakar (N, F) seperti po.hitung_batch, lewat cache.
+
+        dorong_rendah seperti po.hitung_batch (bawaan po.kolom_dorong_rendah(isp)).
+        Entri yang belum ada dihitung sekaligus dalam satu pass vektor lalu
+        disimpan; entri yang ada hanya diperbarui waktu aksesnya.
+        """
+        if isp is None:
+            isp = po.isp_bahan_bakar
+        r1, r2, mk = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(jari_orbit_awal, dtype=np.float64)),
+            np.atleast_1d(np.asarray(jari_orbit_akhir, dtype=np.float64)),
+            np.atleast_1d(np.asarray(massa_kosong, dtype=np.float64)),
+        )
+        q_isp = _kuantisasi(isp, KUANTUM_ISP)
+        q_r1 = _kuantisasi(r1, KUANTUM_RADIUS)
+        q_r2 = _kuantisasi(r2, KUANTUM_RADIUS)
+        q_mk = _kuantisasi(mk, KUANTUM_MASSA)
+        mode_kolom = self._mode_kolom(po.mask_dorong_rendah(np.asarray(isp, dtype=np.float64), dorong_rendah))
+        kunci = [(a, b, c, d, m) for a, b, c in zip(q_r1, q_r2, q_mk) for d, m in zip(q_isp, mode_kolom)]
+
+        ditemukan = self._cari("massa", kunci)
+        hilang = list(dict.fromkeys(k for k in kunci if k not in ditemukan))
+        baru = {}
+        if hilang:
+            k = np.array([h[:4] for h in hilang], dtype=np.float64)
+            spiral = np.array([h[4] != self.mode for h in hilang])
+            massa = po.biaya_ke_orbit(k[:, 0] * KUANTUM_RADIUS, k[:, 1] * KUANTUM_RADIUS,
+                                      k[:, 2] * KUANTUM_MASSA,
+                                      k[:, 3] * KUANTUM_ISP * po.gravitasi_bumi, 1.0, self.mode, spiral)
+            baru = dict(zip(hilang, massa.tolist()))
+        hit = [k for k in dict.fromkeys(kunci) if k in ditemukan]
+        self.hit["massa"] += len(hit)
+        self.miss["massa"] += len(baru)
+        self._simpan("massa", hit, baru)
+
+        ditemukan.update(baru)
+        return np.array([ditemukan[k] for k in kunci], dtype=np.float64).reshape(r1.shape[0], len(q_isp))
+
+    def kutip(self, jari_orbit_awal, jari_orbit_akhir, massa_kosong, isp=None, harga=None,
+              dorong_rendah=None):
+        """(massa, biaya) per bahan bakar seperti po.hitung_skalar; harga dipakai setelah lookup."""
+        if harga is None:
+            harga = po.harga_bahan_bakar
+        massa = self.massa_batch([jari_orbit_awal], [jari_orbit_akhir], [massa_kosong], isp,
+                                 dorong_rendah)[0]
+        biaya = po.hitung_biaya_batch(massa, harga)
+        return massa.tolist(), biaya.tolist()
+
+    # ------------------------------------------------------
+    # Orbit maksimum (R3)
+    # ------------------------------------------------------
+
+    def orbit_maks_batch(self, jari_orbit_awal, jari_orbit_akhir, massa_kosong, anggaran,
+                         isp=None, harga=None, dorong_rendah=None):
+        """Versi ber-cache dari po.cari_orbit_maks_batch: masukan (N,), hasil (N, F).
+
+        biaya <= anggaran  <=>  massa <= anggaran / harga, jadi kuncinya
+        adalah batas massa itu sendiri (tidak dikuantisasi: anggaran kecil
+        berarti batas massa di bawah KUANTUM_MASSA). Harga 0 selalu
+        terjangkau: R3 = R2.
+        """
+        if isp is None:
+            isp = po.isp_bahan_bakar
+        if harga is None:
+            harga = po.harga_bahan_bakar
+        r1, r2, mk, anggaran = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(jari_orbit_awal, dtype=np.float64)),
+            np.atleast_1d(np.asarray(jari_orbit_akhir, dtype=np.float64)),
+            np.atleast_1d(np.asarray(massa_kosong, dtype=np.float64)),
+            np.atleast_1d(np.asarray(anggaran, dtype=np.float64)),
+        )
+        harga = np.asarray(harga, dtype=np.float64)
+        bentuk = (r1.shape[0], harga.shape[0])
+        hasil = np.broadcast_to(r2[:, None], bentuk).copy()
+
+        with np.errstate(divide="ignore"):
+            batas_massa = anggaran[:, None] / harga[None, :]
+        perlu = np.isfinite(batas_massa)
+        baris, kolom = np.nonzero(perlu)
+        if not baris.size:
+            return hasil
+
+        q_isp = np.asarray(_kuantisasi(isp, KUANTUM_ISP))
+        q_r1 = np.asarray(_kuantisasi(r1, KUANTUM_RADIUS))
+        q_r2 = np.asarray(_kuantisasi(r2, KUANTUM_RADIUS))
+        q_mk = np.asarray(_kuantisasi(mk, KUANTUM_MASSA))
+        spiral_kolom = po.mask_dorong_rendah(np.asarray(isp, dtype=np.float64), dorong_rendah)
+        mode_kolom = self._mode_kolom(spiral_kolom)
+        kunci = list(zip(q_r1[baris].tolist(), q_r2[baris].tolist(), q_mk[baris].tolist(),
+                         q_isp[kolom].tolist(), [mode_kolom[f] for f in kolom.tolist()],
+                         batas_massa[perlu].tolist()))
+
+        ditemukan = self._cari("r3", kunci)
+        hilang = list(dict.fromkeys(k for k in kunci if k not in ditemukan))
+        baru = {}
+        if hilang:
+            k = np.array([h[:4] + h[5:] for h in hilang], dtype=np.float64)
+            spiral = np.array([h[4] != self.mode for h in hilang])
+            r3 = np.empty(len(hilang))
+            # satu pencarian vektor per (Isp, ΔV Hohmann/spiral) unik, harga 1 sehingga biaya = massa
+            for nilai_isp in np.unique(k[:, 3]):
+                for s in (False, True):
+                    pilih = (k[:, 3] == nilai_isp) & (spiral == s)
+                    if not pilih.any():
+                        continue
+                    r3[pilih] = po.cari_orbit_maks_batch(
+                        k[pilih, 0] * KUANTUM_RADIUS, k[pilih, 1] * KUANTUM_RADIUS,
+                        k[pilih, 2] * KUANTUM_MASSA, k[pilih, 4],
+                        [nilai_isp * KUANTUM_ISP], [1.0], mode=self.mode, dorong_rendah=[s])[:, 0]
+            baru = dict(zip(hilang, r3.tolist()))
+        hit = [k for k in dict.fromkeys(kunci) if k in ditemukan]
+        self.hit["r3"] += len(hit)
+        self.miss["r3"] += len(baru)
+        self._simpan("r3", hit, baru)
+
+        ditemukan.update(baru)
+        # Nilai cache dihitung dari kunci terkuantisasi; periksa ulang
+        # terhadap masukan mentah. R2 terkuantisasi berarti "R2 terjangkau"
+        # -> R2 mentah; R3 yang biaya mentahnya melebihi anggaran mundur ke
+        # sisi terjangkau (galat <= po.PRESISI_R3), seperti tanpa cache.
+        r3 = np.array([ditemukan[k] for k in kunci], dtype=np.float64)
+        r3 = np.where(r3 == q_r2[baris] * KUANTUM_RADIUS, r2[baris], r3)
+        hasil[baris, kolom] = po.mundur_ke_terjangkau_batch(
+            r1[baris], r3, mk[baris], anggaran[baris],
+            np.asarray(isp, dtype=np.float64)[kolom] * po.gravitasi_bumi, harga[kolom],
+            mode=self.mode, dorong_rendah=spiral_kolom[kolom])
+        return hasil
+
+    def orbit_maks(self, jari_orbit_awal, jari_orbit_akhir, massa_kosong, anggaran,
+                   isp=None, harga=None, dorong_rendah=None):
+        """Versi ber-cache dari po.cari_orbit_maks: array (F,) jari-jari R3."""
+        return self.orbit_maks_batch([jari_orbit_awal], [jari_orbit_akhir], [massa_kosong],
+                                     [anggaran], isp, harga, dorong_rendah)[0]
+
+    # ------------------------------------------------------
+    # Statistik & pemeliharaan
+    # ------------------------------------------------------
+
+    def statistik(self):
+        """Hit/miss sesi ini, total semua proses, dan jumlah entri per tabel."""
+        self.sinkronkan()
+        total = dict(self._db().execute("SELECT nama, nilai FROM statistik").fetchall())
+        hasil = {"kapasitas": self.kapasitas}
+        for tabel in ("massa", "r3"):
+            hit_total = total.get("hit_" + tabel, 0)
+            miss_total = total.get("miss_" + tabel, 0)
+            hasil[tabel] = {
+                "hit": self.hit[tabel],
+                "miss": self.miss[tabel],
+                "hit_total": hit_total,
+                "miss_total": miss_total,
+                "rasio_hit_total": hit_total / (hit_total + miss_total) if hit_total + miss_total else 0.0,
+                "digusur_total": total.get("gusur_" + tabel, 0),
+                "entri": total.get("jumlah_" + tabel, 0),
+            }
+        return hasil
+
+    def kosongkan(self):
+        """Hapus semua entri dan statistik."""
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            for tabel in ("massa", "r3", "statistik"):
+                db.execute("DELETE FROM " + tabel)
+            db.execute("COMMIT")
+            self._tertunda = {"massa": {}, "r3": {}}
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+
+
+def _kuantisasi(nilai, kuantum):
+    """Nilai -> list int (kelipatan kuantum terdekat)."""
+    return np.rint(np.atleast_1d(np.asarray(nilai, dtype=np.float64)) / kuantum).astype(np.int64).tolist()
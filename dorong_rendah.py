@@ -0,0 +1,299 @@
+# ==========================================================
+# TRANSFER DORONG RENDAH (propulsi listrik, spiral)
+# Pembakaran impulsif Hohmann tidak berlaku untuk mesin ion/Hall: gaya
+# dorongnya kecil sehingga orbit dinaikkan perlahan lewat spiral ribuan
+# putaran, dan ΔV-nya mendekati |v(R1) - v(R2)| (Edelbaum), jauh di atas
+# ΔV Hohmann.
+#
+# Propagator ini mengintegrasikan gerak dua benda bidang + gaya dorong
+# tangensial (searah kecepatan saat menaikkan orbit, berlawanan saat
+# menurunkan) untuk banyak wahana sekaligus:
+#   - RK4 ter-vektor; langkah tiap wahana = periode orbit lokal /
+#     langkah_per_orbit (adaptif terhadap radius)
+#   - laju massa = gaya_dorong / (Isp × g0)
+#   - berhenti per wahana saat sumbu semi-mayor oskulasi mencapai R2
+#     (diinterpolasi di dalam langkah terakhir)
+# Massa awal (basah) belum diketahui di awal, jadi dicari titik tetap
+# m0 = massa_kosong × e^(ΔV / ve), dengan tebakan awal ΔV Edelbaum.
+#
+# Sampel lintasan (t, x, y, vx, vy, m) ditulis bertahap ke berkas biner
+# dan dibaca kembali sebagai memmap:
+#   direktori/meta.json     : jumlah wahana, kolom, jumlah sampel
+#   direktori/lintasan.dat  : float64 (jumlah_sampel, jumlah_wahana, 6)
+#
+# Contoh:
+#   python dorong_rendah.py --r1 6771000 --r2 42164000 --massa 1500 \
+#       --gaya 0.5 --anggaran 5e7 --lintasan hasil_spiral
+# ==========================================================
+
+import argparse
+import json
+import math
+import os
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+import instrumentasi as _ins
+import perhitungan_orbit as po
+
+MU = po.G * po.massa_bumi
+INDEKS_LISTRIK = po.nama_bahan_bakar.index("Electric (Xenon ion/Hall)")
+
+# ΔV Edelbaum ada di perhitungan_orbit agar kutipan bawaan (hitung_batch,
+# mode_batch, dst.) dan propagator ini memakai rumus yang sama
+delta_v_edelbaum = po.hitung_delta_v_edelbaum_batch
+
+LANGKAH_PER_ORBIT = 128
+LANGKAH_MAKS = 5_000_000
+SAMPEL_SETIAP = 256          # tulis satu sampel lintasan tiap sekian langkah
+TOLERANSI_MASSA = 1e-6       # selisih relatif m0 antar-iterasi titik tetap
+ITERASI_MASSA_MAKS = 6
+KOLOM_LINTASAN = ["t", "x", "y", "vx", "vy", "m"]
+
+HasilSpiral = namedtuple("HasilSpiral", ["massa_awal", "massa_bahan_bakar", "waktu_transfer",
+                                         "deltaV", "jumlah_langkah", "selesai"])
+HasilDorongRendah = namedtuple("HasilDorongRendah", ["massa_bahan_bakar", "biaya", "waktu_transfer",
+                                                     "deltaV", "mampu_beli", "selesai", "residu",
+                                                     "iterasi"])
+
+
+# ----------------------------------------------------------
+# Propagator
+# ----------------------------------------------------------
+
+def _turunan(keadaan, gaya, kecepatan_buang, arah):
+    x, y, vx, vy, m = keadaan
+    r2 = x * x + y * y
+    gravitasi = -MU / (r2 * np.sqrt(r2))
+    v = np.sqrt(vx * vx + vy * vy)
+    dorong = arah * gaya / (m * v)
+    return np.stack((vx, vy, gravitasi * x + dorong * vx, gravitasi * y + dorong * vy,
+                     -gaya / kecepatan_buang))
+
+
+def _sumbu_semi_mayor(keadaan):
+    x, y, vx, vy, _ = keadaan
+    energi = 0.5 * (vx * vx + vy * vy) - MU / np.sqrt(x * x + y * y)
+    with np.errstate(divide="ignore"):
+        # energi >= 0: lepas dari Bumi, anggap sumbu semi-mayor tak hingga
+        return np.where(energi < 0, -MU / (2 * energi), np.inf)
+
+
+def propagasi_spiral(jari_orbit_awal, jari_orbit_akhir, massa_awal, gaya_dorong, isp,
+                     langkah_per_orbit=LANGKAH_PER_ORBIT, langkah_maks=LANGKAH_MAKS,
+                     penulis=None):
+    """Integrasikan spiral dorong tangensial untuk N wahana (semua argumen saling broadcast).
+
+    penulis : PenulisLintasan opsional; menerima sampel tiap SAMPEL_SETIAP langkah
+    Kembalikan HasilSpiral berisi array (N,); selesai=False bila langkah_maks
+    habis sebelum R2 tercapai.
+    """
+    r1, r2, m0, gaya, isp = (np.array(a, dtype=np.float64) for a in np.broadcast_arrays(
+        np.atleast_1d(jari_orbit_awal), np.atleast_1d(jari_orbit_akhir),
+        np.atleast_1d(massa_awal), np.atleast_1d(gaya_dorong), np.atleast_1d(isp)))
+    kecepatan_buang = isp * po.gravitasi_bumi
+    naik = r2 >= r1
+    arah = np.where(naik, 1.0, -1.0)
+    n = r1.shape[0]
+
+    keadaan = np.stack((r1, np.zeros(n), np.zeros(n), np.sqrt(MU / r1), m0))
+    t = np.zeros(n)
+    aktif = r1 != r2
+    waktu_akhir = np.zeros(n)
+    massa_akhir = m0.copy()
+    langkah = np.zeros(n, dtype=np.int64)
+    a_lama = r1.copy()
+    faktor_langkah = 2 * math.pi / langkah_per_orbit
+
+    k = 0
+    while aktif.any() and k < langkah_maks:
+        x, y = keadaan[0], keadaan[1]
+        r = np.sqrt(x * x + y * y)
+        # langkah = periode orbit lokal / langkah_per_orbit; 0 untuk wahana yang sudah selesai
+        dt = np.where(aktif, faktor_langkah * np.sqrt(r * r * r / MU), 0.0)
+        k1 = _turunan(keadaan, gaya, kecepatan_buang, arah)
+        k2 = _turunan(keadaan + 0.5 * dt * k1, gaya, kecepatan_buang, arah)
+        k3 = _turunan(keadaan + 0.5 * dt * k2, gaya, kecepatan_buang, arah)
+        k4 = _turunan(keadaan + dt * k3, gaya, kecepatan_buang, arah)
+        baru = keadaan + (dt / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
+        a_baru = _sumbu_semi_mayor(baru)
+
+        sampai = aktif & np.where(naik, a_baru >= r2, a_baru <= r2)
+        if sampai.any():
+            # titik potong a = R2 di dalam langkah ini (interpolasi linear)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                pecahan = np.clip(np.where(np.isfinite(a_baru), (r2 - a_lama) / (a_baru - a_lama), 0.0),
+                                  0.0, 1.0)
+            waktu_akhir = np.where(sampai, t + pecahan * dt, waktu_akhir)
+            massa_akhir = np.where(sampai, keadaan[4] + pecahan * (baru[4] - keadaan[4]), massa_akhir)
+
+        keadaan = baru
+        t = t + dt
+        langkah += aktif
+        a_lama = a_baru
+        aktif &= ~sampai
+        k += 1
+        if penulis is not None and k % SAMPEL_SETIAP == 0:
+            penulis.tulis(t, keadaan)
+
+    if penulis is not None and k % SAMPEL_SETIAP != 0:
+        penulis.tulis(t, keadaan)
+    # yang belum selesai: laporkan keadaan terakhir
+    waktu_akhir = np.where(aktif, t, waktu_akhir)
+    massa_akhir = np.where(aktif, keadaan[4], massa_akhir)
+    if _ins.AKTIF:
+        _ins.tambah("dorong_rendah", "iterasi", k)
+        _ins.tambah("dorong_rendah", "evaluasi", 4 * int(langkah.sum()))
+        _ins.tambah("dorong_rendah", "batas_tercapai", np.count_nonzero(aktif))
+    return HasilSpiral(m0, m0 - massa_akhir, waktu_akhir,
+                       kecepatan_buang * np.log(m0 / massa_akhir), langkah, ~aktif)
+
+
+# ----------------------------------------------------------
+# Lintasan di disk
+# ----------------------------------------------------------
+
+class PenulisLintasan:
+    """Tulis sampel (t, x, y, vx, vy, m) bertahap ke direktori/lintasan.dat."""
+
+    def __init__(self, direktori, jumlah_wahana):
+        os.makedirs(direktori, exist_ok=True)
+        self.direktori = direktori
+        self.jumlah_wahana = jumlah_wahana
+        self.jumlah_sampel = 0
+        self._berkas = open(os.path.join(direktori, "lintasan.dat"), "wb")
+
+    def tulis(self, t, keadaan):
+        blok = np.empty((self.jumlah_wahana, len(KOLOM_LINTASAN)))
+        blok[:, 0] = t
+        blok[:, 1:] = keadaan.T
+        self._berkas.write(blok.tobytes())
+        self.jumlah_sampel += 1
+
+    def tutup(self, info=None):
+        self._berkas.close()
+        meta = {
+            "jumlah_wahana": self.jumlah_wahana,
+            "jumlah_sampel": self.jumlah_sampel,
+            "sampel_setiap_langkah": SAMPEL_SETIAP,
+            "kolom": KOLOM_LINTASAN,
+        }
+        if info:
+            meta.update(info)
+        with open(os.path.join(self.direktori, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        if not self._berkas.closed:
+            self.tutup()
+
+
+def buka_lintasan(direktori):
+    """(meta, memmap read-only (jumlah_sampel, jumlah_wahana, 6))."""
+    with open(os.path.join(direktori, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+    lintasan = np.memmap(os.path.join(direktori, "lintasan.dat"), dtype=np.float64, mode="r",
+                         shape=(meta["jumlah_sampel"], meta["jumlah_wahana"], len(meta["kolom"])))
+    return meta, lintasan
+
+
+# ----------------------------------------------------------
+# Kutipan (massa bahan bakar -> biaya -> anggaran)
+# ----------------------------------------------------------
+
+def kutip_dorong_rendah(jari_orbit_awal, jari_orbit_akhir, massa_kosong, anggaran, gaya_dorong,
+                        isp=None, harga=None, langkah_per_orbit=LANGKAH_PER_ORBIT,
+                        langkah_maks=LANGKAH_MAKS, direktori_lintasan=None):
+    """Massa bahan bakar, biaya, dan waktu transfer spiral untuk N wahana.
+
+    Bawaan isp/harga: entri "Electric (Xenon ion/Hall)" katalog. Massa awal
+    dicari dengan iterasi titik tetap m0 = massa_kosong × e^(ΔV(m0) / ve);
+    residu = selisih relatif m0 pada iterasi terakhir (biasanya 2 iterasi,
+    karena ΔV spiral hampir tidak bergantung pada m0).
+    """
+    if isp is None:
+        isp = po.isp_bahan_bakar[INDEKS_LISTRIK]
+    if harga is None:
+        harga = po.harga_bahan_bakar[INDEKS_LISTRIK]
+    r1, r2, mk, anggaran, gaya, isp, harga = (np.array(a, dtype=np.float64) for a in np.broadcast_arrays(
+        np.atleast_1d(jari_orbit_awal), np.atleast_1d(jari_orbit_akhir), np.atleast_1d(massa_kosong),
+        np.atleast_1d(anggaran), np.atleast_1d(gaya_dorong), np.atleast_1d(isp), np.atleast_1d(harga)))
+    kecepatan_buang = isp * po.gravitasi_bumi
+
+    m0 = mk * po.e ** (delta_v_edelbaum(r1, r2) / kecepatan_buang)
+    iterasi = 0
+    while True:
+        iterasi += 1
+        # lintasan ditimpa tiap iterasi; yang tersisa milik propagasi terakhir
+        penulis = None
+        if direktori_lintasan is not None:
+            penulis = PenulisLintasan(direktori_lintasan, r1.shape[0])
+        try:
+            spiral = propagasi_spiral(r1, r2, m0, gaya, isp, langkah_per_orbit, langkah_maks, penulis)
+        finally:
+            if penulis is not None:
+                penulis.tutup({"jari_orbit_awal": r1.tolist(), "jari_orbit_akhir": r2.tolist(),
+                               "gaya_dorong": gaya.tolist(), "isp": isp.tolist()})
+        m0_baru = mk * po.e ** (spiral.deltaV / kecepatan_buang)
+        residu = np.abs(m0_baru - m0) / m0_baru
+        m0 = m0_baru
+        if residu.max() <= TOLERANSI_MASSA or iterasi >= ITERASI_MASSA_MAKS:
+            break
+
+    massa_bahan_bakar = m0 - mk
+    biaya = po.hitung_biaya_batch(massa_bahan_bakar, harga)
+    mampu_beli = po.mampu_beli_batch(biaya[:, None], anggaran)[:, 0]
+    return HasilDorongRendah(massa_bahan_bakar, biaya, spiral.waktu_transfer, spiral.deltaV,
+                             spiral.selesai & mampu_beli, spiral.selesai, residu, iterasi)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Transfer spiral dorong rendah (propulsi listrik)")
+    parser.add_argument("--r1", type=float, nargs="+", required=True, help="radius awal (m), satu per wahana")
+    parser.add_argument("--r2", type=float, nargs="+", required=True, help="radius tujuan (m)")
+    parser.add_argument("--massa", type=float, nargs="+", required=True, help="massa kosong (kg)")
+    parser.add_argument("--gaya", type=float, nargs="+", required=True, help="gaya dorong (N)")
+    parser.add_argument("--anggaran", type=float, nargs="+", required=True, help="anggaran ($)")
+    parser.add_argument("--isp", type=float, nargs="+", help="Isp (s), bawaan entri listrik katalog")
+    parser.add_argument("--harga", type=float, nargs="+", help="harga ($/kg), bawaan entri listrik katalog")
+    parser.add_argument("--langkah-per-orbit", type=int, default=LANGKAH_PER_ORBIT)
+    parser.add_argument("--lintasan", metavar="DIREKTORI", help="tulis sampel lintasan ke direktori ini")
+    args = parser.parse_args(argv)
+
+    for nama in ("r1", "r2"):
+        for r in getattr(args, nama):
+            if r < po.RADIUS_BUMI or r > po.RADIUS_ATAS_MAX:
+                print("Input tidak valid:", nama, "harus di antara", po.RADIUS_BUMI, "dan",
+                      po.RADIUS_ATAS_MAX, "m", file=sys.stderr)
+                return 2
+    for nama in ("massa", "gaya", "anggaran", "isp", "harga"):
+        if any(not v > 0 for v in getattr(args, nama) or ()):
+            print("Input tidak valid:", nama, "harus lebih besar dari 0", file=sys.stderr)
+            return 2
+    try:
+        hasil = kutip_dorong_rendah(args.r1, args.r2, args.massa, args.anggaran, args.gaya,
+                                    args.isp, args.harga, args.langkah_per_orbit,
+                                    direktori_lintasan=args.lintasan)
+    except ValueError as galat:
+        print("Input tidak valid:", galat, file=sys.stderr)
+        return 2
+
+    _, deltaV1, deltaV2 = po.hitung_delta_v_batch(*np.broadcast_arrays(
+        np.asarray(args.r1, dtype=np.float64), np.asarray(args.r2, dtype=np.float64)))
+    for i in range(hasil.massa_bahan_bakar.shape[0]):
+        print("Wahana", i, "| ΔV spiral =", round(float(hasil.deltaV[i]), 2), "m/s (Hohmann",
+              round(float(abs(deltaV1[i % deltaV1.shape[0]]) + abs(deltaV2[i % deltaV2.shape[0]])), 2),
+              "m/s) | bahan bakar =", round(float(hasil.massa_bahan_bakar[i]), 2), "kg | biaya =",
+              round(float(hasil.biaya[i]), 2), "$ | waktu =", round(float(hasil.waktu_transfer[i]) / 86400, 2),
+              "hari |", "terjangkau" if hasil.mampu_beli[i] else
+              ("tidak selesai" if not hasil.selesai[i] else "melebihi anggaran"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+# ==========================================================
+# EVALUASI INKREMENTAL ("what-if")
+# Satu skenario yang diubah-ubah berulang kali (massa kosong, harga,
+# anggaran, orbit) tanpa menghitung ulang hal yang tidak berubah:
+#
+#   massa bahan bakar = massa_kosong × rasio(R1, R2, Isp)
+#   biaya             = massa bahan bakar × harga
+#
+# sehingga yang disimpan per skenario adalah rasio massa per bahan bakar
+# dan kurva rasio vs. radius (untuk R3). Dampak tiap perubahan:
+#   orbit (R1/R2)   : ΔV + solver baru; kurva R3 dibuang
+#   massa_kosong    : skala ulang massa & biaya, O(F)
+#   harga           : skala ulang biaya, O(F)
+#   anggaran        : saring ulang keterjangkauan saja (+ lookup kurva R3);
+#                     biaya diurutkan sekali (katalog_bahan_bakar.
+#                     indeks_dari_biaya) sehingga saringan cukup bisect
+# Rasio hanya berlaku untuk solver yang konvergen; untuk mode "tetap"
+# (20 iterasi dari tebakan massa_kosong + 1000) massa tidak linear
+# terhadap massa_kosong, jadi perubahan massa_kosong memicu solver ulang.
+#
+#   import evaluasi_inkremental as ei
+#   sesi = ei.EvaluasiWhatIf(6_771_000, 42_164_000, 22_800, 100_000)
+#   sesi.hasil()
+#   sesi.atur_massa_kosong(950)
+#   sesi.atur_anggaran(5_000)
+#   sesi.hasil().orbit_maks
+# ==========================================================
+
+from collections import namedtuple
+
+import numpy as np
+
+import instrumentasi as _ins
+import katalog_bahan_bakar as kb
+import perhitungan_orbit as po
+
+HasilWhatIf = namedtuple("HasilWhatIf", ["deltaV1", "deltaV2", "massa", "biaya",
+                                         "daftar_mampu_beli", "orbit_maks"])
+
+
+class EvaluasiWhatIf:
+    """Skenario tunggal dengan hasil antara yang disimpan per lapisan.
+
+    isp, harga : array (F,), bawaan katalog perhitungan_orbit
+    dorong_rendah : seperti po.hitung_batch (bawaan po.kolom_dorong_rendah(isp):
+                 bahan bakar listrik memakai ΔV spiral Edelbaum)
+    hasil()    : HasilWhatIf; orbit_maks (F,) hanya diisi bila tidak ada
+                 bahan bakar yang terjangkau (sama dengan mode_batch)
+    jumlah_hitung mencatat berapa kali tiap lapisan benar-benar dihitung.
+    """
+
+    def __init__(self, jari_orbit_awal, jari_orbit_akhir, massa_kosong, anggaran,
+                 isp=None, harga=None, mode=None, dorong_rendah=None):
+        if isp is None:
+            isp = po.isp_bahan_bakar
+        if harga is None:
+            harga = po.harga_bahan_bakar
+        self.mode = po.MODE_SOLVER if mode is None else mode
+        self._kecepatan_buang = np.asarray(isp, dtype=np.float64) * po.gravitasi_bumi
+        self._spiral = po.mask_dorong_rendah(np.asarray(isp, dtype=np.float64), dorong_rendah).copy()
+        self._harga = np.array(harga, dtype=np.float64)
+        if self._harga.shape != self._kecepatan_buang.shape:
+            raise ValueError("panjang isp dan harga harus sama")
+        self._r1 = float(jari_orbit_awal)
+        self._r2 = float(jari_orbit_akhir)
+        self._massa_kosong = float(massa_kosong)
+        self._anggaran = float(anggaran)
+        # massa_kosong saat rasio/kurva dihitung (hanya berbeda dari 1 pada mode "tetap")
+        self._massa_acuan = None
+
+        self._delta_v = None
+        self._rasio = None
+        self._kurva = None
+        self._massa = None
+        self._biaya = None
+        self._indeks = None
+        self._hasil = None
+        self.jumlah_hitung = {"delta_v": 0, "solver": 0, "kurva": 0, "skala_massa": 0,
+                              "skala_biaya": 0, "indeks": 0, "saring": 0}
+
+    # ------------------------------------------------------
+    # Perubahan masukan (hanya membuang lapisan yang terdampak)
+    # ------------------------------------------------------
+
+    def atur_orbit(self, jari_orbit_awal, jari_orbit_akhir):
+        jari_orbit_awal = float(jari_orbit_awal)
+        jari_orbit_akhir = float(jari_orbit_akhir)
+        if (jari_orbit_awal, jari_orbit_akhir) != (self._r1, self._r2):
+            self._r1 = jari_orbit_awal
+            self._r2 = jari_orbit_akhir
+            self._delta_v = self._rasio = self._kurva = None
+            self._massa = self._biaya = self._indeks = self._hasil = None
+
+    def atur_massa_kosong(self, massa_kosong):
+        massa_kosong = float(massa_kosong)
+        if massa_kosong != self._massa_kosong:
+            self._massa_kosong = massa_kosong
+            if not self._linear():
+                self._rasio = self._kurva = None
+            self._massa = self._biaya = self._indeks = self._hasil = None
+
+    def atur_harga(self, harga, indeks=None):
+        """Ganti semua harga (F,), atau satu harga bila indeks diberikan."""
+        if indeks is None:
+            harga = np.asarray(harga, dtype=np.float64)
+            if harga.shape != self._harga.shape:
+                raise ValueError("panjang harga harus " + str(self._harga.shape[0]))
+            self._harga = harga.copy()
+        else:
+            self._harga[indeks] = harga
+        self._biaya = self._indeks = self._hasil = None
+
+    def atur_anggaran(self, anggaran):
+        anggaran = float(anggaran)
+        if anggaran != self._anggaran:
+            self._anggaran = anggaran
+            self._hasil = None
+
+    # ------------------------------------------------------
+    # Lapisan hasil antara (dihitung malas)
+    # ------------------------------------------------------
+
+    def _linear(self):
+        return self.mode != "tetap"
+
+    def _catat(self, jenis):
+        self.jumlah_hitung[jenis] += 1
+        if _ins.AKTIF:
+            _ins.tambah("whatif", jenis)
+
+    def _lapisan_delta_v(self):
+        if self._delta_v is None:
+            self._catat("delta_v")
+            _, deltaV1, deltaV2 = po.hitung_delta_v(self._r1, self._r2)
+            self._delta_v = (deltaV1, deltaV2)
+        return self._delta_v
+
+    def _lapisan_rasio(self):
+        if self._rasio is None:
+            deltaV1, deltaV2 = self._lapisan_delta_v()
+            self._catat("solver")
+            self._massa_acuan = 1.0 if self._linear() else self._massa_kosong
+            massa = po.selesaikan_bahan_bakar_batch(
+                np.array([deltaV1]), np.array([deltaV2]), self._kecepatan_buang,
+                [self._massa_acuan], self.mode).massa
+            po.terapkan_dorong_rendah(massa, [self._r1], [self._r2], self._kecepatan_buang,
+                                      [self._massa_acuan], self._spiral, self.mode)
+            self._rasio = massa[0] / self._massa_acuan
+        return self._rasio
+
+    def _lapisan_massa(self):
+        if self._massa is None:
+            rasio = self._lapisan_rasio()
+            self._catat("skala_massa")
+            self._massa = rasio * self._massa_kosong
+        return self._massa
+
+    def _lapisan_biaya(self):
+        if self._biaya is None:
+            massa = self._lapisan_massa()
+            self._catat("skala_biaya")
+            self._biaya = np.maximum(massa * self._harga, 0.0)
+        return self._biaya
+
+    def _lapisan_indeks(self):
+        if self._indeks is None:
+            biaya = self._lapisan_biaya()
+            self._catat("indeks")
+            self._indeks = kb.indeks_dari_biaya(biaya)
+        return self._indeks
+
+    def _lapisan_kurva(self):
+        # kurva massa bahan bakar (per massa_acuan) vs. radius, tanpa harga
+        if self._kurva is None:
+            self._lapisan_rasio()
+            self._catat("kurva")
+            self._kurva = po.buat_kurva_biaya(
+                self._r1, self._r2, self._massa_acuan,
+                isp=self._kecepatan_buang / po.gravitasi_bumi,
+                harga=np.ones_like(self._harga), mode=self.mode, dorong_rendah=self._spiral)
+        return self._kurva
+
+    def orbit_maks(self):
+        """R3 (F,) untuk anggaran sekarang, lewat kurva yang diskalakan.
+
+        biaya(R) = harga × massa_kosong / massa_acuan × kurva(R), jadi
+        anggaran cukup dibagi faktor itu per bahan bakar.
+        """
+        kurva = self._lapisan_kurva()
+        skala = self._harga * (self._massa_kosong / self._massa_acuan)
+        with np.errstate(divide="ignore"):
+            anggaran_kurva = self._anggaran / skala
+        return po.orbit_maks_dari_kurva(kurva, anggaran_kurva)
+
+    def hasil(self):
+        if self._hasil is None:
+            deltaV1, deltaV2 = self._lapisan_delta_v()
+            biaya = self._lapisan_biaya()
+            indeks = self._lapisan_indeks()
+            self._catat("saring")
+            daftar_mampu_beli = np.sort(kb.mampu_beli(indeks, self._anggaran)).tolist()
+            orbit_maks = None if daftar_mampu_beli else self.orbit_maks()
+            self._hasil = HasilWhatIf(deltaV1, deltaV2, self._massa, biaya,
+                                      daftar_mampu_beli, orbit_maks)
+        return self._hasil
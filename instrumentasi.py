@@ -0,0 +1,166 @@
+# ==========================================================
+# INSTRUMENTASI jalur panas (opsional)
+# Penghitung evaluasi/iterasi, jumlah batas loop yang tercapai tanpa
+# konvergen, residu terakhir & maksimum, dan histogram waktu per operasi.
+# Ekspor sebagai snapshot JSON atau file teks format Prometheus.
+#
+# Nonaktif secara bawaan. Pemanggil memeriksa `instrumentasi.AKTIF`
+# sebelum mengukur apa pun, sehingga biaya saat nonaktif hanya satu
+# pembacaan atribut per panggilan.
+#
+#   import instrumentasi
+#   instrumentasi.aktifkan()
+#   ...
+#   instrumentasi.tulis_json("metrik.json")
+#   instrumentasi.tulis_prometheus("metrik.prom")
+# ==========================================================
+
+import json
+import time
+from bisect import bisect_left
+
+AKTIF = False
+
+# Batas atas bucket histogram waktu (detik), gaya Prometheus (kumulatif)
+BUCKET_WAKTU = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0)
+
+_penghitung = {}      # (operasi, jenis) -> int
+_residu = {}          # operasi -> [terakhir, maksimum]
+_histogram = {}       # operasi -> [jumlah_per_bucket..., +Inf], total_detik
+
+
+def aktifkan():
+    global AKTIF
+    AKTIF = True
+
+
+def nonaktifkan():
+    global AKTIF
+    AKTIF = False
+
+
+def reset():
+    _penghitung.clear()
+    _residu.clear()
+    _histogram.clear()
+
+
+# ----------------------------------------------------------
+# Pencatatan (hanya dipanggil bila AKTIF)
+# ----------------------------------------------------------
+
+def tambah(operasi, jenis, jumlah=1):
+    """Tambah penghitung, mis. tambah("solver", "iterasi", 20)."""
+    kunci = (operasi, jenis)
+    _penghitung[kunci] = _penghitung.get(kunci, 0) + int(jumlah)
+
+
+def catat_residu(operasi, residu):
+    """Simpan residu terakhir dan maksimum untuk operasi."""
+    residu = float(residu)
+    lama = _residu.get(operasi)
+    if lama is None:
+        _residu[operasi] = [residu, residu]
+    else:
+        lama[0] = residu
+        if residu > lama[1] or lama[1] != lama[1]:
+            lama[1] = residu
+
+
+def catat_waktu(operasi, detik):
+    """Masukkan satu durasi (detik) ke histogram operasi."""
+    histogram = _histogram.get(operasi)
+    if histogram is None:
+        histogram = _histogram[operasi] = [[0] * (len(BUCKET_WAKTU) + 1), 0.0]
+    histogram[0][bisect_left(BUCKET_WAKTU, detik)] += 1
+    histogram[1] += detik
+
+
+def catat_solver(operasi, waktu_mulai, evaluasi, iterasi, batas_tercapai, residu):
+    """Pencatatan gabungan satu panggilan solver (skalar atau array)."""
+    catat_sejak(operasi, waktu_mulai)
+    tambah(operasi, "evaluasi", evaluasi)
+    tambah(operasi, "iterasi", iterasi)
+    tambah(operasi, "batas_tercapai", batas_tercapai)
+    catat_residu(operasi, residu)
+
+
+def mulai():
+    """Cap waktu awal untuk catat_sejak."""
+    return time.perf_counter()
+
+
+def catat_sejak(operasi, waktu_mulai):
+    catat_waktu(operasi, time.perf_counter() - waktu_mulai)
+
+
+# ----------------------------------------------------------
+# Ekspor
+# ----------------------------------------------------------
+
+def snapshot():
+    """Semua metrik sebagai dict yang siap di-dump ke JSON."""
+    operasi = {}
+    for (nama, jenis), nilai in _penghitung.items():
+        operasi.setdefault(nama, {}).setdefault("penghitung", {})[jenis] = nilai
+    for nama, (terakhir, maksimum) in _residu.items():
+        operasi.setdefault(nama, {})["residu"] = {"terakhir": terakhir, "maksimum": maksimum}
+    for nama, (bucket, total) in _histogram.items():
+        operasi.setdefault(nama, {})["waktu"] = {
+            "jumlah": sum(bucket),
+            "total_detik": total,
+            "bucket": {("+Inf" if i == len(BUCKET_WAKTU) else repr(BUCKET_WAKTU[i])): n
+                       for i, n in enumerate(bucket)},
+        }
+    return {"waktu_snapshot": time.time(), "aktif": AKTIF, "operasi": operasi}
+
+
+def _angka(nilai):
+    # Prometheus menulis tak hingga / NaN sebagai +Inf, -Inf, NaN
+    if nilai != nilai:
+        return "NaN"
+    if nilai in (float("inf"), float("-inf")):
+        return "+Inf" if nilai > 0 else "-Inf"
+    return repr(nilai)
+
+
+def teks_prometheus():
+    """Metrik dalam format teks eksposisi Prometheus."""
+    baris = []
+    jenis_terlihat = sorted({jenis for _, jenis in _penghitung})
+    for jenis in jenis_terlihat:
+        metrik = "orbit_" + jenis + "_total"
+        baris.append("# TYPE " + metrik + " counter")
+        for (nama, j), nilai in sorted(_penghitung.items()):
+            if j == jenis:
+                baris.append('%s{operasi="%s"} %d' % (metrik, nama, nilai))
+
+    if _residu:
+        for indeks, akhiran in ((0, "terakhir"), (1, "maksimum")):
+            metrik = "orbit_residu_" + akhiran
+            baris.append("# TYPE " + metrik + " gauge")
+            for nama, nilai in sorted(_residu.items()):
+                baris.append('%s{operasi="%s"} %s' % (metrik, nama, _angka(nilai[indeks])))
+
+    if _histogram:
+        baris.append("# TYPE orbit_waktu_detik histogram")
+        for nama, (bucket, total) in sorted(_histogram.items()):
+            kumulatif = 0
+            for i, n in enumerate(bucket):
+                kumulatif += n
+                le = "+Inf" if i == len(BUCKET_WAKTU) else repr(BUCKET_WAKTU[i])
+                baris.append('orbit_waktu_detik_bucket{operasi="%s",le="%s"} %d' % (nama, le, kumulatif))
+            baris.append('orbit_waktu_detik_sum{operasi="%s"} %s' % (nama, _angka(total)))
+            baris.append('orbit_waktu_detik_count{operasi="%s"} %d' % (nama, kumulatif))
+    return "\n".join(baris) + "\n"
+
+
+def tulis_json(jalur):
+    with open(jalur, "w", encoding="utf-8") as f:
+        json.dump(snapshot(), f, indent=2)
+        f.write("\n")
+
+
+def tulis_prometheus(jalur):
+    with open(jalur, "w", encoding="utf-8") as f:
+        f.write(teks_prometheus())
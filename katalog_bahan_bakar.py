@@ -0,0 +1,117 @@
+# ==========================================================
+# KATALOG BAHAN BAKAR (kolom/array, ribuan entri)
+# Pengganti tiga list paralel nama/isp/harga: satu katalog berbentuk
+# kolom NumPy dengan kecepatan buang yang sudah dihitung di muka.
+#   - muat_katalog      : baca CSV (nama, isp, harga[, pemasok, tingkat])
+#   - pangkas_pareto    : buang entri yang didominasi (lebih mahal DAN Isp
+#                         tidak lebih tinggi) — tidak pernah jadi pilihan
+#   - buat_indeks_biaya : biaya per skenario diurutkan sekali, sehingga
+#                         himpunan yang terjangkau untuk anggaran berapa
+#                         pun cukup dicari dengan bisect (dipakai
+#                         evaluasi_inkremental saat anggaran diubah-ubah)
+# Kolom indeks menyimpan nomor baris asli (0 = baris data pertama CSV),
+# jadi tetap benar setelah pilih / pangkas_pareto.
+# ==========================================================
+
+import csv
+from bisect import bisect_right
+from collections import namedtuple
+
+import numpy as np
+
+import perhitungan_orbit as po
+
+Katalog = namedtuple("Katalog", ["nama", "pemasok", "tingkat", "isp", "harga", "kecepatan_buang",
+                                 "indeks"])
+IndeksBiaya = namedtuple("IndeksBiaya", ["urutan", "biaya_terurut", "massa"])
+
+
+def buat_katalog(nama, isp, harga, pemasok=None, tingkat=None):
+    """Susun Katalog dari kolom-kolom; kecepatan buang dihitung sekali di sini."""
+    isp = np.asarray(isp, dtype=np.float64)
+    harga = np.asarray(harga, dtype=np.float64)
+    jumlah = isp.shape[0]
+    if harga.shape[0] != jumlah or len(nama) != jumlah:
+        raise ValueError("panjang kolom nama/isp/harga harus sama")
+    if jumlah and (isp.min() <= 0 or harga.min() < 0):
+        raise ValueError("isp harus > 0 dan harga tidak boleh negatif")
+    if pemasok is None:
+        pemasok = [""] * jumlah
+    if tingkat is None:
+        tingkat = [""] * jumlah
+    return Katalog(np.asarray(nama, dtype=str), np.asarray(pemasok, dtype=str),
+                   np.asarray(tingkat, dtype=str), isp, harga, isp * po.gravitasi_bumi,
+                   np.arange(jumlah))
+
+
+def katalog_bawaan():
+    """Tujuh bahan bakar bawaan perhitungan_orbit sebagai Katalog."""
+    return buat_katalog(po.nama_bahan_bakar, po.isp_bahan_bakar, po.harga_bahan_bakar)
+
+
+def muat_katalog(jalur):
+    """Baca katalog CSV berkolom nama, isp, harga, dan opsional pemasok, tingkat."""
+    nama, isp, harga, pemasok, tingkat = [], [], [], [], []
+    with open(jalur, newline="", encoding="utf-8") as f:
+        for nomor, record in enumerate(csv.DictReader(f), start=2):
+            try:
+                isp.append(float(record["isp"]))
+                harga.append(float(record["harga"]))
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(jalur + " baris " + str(nomor) + ": isp/harga harus angka")
+            nama.append(record.get("nama") or "")
+            pemasok.append(record.get("pemasok") or "")
+            tingkat.append(record.get("tingkat") or "")
+    return buat_katalog(nama, isp, harga, pemasok, tingkat)
+
+
+def pilih(katalog, indeks):
+    """Sub-katalog dengan baris indeks (array indeks atau mask boolean)."""
+    return Katalog(*(kolom[indeks] for kolom in katalog))
+
+
+def pangkas_pareto(katalog):
+    """Buang entri yang didominasi: ada entri lain dengan Isp >= dan harga <=.
+
+    Biaya = harga × massa bahan bakar dan massa turun bila Isp naik, jadi
+    entri yang didominasi tidak pernah termurah untuk skenario apa pun.
+    Entri kembar (Isp dan harga sama) disisakan satu. Urutan asli dipertahankan.
+    """
+    # urutkan Isp turun, lalu harga naik; entri lolos bila harganya lebih
+    # murah daripada semua entri ber-Isp lebih tinggi yang sudah dilihat
+    urutan = np.lexsort((katalog.harga, -katalog.isp))
+    harga_terurut = katalog.harga[urutan]
+    minimum_sebelumnya = np.minimum.accumulate(np.concatenate(([np.inf], harga_terurut[:-1])))
+    lolos = harga_terurut < minimum_sebelumnya
+    return pilih(katalog, np.sort(urutan[lolos]))
+
+
+def buat_indeks_biaya(katalog, jari_orbit_awal, jari_orbit_akhir, massa_kosong, mode=None,
+                      dorong_rendah=None):
+    """Hitung biaya semua entri untuk satu skenario lalu urutkan sekali (O(F log F)).
+
+    dorong_rendah seperti po.hitung_batch (bawaan po.kolom_dorong_rendah(katalog.isp)).
+    """
+    _, deltaV1, deltaV2 = po.hitung_delta_v_batch([jari_orbit_awal], [jari_orbit_akhir])
+    massa = po.selesaikan_bahan_bakar_batch(deltaV1, deltaV2, katalog.kecepatan_buang,
+                                            [massa_kosong], mode).massa
+    po.terapkan_dorong_rendah(massa, [jari_orbit_awal], [jari_orbit_akhir], katalog.kecepatan_buang,
+                              [massa_kosong], po.mask_dorong_rendah(katalog.isp, dorong_rendah), mode)
+    return indeks_dari_biaya(po.hitung_biaya_batch(massa[0], katalog.harga), massa[0])
+
+
+def indeks_dari_biaya(biaya, massa=None):
+    """IndeksBiaya dari biaya (F,) yang sudah dihitung (O(F log F))."""
+    biaya = np.asarray(biaya, dtype=np.float64)
+    urutan = np.argsort(biaya, kind="stable")
+    return IndeksBiaya(urutan, biaya[urutan].tolist(), massa)
+
+
+def mampu_beli(indeks_biaya, anggaran):
+    """Posisi entri yang terjangkau anggaran, termurah lebih dulu (O(log F)).
+
+    Satu indeks hanya menguntungkan bila dipakai untuk banyak anggaran;
+    untuk satu anggaran per skenario (mode_batch) mask biaya <= anggaran
+    yang O(F) lebih murah daripada mengurutkan.
+    """
+    return indeks_biaya.urutan[:bisect_right(indeks_biaya.biaya_terurut, anggaran)]
@@ -0,0 +1,321 @@
+# ==========================================================
+# LAYANAN KUTIPAN (asyncio, HTTP/JSON di localhost)
+# Menerima permintaan (R1, R2, massa_kosong, anggaran), mengumpulkan
+# permintaan yang datang bersamaan menjadi micro-batch kecil (dibatasi
+# waktu dan ukuran), lalu menghitung satu batch dengan satu pass vektor
+# (mode_batch.proses_chunk). Antrian dibatasi; bila penuh permintaan
+# langsung ditolak dengan 503 (backpressure) agar latensi ekor terjaga.
+# Batch dihitung di satu thread pekerja (NumPy, bisection R3, SQLite
+# --cache), jadi event loop tetap menerima dan membaca permintaan selama
+# batch berjalan atau menunggu kunci tulis cache.
+#
+# Contoh:
+#   python layanan_kutipan.py --port 8765 --jendela-ms 2 --batch-maks 256
+#   curl -s localhost:8765/kutipan -d '{"R1": 6771000, "R2": 42164000,
+#        "massa_kosong": 22800, "anggaran": 1000000}'
+#
+# Endpoint:
+#   POST /kutipan  body JSON satu skenario -> JSON hasil (format mode_batch)
+#   GET  /sehat    -> status & statistik batch (dan cache bila --cache)
+#   GET  /metrik   -> metrik instrumentasi format Prometheus (--metrik)
+#
+# Seperti mode_batch, bahan bakar listrik dikutip dengan ΔV spiral
+# Edelbaum (--tanpa-dorong-rendah: Hohmann); --gaya-dorong menambahkan
+# waktu transfernya.
+# ==========================================================
+
+import argparse
+import asyncio
+import functools
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cache_kutipan
+import instrumentasi
+import mode_batch
+
+JENDELA_BATCH = 0.002      # detik menunggu permintaan lain sebelum batch dihitung
+UKURAN_BATCH_MAKS = 256
+BATAS_ANTRIAN = 4096
+UKURAN_BODY_MAKS = 64 * 1024
+
+STATUS_HTTP = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class AntrianPenuh(Exception):
+    """Antrian micro-batch sudah mencapai batas_antrian."""
+
+
+class PenggabungBatch:
+    """Kumpulkan permintaan bersamaan lalu hitung sebagai satu batch.
+
+    Batch ditutup saat ukuran_maks tercapai atau jendela (detik) sejak
+    permintaan pertama dalam batch habis, mana yang lebih dulu. Semua yang
+    menyentuh cache / instrumentasi berjalan lewat jalankan(), di satu
+    thread pekerja, sehingga tidak pernah bersamaan.
+    """
+
+    def __init__(self, jendela=JENDELA_BATCH, ukuran_maks=UKURAN_BATCH_MAKS,
+                 batas_antrian=BATAS_ANTRIAN, cache=None, dorong_rendah=True, gaya_dorong=None):
+        self.jendela = jendela
+        self.cache = cache
+        self.dorong_rendah = dorong_rendah
+        self.gaya_dorong = gaya_dorong
+        self.ukuran_maks = ukuran_maks
+        self.antrian = asyncio.Queue(maxsize=batas_antrian)
+        self.jumlah_batch = 0
+        self.jumlah_permintaan = 0
+        self.jumlah_ditolak = 0
+        self._tugas = None
+        self._pekerja = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kutipan")
+
+    def mulai(self):
+        if self._pekerja is None:
+            self._pekerja = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kutipan")
+        self._tugas = asyncio.get_running_loop().create_task(self._loop())
+
+    async def berhenti(self):
+        if self._tugas is not None:
+            self._tugas.cancel()
+            try:
+                await self._tugas
+            except asyncio.CancelledError:
+                pass
+            self._tugas = None
+        if self._pekerja is not None:
+            # tunggu batch yang masih dihitung selesai (mis. sebelum cache ditutup)
+            await asyncio.get_running_loop().run_in_executor(None, self._pekerja.shutdown)
+            self._pekerja = None
+
+    def jalankan(self, fungsi, *args, **kwargs):
+        """Jalankan fungsi(*args, **kwargs) di thread pekerja; kembalikan awaitable."""
+        return asyncio.get_running_loop().run_in_executor(
+            self._pekerja, functools.partial(fungsi, *args, **kwargs))
+
+    async def kutip(self, record):
+        """Masukkan satu record ke antrian dan tunggu hasilnya (dict)."""
+        masa_depan = asyncio.get_running_loop().create_future()
+        try:
+            self.antrian.put_nowait((record, masa_depan))
+        except asyncio.QueueFull:
+            self.jumlah_ditolak += 1
+            raise AntrianPenuh()
+        return await masa_depan
+
+    async def _loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.antrian.get()]
+            batas_waktu = loop.time() + self.jendela
+            while len(batch) < self.ukuran_maks:
+                # ambil semua yang sudah menunggu tanpa tidur dulu
+                try:
+                    batch.append(self.antrian.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                sisa = batas_waktu - loop.time()
+                if sisa <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.antrian.get(), sisa))
+                except asyncio.TimeoutError:
+                    break
+            await self._hitung(batch)
+
+    async def _hitung(self, batch):
+        self.jumlah_batch += 1
+        self.jumlah_permintaan += len(batch)
+        try:
+            hasil = await self.jalankan(mode_batch.proses_chunk, [record for record, _ in batch], 1,
+                                        cache=self.cache, dorong_rendah=self.dorong_rendah,
+                                        gaya_dorong=self.gaya_dorong)
+        except Exception as galat:  # jangan biarkan loop batch mati
+            for _, masa_depan in batch:
+                if not masa_depan.done():
+                    masa_depan.set_exception(galat)
+            return
+        for (_, masa_depan), h in zip(batch, hasil):
+            if not masa_depan.done():
+                del h["baris"]
+                masa_depan.set_result(h)
+
+    def statistik(self):
+        rata_rata = self.jumlah_permintaan / self.jumlah_batch if self.jumlah_batch else 0.0
+        statistik = {
+            "jumlah_batch": self.jumlah_batch,
+            "jumlah_permintaan": self.jumlah_permintaan,
+            "jumlah_ditolak": self.jumlah_ditolak,
+            "rata_rata_ukuran_batch": rata_rata,
+            "panjang_antrian": self.antrian.qsize(),
+        }
+        if self.cache is not None:
+            statistik["cache"] = self.cache.statistik()
+        return statistik
+
+
+# ----------------------------------------------------------
+# HTTP/1.1 minimal (keep-alive, Content-Length)
+# ----------------------------------------------------------
+
+def _respons(status, isi, tetap_hidup=True):
+    if isinstance(isi, str):
+        badan = isi.encode("utf-8")
+        jenis = "text/plain; version=0.0.4"
+    else:
+        badan = json.dumps(isi).encode("utf-8")
+        jenis = "application/json"
+    kepala = ("HTTP/1.1 %d %s\r\nContent-Type: %s\r\nContent-Length: %d\r\n"
+              "Connection: %s\r\n\r\n" % (status, STATUS_HTTP[status], jenis, len(badan),
+                                           "keep-alive" if tetap_hidup else "close"))
+    return kepala.encode("ascii") + badan
+
+
+async def _layani_koneksi(penggabung, pembaca, penulis):
+    try:
+        while True:
+            baris_awal = await pembaca.readline()
+            if not baris_awal:
+                break
+            try:
+                metode, jalur, versi = baris_awal.decode("latin-1").split()
+            except ValueError:
+                penulis.write(_respons(400, {"galat": "baris permintaan tidak valid"}, False))
+                break
+
+            kepala = {}
+            while True:
+                baris = await pembaca.readline()
+                if baris in (b"\r\n", b"\n", b""):
+                    break
+                nama, _, nilai = baris.decode("latin-1").partition(":")
+                kepala[nama.strip().lower()] = nilai.strip()
+            tetap_hidup = kepala.get("connection", "").lower() != "close" and versi == "HTTP/1.1"
+
+            try:
+                panjang = int(kepala.get("content-length", "0") or 0)
+            except ValueError:
+                panjang = -1
+            if panjang < 0:
+                penulis.write(_respons(400, {"galat": "Content-Length tidak valid"}, False))
+                break
+            if panjang > UKURAN_BODY_MAKS:
+                penulis.write(_respons(413, {"galat": "body terlalu besar"}, False))
+                break
+            badan = await pembaca.readexactly(panjang) if panjang else b""
+
+            status, isi = await _tangani(penggabung, metode, jalur, badan)
+            penulis.write(_respons(status, isi, tetap_hidup))
+            await penulis.drain()
+            if not tetap_hidup:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        penulis.close()
+
+
+async def _tangani(penggabung, metode, jalur, badan):
+    if jalur == "/sehat":
+        # statistik cache membaca SQLite: di thread pekerja, seperti batch
+        return 200, dict(status="ok", **await penggabung.jalankan(penggabung.statistik))
+    if jalur == "/metrik":
+        if not instrumentasi.AKTIF:
+            return 404, {"galat": "instrumentasi nonaktif (jalankan dengan --metrik)"}
+        return 200, await penggabung.jalankan(instrumentasi.teks_prometheus)
+    if jalur != "/kutipan":
+        return 404, {"galat": "jalur tidak dikenal: " + jalur}
+    if metode != "POST":
+        return 405, {"galat": "gunakan POST"}
+    try:
+        record = json.loads(badan)
+        if not isinstance(record, dict):
+            raise ValueError("body harus objek JSON")
+    except ValueError as galat:
+        return 400, {"galat": "JSON tidak valid: " + str(galat)}
+    try:
+        hasil = await penggabung.kutip(record)
+    except AntrianPenuh:
+        return 503, {"galat": "antrian penuh, coba lagi"}
+    except Exception as galat:  # _hitung gagal untuk seluruh batch
+        return 500, {"galat": "gagal menghitung kutipan: " + str(galat)}
+    if "galat" in hasil:
+        return 400, hasil
+    return 200, hasil
+
+
+async def mulai_layanan(host="127.0.0.1", port=8765, jendela=JENDELA_BATCH,
+                        ukuran_maks=UKURAN_BATCH_MAKS, batas_antrian=BATAS_ANTRIAN, cache=None,
+                        dorong_rendah=True, gaya_dorong=None):
+    """Jalankan server; kembalikan (server, penggabung). port=0 memilih port bebas."""
+    penggabung = PenggabungBatch(jendela, ukuran_maks, batas_antrian, cache, dorong_rendah, gaya_dorong)
+    penggabung.mulai()
+    server = await asyncio.start_server(
+        lambda r, w: _layani_koneksi(penggabung, r, w), host, port)
+    return server, penggabung
+
+
+async def _utama(args):
+    cache = None
+    if args.cache:
+        cache = cache_kutipan.CacheKutipan(args.cache, args.cache_kapasitas)
+    server, penggabung = await mulai_layanan(args.host, args.port, args.jendela_ms / 1000.0,
+                                             args.batch_maks, args.batas_antrian, cache,
+                                             not args.tanpa_dorong_rendah, args.gaya_dorong)
+    alamat = server.sockets[0].getsockname()
+    print("Layanan kutipan berjalan di http://%s:%d (mulai %s)"
+          % (alamat[0], alamat[1], time.strftime("%H:%M:%S")), flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await penggabung.berhenti()
+        if cache is not None:
+            cache.tutup()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan kutipan biaya perpindahan orbit")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--jendela-ms", type=float, default=JENDELA_BATCH * 1000.0,
+                        help="jendela micro-batch (ms)")
+    parser.add_argument("--batch-maks", type=int, default=UKURAN_BATCH_MAKS)
+    parser.add_argument("--batas-antrian", type=int, default=BATAS_ANTRIAN)
+    parser.add_argument("--cache", metavar="BERKAS",
+                        help="cache kutipan SQLite (massa & R3); kunci dibulatkan ke 1 m / 1 g / "
+                             "0.001 s Isp, jadi massa bisa berbeda ~1e-6 relatif dan R3 hingga "
+                             "~100 m dari hasil tanpa cache (R3 tetap diperiksa ulang agar terjangkau "
+                             "untuk masukan mentah)")
+    parser.add_argument("--cache-kapasitas", type=int, default=cache_kutipan.KAPASITAS)
+    parser.add_argument("--tanpa-dorong-rendah", action="store_true",
+                        help="kutip juga bahan bakar listrik dengan ΔV Hohmann, bukan spiral Edelbaum")
+    parser.add_argument("--gaya-dorong", type=float, metavar="N",
+                        help="gaya dorong mesin listrik (N) untuk waktu_transfer")
+    parser.add_argument("--metrik", action="store_true", help="aktifkan instrumentasi & GET /metrik")
+    args = parser.parse_args(argv)
+    if args.gaya_dorong is not None and not args.gaya_dorong > 0:
+        parser.error("--gaya-dorong harus lebih besar dari 0")
+    if args.gaya_dorong is not None and args.tanpa_dorong_rendah:
+        parser.error("--gaya-dorong tidak bisa dipakai bersama --tanpa-dorong-rendah")
+    if args.metrik:
+        instrumentasi.aktifkan()
+    try:
+        asyncio.run(_utama(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
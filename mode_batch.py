@@ -0,0 +1,331 @@
+# ==========================================================
+# MODE BATCH (non-interaktif)
+# Membaca skenario dari file / stdin (CSV atau JSON Lines), menjalankan
+# validasi yang sama dengan skrip interaktif, lalu menulis satu hasil
+# JSON per baris. Diproses per chunk lewat generator sehingga memori tetap
+# datar walau file berisi jutaan baris.
+#
+# Contoh:
+#   python mode_batch.py skenario.csv -o hasil.jsonl
+#   cat skenario.jsonl | python mode_batch.py - --format jsonl
+#
+# Kolom yang dibaca (nama alternatif dalam kurung):
+#   jari_orbit_awal (R1), jari_orbit_akhir (R2), massa_kosong, anggaran
+#
+# Dengan --katalog, larik per bahan bakar mengikuti katalog setelah
+# pangkas Pareto; indeks_bahan_bakar memberi nomor baris CSV asli (0 =
+# baris data pertama) untuk tiap kolom, dan daftar_mampu_beli juga berisi
+# nomor baris CSV asli.
+#
+# Bahan bakar ber-Isp >= po.ISP_DORONG_RENDAH (mesin ion/Hall) dihitung
+# dengan ΔV spiral Edelbaum |v(R1) - v(R2)| alih-alih Hohmann, untuk massa,
+# biaya, keterjangkauan, dan R3; hasil memuat deltaV_dorong_rendah.
+# --tanpa-dorong-rendah mengembalikan semua bahan bakar ke Hohmann.
+# --gaya-dorong N menambahkan waktu_transfer (detik) untuk bahan bakar itu:
+# massa bahan bakar × ve / gaya (laju massa tetap). Propagasi penuh ada di
+# dorong_rendah.py, terlalu lambat untuk mode batch.
+# ==========================================================
+
+import argparse
+import csv
+import functools
+import json
+import math
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+import cache_kutipan
+import instrumentasi
+import katalog_bahan_bakar as kb
+import perhitungan_orbit as po
+
+UKURAN_CHUNK = 4096
+
+KOLOM = {
+    "jari_orbit_awal": ("jari_orbit_awal", "R1"),
+    "jari_orbit_akhir": ("jari_orbit_akhir", "R2"),
+    "massa_kosong": ("massa_kosong",),
+    "anggaran": ("anggaran",),
+}
+
+# baris masukan yang bahkan tidak bisa di-parse; validasi_record menolaknya
+# dengan pesan ini sehingga tetap keluar sebagai satu baris galat
+RecordRusak = namedtuple("RecordRusak", ["pesan"])
+
+
+# ----------------------------------------------------------
+# Tahap 1: baca record
+# ----------------------------------------------------------
+
+def tebak_format(nama_file, baris_pertama):
+    """'csv' atau 'jsonl' berdasarkan ekstensi file, lalu isi baris pertama."""
+    if nama_file.endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    if nama_file.endswith(".csv"):
+        return "csv"
+    return "jsonl" if baris_pertama.lstrip().startswith("{") else "csv"
+
+
+def baca_record(berkas, format_masukan):
+    """Generator dict mentah (nilai masih string/angka apa adanya) dari berkas teks.
+
+    Baris JSONL yang rusak menghasilkan RecordRusak, bukan exception, agar
+    satu baris buruk tidak menghentikan seluruh run.
+    """
+    if format_masukan == "csv":
+        for record in csv.DictReader(berkas):
+            yield record
+    else:
+        for baris in berkas:
+            if baris.strip():
+                try:
+                    yield json.loads(baris)
+                except ValueError as galat:
+                    yield RecordRusak("JSON tidak valid: " + str(galat))
+
+
+# ----------------------------------------------------------
+# Tahap 2: validasi (aturan sama dengan input interaktif)
+# ----------------------------------------------------------
+
+def _ambil(record, kunci):
+    for nama in KOLOM[kunci]:
+        if nama in record and record[nama] not in (None, ""):
+            return record[nama]
+    raise ValueError("kolom " + kunci + " tidak ada")
+
+
+def validasi_record(record):
+    """Kembalikan (R1, R2, massa_kosong, anggaran) atau lempar ValueError berpesan."""
+    if isinstance(record, RecordRusak):
+        raise ValueError(record.pesan)
+    if not isinstance(record, dict):
+        raise ValueError("record harus objek JSON, bukan " + type(record).__name__)
+    nilai = []
+    for kunci in KOLOM:
+        mentah = _ambil(record, kunci)
+        try:
+            angka = float(mentah)
+        except (TypeError, ValueError):
+            raise ValueError(kunci + " harus angka numerik, bukan " + repr(mentah))
+        if not math.isfinite(angka):
+            # inf/nan lolos "> 0" lalu keluar sebagai Infinity/NaN (JSON tidak valid)
+            raise ValueError(kunci + " harus angka berhingga, bukan " + repr(mentah))
+        if not angka > 0:
+            raise ValueError(kunci + " harus lebih besar dari 0")
+        nilai.append(angka)
+
+    jari_orbit_awal, jari_orbit_akhir, massa_kosong, anggaran = nilai
+    for nama, r in (("R1", jari_orbit_awal), ("R2", jari_orbit_akhir)):
+        if r < po.RADIUS_BUMI:
+            raise ValueError(nama + " tidak boleh lebih kecil dari radius Bumi (" + str(po.RADIUS_BUMI) + " m)")
+        if r > po.RADIUS_ATAS_MAX:
+            raise ValueError(nama + " terlalu besar (maks " + str(po.RADIUS_ATAS_MAX) + " m)")
+    return jari_orbit_awal, jari_orbit_akhir, massa_kosong, anggaran
+
+
+# ----------------------------------------------------------
+# Tahap 3: proses per chunk
+# ----------------------------------------------------------
+
+def potong(iterable, ukuran):
+    """Kelompokkan iterable menjadi list berukuran <= ukuran."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= ukuran:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def proses_chunk(chunk, nomor_awal, katalog=None, cache=None, dorong_rendah=True, gaya_dorong=None):
+    """Hitung satu chunk record mentah; hasilkan dict hasil sesuai urutan masukan.
+
+    katalog       : Katalog bahan bakar (bawaan: tujuh bahan bakar perhitungan_orbit);
+                    daftar_mampu_beli berisi katalog.indeks (baris asli, sebelum
+                    pangkas_pareto) dan hasil memuat indeks_bahan_bakar.
+    cache         : CacheKutipan opsional untuk massa bahan bakar dan R3.
+    dorong_rendah : ΔV spiral Edelbaum untuk bahan bakar po.kolom_dorong_rendah;
+                    False = semua Hohmann
+    gaya_dorong   : gaya dorong (N) untuk waktu_transfer bahan bakar itu
+
+    Keterjangkauan disaring dengan mask po.mampu_beli_batch, bukan
+    kb.mampu_beli: tiap skenario hanya punya satu anggaran, jadi indeks
+    terurut (O(F log F)) lebih mahal daripada mask (O(F)).
+    """
+    katalog_khusus = katalog is not None
+    if not katalog_khusus:
+        katalog = _katalog_bawaan()
+    spiral = po.mask_dorong_rendah(katalog.isp, None if dorong_rendah else False)
+    ada_spiral = bool(spiral.any())
+    hasil = [None] * len(chunk)
+    skenario = []
+    posisi = []
+    for k, record in enumerate(chunk):
+        try:
+            skenario.append(validasi_record(record))
+            posisi.append(k)
+        except ValueError as galat:
+            hasil[k] = {"baris": nomor_awal + k, "galat": str(galat)}
+
+    if skenario:
+        data = np.array(skenario, dtype=np.float64)
+        r1, r2, mk, anggaran = data[:, 0], data[:, 1], data[:, 2], data[:, 3]
+        _, deltaV1, deltaV2 = po.hitung_delta_v_batch(r1, r2)
+        if cache is None:
+            massa = po.selesaikan_bahan_bakar_batch(deltaV1, deltaV2, katalog.kecepatan_buang, mk).massa
+            po.terapkan_dorong_rendah(massa, r1, r2, katalog.kecepatan_buang, mk, spiral)
+        else:
+            massa = cache.massa_batch(r1, r2, mk, katalog.isp, spiral)
+        biaya = po.hitung_biaya_batch(massa, katalog.harga)
+        mampu = po.mampu_beli_batch(biaya, anggaran)
+
+        # R3 hanya untuk skenario tanpa bahan bakar terjangkau, sekaligus satu pass
+        tidak_mampu = np.nonzero(~mampu.any(axis=1))[0]
+        orbit_maks_chunk = {}
+        if tidak_mampu.size:
+            cari = po.cari_orbit_maks_batch if cache is None else cache.orbit_maks_batch
+            r3 = cari(r1[tidak_mampu], r2[tidak_mampu], mk[tidak_mampu], anggaran[tidak_mampu],
+                      katalog.isp, katalog.harga, dorong_rendah=spiral)
+            orbit_maks_chunk = dict(zip(tidak_mampu.tolist(), r3.tolist()))
+
+        if ada_spiral:
+            deltaV_spiral = po.hitung_delta_v_edelbaum_batch(r1, r2)
+            if gaya_dorong is not None:
+                # laju massa tetap gaya / ve: waktu = massa bahan bakar × ve / gaya
+                waktu = np.where(spiral, massa * katalog.kecepatan_buang / gaya_dorong, np.nan)
+
+        for n, k in enumerate(posisi):
+            daftar_mampu_beli = katalog.indeks[mampu[n]].tolist()
+            orbit_maks = orbit_maks_chunk.get(n)
+            hasil[k] = {
+                "baris": nomor_awal + k,
+                "jari_orbit_awal": r1[n],
+                "jari_orbit_akhir": r2[n],
+                "massa_kosong": mk[n],
+                "anggaran": anggaran[n],
+                "deltaV1": deltaV1[n],
+                "deltaV2": deltaV2[n],
+                "massa_bahan_bakar": massa[n].tolist(),
+                "biaya_bahan_bakar": biaya[n].tolist(),
+                "daftar_mampu_beli": daftar_mampu_beli,
+                "orbit_maks": orbit_maks,
+            }
+            if katalog_khusus:
+                hasil[k]["indeks_bahan_bakar"] = katalog.indeks.tolist()
+            if ada_spiral:
+                hasil[k]["deltaV_dorong_rendah"] = deltaV_spiral[n]
+                if gaya_dorong is not None:
+                    hasil[k]["waktu_transfer"] = [None if np.isnan(w) else w for w in waktu[n].tolist()]
+    return hasil
+
+
+@functools.lru_cache(maxsize=None)
+def _katalog_bawaan():
+    # dibuat sekali per proses; proses_chunk dipanggil per chunk / per batch layanan
+    return kb.katalog_bawaan()
+
+
+def jalankan_batch(records, ukuran_chunk=UKURAN_CHUNK, katalog=None, cache=None,
+                   dorong_rendah=True, gaya_dorong=None):
+    """Pipeline generator: record mentah -> dict hasil, satu per record."""
+    nomor = 1
+    for chunk in potong(records, ukuran_chunk):
+        for hasil in proses_chunk(chunk, nomor, katalog, cache, dorong_rendah, gaya_dorong):
+            yield hasil
+        nomor += len(chunk)
+
+
+def _ke_json(nilai):
+    # skalar NumPy selain float64 (mis. int64, bool_) tidak dikenal modul json
+    if isinstance(nilai, np.generic):
+        return nilai.item()
+    raise TypeError(repr(nilai))
+
+
+def _sambung(baris_pertama, berkas):
+    # kembalikan baris yang sudah dibaca untuk menebak format ke depan aliran
+    if baris_pertama:
+        yield baris_pertama
+    for baris in berkas:
+        yield baris
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mode batch simulasi perpindahan orbit roket")
+    parser.add_argument("masukan", nargs="?", default="-", help="file CSV/JSONL, '-' untuk stdin")
+    parser.add_argument("-o", "--keluaran", default="-", help="file JSONL hasil, '-' untuk stdout")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="format masukan (bawaan: ditebak)")
+    parser.add_argument("--ukuran-chunk", type=int, default=UKURAN_CHUNK)
+    parser.add_argument("--katalog", help="katalog bahan bakar CSV (nama, isp, harga[, pemasok, tingkat])")
+    parser.add_argument("--tanpa-pareto", action="store_true",
+                        help="jangan buang entri katalog yang didominasi")
+    parser.add_argument("--cache", metavar="BERKAS",
+                        help="cache kutipan SQLite (massa & R3) yang dipakai ulang antar-run; kunci "
+                             "dibulatkan ke 1 m / 1 g / 0.001 s Isp, jadi massa bisa berbeda ~1e-6 "
+                             "relatif dan R3 hingga ~100 m dari hasil tanpa cache (R3 tetap diperiksa "
+                             "ulang agar terjangkau untuk masukan mentah)")
+    parser.add_argument("--cache-kapasitas", type=int, default=cache_kutipan.KAPASITAS,
+                        help="entri maksimum per tabel cache (LRU)")
+    parser.add_argument("--tanpa-dorong-rendah", action="store_true",
+                        help="hitung juga bahan bakar listrik (Isp >= %g s) dengan ΔV Hohmann, "
+                             "bukan spiral Edelbaum" % po.ISP_DORONG_RENDAH)
+    parser.add_argument("--gaya-dorong", type=float, metavar="N",
+                        help="gaya dorong mesin listrik (N); tambahkan waktu_transfer")
+    parser.add_argument("--metrik", metavar="AWALAN",
+                        help="aktifkan instrumentasi; tulis AWALAN.json dan AWALAN.prom di akhir")
+    args = parser.parse_args(argv)
+    if args.gaya_dorong is not None and not args.gaya_dorong > 0:
+        parser.error("--gaya-dorong harus lebih besar dari 0")
+    if args.gaya_dorong is not None and args.tanpa_dorong_rendah:
+        parser.error("--gaya-dorong tidak bisa dipakai bersama --tanpa-dorong-rendah")
+
+    if args.metrik:
+        instrumentasi.aktifkan()
+
+    katalog = None
+    if args.katalog:
+        katalog = kb.muat_katalog(args.katalog)
+        if not args.tanpa_pareto:
+            katalog = kb.pangkas_pareto(katalog)
+
+    cache = None
+    if args.cache:
+        cache = cache_kutipan.CacheKutipan(args.cache, args.cache_kapasitas)
+
+    berkas_masuk = sys.stdin if args.masukan == "-" else open(args.masukan, newline="", encoding="utf-8")
+    berkas_keluar = sys.stdout if args.keluaran == "-" else open(args.keluaran, "w", encoding="utf-8")
+    try:
+        format_masukan = args.format
+        if format_masukan is None:
+            baris_pertama = berkas_masuk.readline()
+            format_masukan = tebak_format(args.masukan, baris_pertama)
+            sumber = _sambung(baris_pertama, berkas_masuk)
+        else:
+            sumber = berkas_masuk
+
+        jumlah_galat = 0
+        for hasil in jalankan_batch(baca_record(sumber, format_masukan), args.ukuran_chunk,
+                                     katalog, cache, not args.tanpa_dorong_rendah, args.gaya_dorong):
+            if "galat" in hasil:
+                jumlah_galat += 1
+            berkas_keluar.write(json.dumps(hasil, default=_ke_json) + "\n")
+    finally:
+        if berkas_masuk is not sys.stdin:
+            berkas_masuk.close()
+        if berkas_keluar is not sys.stdout:
+            berkas_keluar.close()
+        if cache is not None:
+            cache.tutup()
+        if args.metrik:
+            instrumentasi.tulis_json(args.metrik + ".json")
+            instrumentasi.tulis_prometheus(args.metrik + ".prom")
+    return 1 if jumlah_galat else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+# ==========================================================
+# MONTE CARLO KETIDAKPASTIAN BIAYA
+# Isp, harga, massa kosong, dan radius orbit diambil dari sebaran yang
+# ditentukan pengguna, lalu dievaluasi per batch vektor lewat model
+# bahan bakar/biaya yang sama (perhitungan_orbit.biaya_ke_orbit).
+#
+# Kuantil biaya (P50/P90/P99) diperkirakan dengan sketsa kuantil
+# berbucket logaritmik (gaya DDSketch): memori tetap berapa pun jumlah
+# sampelnya, dan nilai kuantil yang dilaporkan punya galat relatif
+# <= akurasi. Peluang biaya <= anggaran dihitung persis (penghitung).
+#
+# Hasil dapat diulang dari seed: batch ke-k memakai anak ke-k dari
+# SeedSequence(seed), jadi (seed, ukuran_batch) yang sama memberi hasil
+# yang sama persis.
+#
+# Spesifikasi sebaran (CLI & buat_sebaran):
+#   3000                     tetap
+#   seragam:a:b              uniform [a, b)
+#   normal:rata:sd
+#   lognormal:median:sigma   sigma dari ln(x)
+#   segitiga:min:modus:maks
+#
+# Contoh:
+#   python monte_carlo.py --r1 6771000 --r2 normal:42164000:5000 \
+#       --massa seragam:20000:25000 --isp 6=normal:3000:150 \
+#       --harga 6=lognormal:20000:0.3 --anggaran 1e6 --sampel 1e7 --seed 42
+# ==========================================================
+
+import argparse
+import json
+import math
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+import perhitungan_orbit as po
+
+UKURAN_BATCH = 262_144
+AKURASI_SKETSA = 0.005            # galat relatif kuantil
+NILAI_MIN_SKETSA = 1e-2           # $; biaya di bawahnya dianggap 0
+NILAI_MAKS_SKETSA = 1e18          # $; biaya di atasnya dianggap tak hingga
+KUANTIL = (0.5, 0.9, 0.99)
+
+Sebaran = namedtuple("Sebaran", ["jenis", "parameter"])
+
+_JUMLAH_PARAMETER = {"tetap": 1, "seragam": 2, "normal": 2, "lognormal": 2, "segitiga": 3}
+
+
+def buat_sebaran(spesifikasi):
+    """'normal:3000:150' (lihat kepala modul) -> Sebaran; angka saja = tetap."""
+    if isinstance(spesifikasi, (int, float)):
+        return Sebaran("tetap", (float(spesifikasi),))
+    bagian = str(spesifikasi).split(":")
+    if len(bagian) == 1:
+        bagian = ["tetap"] + bagian
+    jenis = bagian[0]
+    if jenis not in _JUMLAH_PARAMETER:
+        raise ValueError("jenis sebaran tidak dikenal: " + jenis)
+    if len(bagian) - 1 != _JUMLAH_PARAMETER[jenis]:
+        raise ValueError("sebaran " + jenis + " butuh " + str(_JUMLAH_PARAMETER[jenis]) + " parameter")
+    try:
+        parameter = tuple(float(p) for p in bagian[1:])
+    except ValueError:
+        raise ValueError("parameter sebaran harus angka: " + str(spesifikasi))
+    return Sebaran(jenis, parameter)
+
+
+def tarik(sebaran, rng, ukuran):
+    """Sampel sebaran sebagai array float64 berbentuk ukuran."""
+    p = sebaran.parameter
+    if sebaran.jenis == "tetap":
+        return np.full(ukuran, p[0])
+    if sebaran.jenis == "seragam":
+        return rng.uniform(p[0], p[1], ukuran)
+    if sebaran.jenis == "normal":
+        return rng.normal(p[0], p[1], ukuran)
+    if sebaran.jenis == "lognormal":
+        return rng.lognormal(math.log(p[0]), p[1], ukuran)
+    return rng.triangular(p[0], p[1], p[2], ukuran)
+
+
+# ----------------------------------------------------------
+# Sketsa kuantil (memori tetap, galat relatif terbatas)
+# ----------------------------------------------------------
+
+class SketsaKuantil:
+    """Histogram bucket logaritmik untuk beberapa seri sekaligus.
+
+    Bucket i menampung nilai di (γ^(i-1), γ^i] dengan γ = (1+a)/(1-a);
+    perwakilannya 2γ^i/(γ+1) sehingga galat relatif <= a = akurasi.
+    Nilai <= nilai_min masuk bucket nol (dilaporkan 0), nilai > nilai_maks
+    (termasuk inf) masuk bucket tak hingga. Dua sketsa berparameter sama
+    dapat digabung dengan gabung().
+    """
+
+    def __init__(self, jumlah_seri, akurasi=AKURASI_SKETSA, nilai_min=NILAI_MIN_SKETSA,
+                 nilai_maks=NILAI_MAKS_SKETSA):
+        self.akurasi = akurasi
+        self.gamma = (1 + akurasi) / (1 - akurasi)
+        self._ln_gamma = math.log(self.gamma)
+        self.nilai_min = nilai_min
+        self._indeks_min = math.ceil(math.log(nilai_min) / self._ln_gamma)
+        self._indeks_maks = math.ceil(math.log(nilai_maks) / self._ln_gamma)
+        # kolom 0 = bucket nol, 1..B = bucket log, B+1 = tak hingga
+        self.jumlah_bucket = self._indeks_maks - self._indeks_min + 3
+        self.hitungan = np.zeros((jumlah_seri, self.jumlah_bucket), dtype=np.int64)
+
+    def tambah(self, nilai):
+        """Masukkan nilai berbentuk (n, jumlah_seri); NaN diabaikan."""
+        nilai = np.asarray(nilai, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kolom = np.ceil(np.log(nilai) / self._ln_gamma) - (self._indeks_min - 1)
+        kolom = np.clip(kolom, 0, self.jumlah_bucket - 1)
+        kolom[nilai <= self.nilai_min] = 0
+        kolom[np.isinf(nilai)] = self.jumlah_bucket - 1
+        sah = ~np.isnan(nilai)
+        seri = np.broadcast_to(np.arange(nilai.shape[1]), nilai.shape)
+        datar = seri[sah] * self.jumlah_bucket + kolom[sah].astype(np.int64)
+        self.hitungan += np.bincount(datar, minlength=self.hitungan.size).reshape(self.hitungan.shape)
+
+    def gabung(self, lain):
+        if lain.hitungan.shape != self.hitungan.shape or lain.gamma != self.gamma:
+            raise ValueError("sketsa berbeda parameter tidak dapat digabung")
+        self.hitungan += lain.hitungan
+
+    def kuantil(self, q):
+        """Perkiraan kuantil q untuk tiap seri, array (jumlah_seri,); NaN bila seri kosong."""
+        total = self.hitungan.sum(axis=1)
+        kumulatif = np.cumsum(self.hitungan, axis=1)
+        hasil = np.full(self.hitungan.shape[0], np.nan)
+        for s in range(self.hitungan.shape[0]):
+            if total[s] == 0:
+                continue
+            kolom = int(np.searchsorted(kumulatif[s], q * (total[s] - 1), side="right"))
+            hasil[s] = self._nilai_bucket(kolom)
+        return hasil
+
+    def _nilai_bucket(self, kolom):
+        if kolom == 0:
+            return 0.0
+        if kolom == self.jumlah_bucket - 1:
+            return math.inf
+        return 2 * self.gamma ** (kolom - 1 + self._indeks_min) / (self.gamma + 1)
+
+
+# ----------------------------------------------------------
+# Simulasi
+# ----------------------------------------------------------
+
+def sebaran_bawaan(jari_orbit_awal, jari_orbit_akhir, massa_kosong, isp=None, harga=None):
+    """Sebaran 'tetap' untuk semua masukan; ganti entri yang tidak pasti."""
+    if isp is None:
+        isp = po.isp_bahan_bakar
+    if harga is None:
+        harga = po.harga_bahan_bakar
+    return {
+        "r1": buat_sebaran(jari_orbit_awal),
+        "r2": buat_sebaran(jari_orbit_akhir),
+        "massa_kosong": buat_sebaran(massa_kosong),
+        "isp": [buat_sebaran(float(x)) for x in isp],
+        "harga": [buat_sebaran(float(x)) for x in harga],
+    }
+
+
+def _tarik_batch(sebaran, rng, n):
+    jumlah = len(sebaran["isp"])
+    r1 = tarik(sebaran["r1"], rng, n)
+    r2 = tarik(sebaran["r2"], rng, n)
+    mk = tarik(sebaran["massa_kosong"], rng, n)
+    isp = np.empty((n, jumlah))
+    harga = np.empty((n, jumlah))
+    for f in range(jumlah):
+        isp[:, f] = tarik(sebaran["isp"][f], rng, n)
+        harga[:, f] = tarik(sebaran["harga"][f], rng, n)
+    return r1, r2, mk, isp, harga
+
+
+def jalankan_monte_carlo(sebaran, anggaran, jumlah_sampel, seed=0, ukuran_batch=UKURAN_BATCH,
+                         akurasi=AKURASI_SKETSA, mode=None, laporan=None):
+    """Jalankan simulasi; kembalikan dict ringkasan yang siap di-dump ke JSON.
+
+    sebaran : dict dari sebaran_bawaan (r1, r2, massa_kosong, isp[F], harga[F])
+    Sampel tidak sah (radius di luar [RADIUS_BUMI, RADIUS_ATAS_MAX], massa
+    kosong / Isp <= 0, harga < 0) dibuang dan dihitung di jumlah_tidak_sah.
+    Seri terakhir "termurah" = biaya bahan bakar termurah per sampel.
+    """
+    jumlah = len(sebaran["isp"])
+    if len(sebaran["harga"]) != jumlah:
+        raise ValueError("jumlah sebaran isp dan harga harus sama")
+    jumlah_sampel = int(jumlah_sampel)
+    sketsa = SketsaKuantil(jumlah + 1, akurasi)
+    jumlah_terjangkau = np.zeros(jumlah + 1, dtype=np.int64)
+    jumlah_biaya = np.zeros(jumlah + 1)
+    jumlah_sah = 0
+
+    jumlah_batch = -(-jumlah_sampel // ukuran_batch)
+    for k, anak in enumerate(np.random.SeedSequence(seed).spawn(jumlah_batch)):
+        n = min(ukuran_batch, jumlah_sampel - k * ukuran_batch)
+        r1, r2, mk, isp, harga = _tarik_batch(sebaran, np.random.default_rng(anak), n)
+        sah = ((r1 >= po.RADIUS_BUMI) & (r1 <= po.RADIUS_ATAS_MAX)
+               & (r2 >= po.RADIUS_BUMI) & (r2 <= po.RADIUS_ATAS_MAX) & (mk > 0)
+               & (isp > 0).all(axis=1) & (harga >= 0).all(axis=1))
+        if not sah.all():
+            r1, r2, mk, isp, harga = r1[sah], r2[sah], mk[sah], isp[sah], harga[sah]
+        biaya = po.biaya_ke_orbit(r1[:, None], r2[:, None], mk[:, None],
+                                  isp * po.gravitasi_bumi, harga, mode)
+        biaya = np.column_stack((biaya, biaya.min(axis=1)))
+        sketsa.tambah(biaya)
+        jumlah_terjangkau += np.count_nonzero(biaya <= anggaran, axis=0)
+        jumlah_biaya += biaya.sum(axis=0)
+        jumlah_sah += biaya.shape[0]
+        if laporan is not None:
+            laporan(k + 1, jumlah_batch)
+
+    kuantil = {q: sketsa.kuantil(q) for q in KUANTIL}
+    seri = []
+    for s in range(jumlah + 1):
+        ringkasan = {"bahan_bakar": s if s < jumlah else "termurah"}
+        for q in KUANTIL:
+            ringkasan["p" + str(round(q * 100))] = float(kuantil[q][s])
+        ringkasan["rata_rata"] = float(jumlah_biaya[s] / jumlah_sah) if jumlah_sah else math.nan
+        ringkasan["peluang_terjangkau"] = float(jumlah_terjangkau[s] / jumlah_sah) if jumlah_sah else math.nan
+        seri.append(ringkasan)
+    return {
+        "seed": seed,
+        "ukuran_batch": ukuran_batch,
+        "jumlah_sampel": jumlah_sampel,
+        "jumlah_tidak_sah": jumlah_sampel - jumlah_sah,
+        "anggaran": anggaran,
+        "akurasi_kuantil": akurasi,
+        "hasil": seri,
+    }
+
+
+def _sebaran_per_bahan_bakar(daftar, bawaan, opsi):
+    # "6=normal:3000:150" -> ganti entri ke-6
+    for teks in daftar or ():
+        indeks, _, spesifikasi = teks.partition("=")
+        try:
+            bawaan[int(indeks)] = buat_sebaran(spesifikasi)
+        except (ValueError, IndexError):
+            raise ValueError(opsi + " harus berbentuk INDEKS=SEBARAN dengan indeks 0.."
+                             + str(len(bawaan) - 1) + ": " + teks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo ketidakpastian biaya perpindahan orbit")
+    parser.add_argument("--r1", required=True, help="sebaran R1 (m)")
+    parser.add_argument("--r2", required=True, help="sebaran R2 (m)")
+    parser.add_argument("--massa", required=True, help="sebaran massa kosong (kg)")
+    parser.add_argument("--isp", action="append", help="INDEKS=SEBARAN Isp bahan bakar (boleh berulang)")
+    parser.add_argument("--harga", action="append", help="INDEKS=SEBARAN harga bahan bakar (boleh berulang)")
+    parser.add_argument("--anggaran", type=float, required=True)
+    parser.add_argument("--sampel", type=float, default=1e6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ukuran-batch", type=int, default=UKURAN_BATCH)
+    parser.add_argument("--akurasi", type=float, default=AKURASI_SKETSA, help="galat relatif kuantil")
+    args = parser.parse_args(argv)
+
+    try:
+        sebaran = sebaran_bawaan(0, 0, 0)
+        sebaran["r1"] = buat_sebaran(args.r1)
+        sebaran["r2"] = buat_sebaran(args.r2)
+        sebaran["massa_kosong"] = buat_sebaran(args.massa)
+        _sebaran_per_bahan_bakar(args.isp, sebaran["isp"], "--isp")
+        _sebaran_per_bahan_bakar(args.harga, sebaran["harga"], "--harga")
+        hasil = jalankan_monte_carlo(sebaran, args.anggaran, args.sampel, args.seed,
+                                     args.ukuran_batch, args.akurasi)
+    except ValueError as galat:
+        print("Input tidak valid:", galat, file=sys.stderr)
+        return 2
+    for ringkasan in hasil["hasil"]:
+        if ringkasan["bahan_bakar"] != "termurah":
+            ringkasan["nama"] = po.nama_bahan_bakar[ringkasan["bahan_bakar"]]
+    json.dump(hasil, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+# ==========================================================
+# PERENCANA MISI MULTI-KAKI
+# Misi = urutan radius target R0 -> R1 -> ... -> Rn. Tiap kaki ditempuh
+# dengan transfer Hohmann (2 pembakaran) atau bi-eliptik (3 pembakaran,
+# hanya bila ΔV-nya lebih kecil), dan tiap pembakaran boleh memakai
+# bahan bakar kimia berbeda. Bahan bakar dorong rendah (mesin listrik,
+# bawaan po.kolom_dorong_rendah) tidak bisa membakar impulsif: mereka
+# hanya dipakai untuk kaki "spiral", satu pembakaran kontinu dengan ΔV
+# Edelbaum, dan tidak ikut dipilih untuk pembakaran Hohmann/bi-eliptik.
+#
+# Pemrograman dinamis atas massa basah yang tersisa: bila massa setelah
+# pembakaran k adalah m, biaya minimum pembakaran 1..k adalah m × w[k],
+# karena setiap biaya linear terhadap massa yang harus didorong:
+#
+#   w[k] = min_f  harga_f × (E_kf - 1) + E_kf × w[k-1],   E_kf = e^(ΔV_k / ve_f)
+#
+# sehingga cukup satu skalar per pembakaran dan biaya perencanaan
+# O(kaki × pembakaran × F), bukan O(F^pembakaran). Hasil per kaki (ΔV dan
+# E untuk semua bahan bakar) dimemo per (R_dari, R_ke).
+#
+# Contoh:
+#   python perencana_misi.py --awal 6771000 --target 42164000 384400000 \
+#       --massa 2000 --anggaran 5e6
+# ==========================================================
+
+import argparse
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+import katalog_bahan_bakar as kb
+import perhitungan_orbit as po
+
+Pembakaran = namedtuple("Pembakaran", ["kaki", "jenis_kaki", "deltaV", "bahan_bakar",
+                                       "massa_bahan_bakar", "biaya"])
+RencanaMisi = namedtuple("RencanaMisi", ["terjangkau", "kaki_terjangkau", "biaya_total",
+                                         "massa_bahan_bakar_total", "massa_awal", "pembakaran"])
+_Kaki = namedtuple("_Kaki", ["jenis", "deltaV", "faktor", "boleh"])
+
+
+def delta_v_bielliptik(jari_orbit_awal, jari_orbit_akhir, jari_orbit_antara):
+    """(ΔV1, ΔV2, ΔV3) magnitudo transfer bi-eliptik R1 -> Rb -> R2."""
+    mu = po.G * po.massa_bumi
+    a1 = 0.5 * (jari_orbit_awal + jari_orbit_antara)
+    a2 = 0.5 * (jari_orbit_akhir + jari_orbit_antara)
+    deltaV1 = ((2 * mu / jari_orbit_awal - mu / a1) ** 0.5) - (mu / jari_orbit_awal) ** 0.5
+    deltaV2 = ((2 * mu / jari_orbit_antara - mu / a2) ** 0.5) - ((2 * mu / jari_orbit_antara - mu / a1) ** 0.5)
+    deltaV3 = ((2 * mu / jari_orbit_akhir - mu / a2) ** 0.5) - (mu / jari_orbit_akhir) ** 0.5
+    return abs(deltaV1), abs(deltaV2), abs(deltaV3)
+
+
+class PerencanaMisi:
+    """Pilih bahan bakar per pembakaran (dan jenis transfer per kaki) dengan biaya minimum.
+
+    katalog             : Katalog bahan bakar (bawaan: katalog_bawaan())
+    radius_antara_maks  : apoapsis bi-eliptik; ΔV bi-eliptik turun bila
+                          apoapsis naik, jadi dipakai batas atas ini
+                          (bawaan RADIUS_ATAS_MAX). None = Hohmann saja.
+    dorong_rendah       : seperti po.hitung_batch (bawaan
+                          po.kolom_dorong_rendah(katalog.isp)); False =
+                          semua bahan bakar boleh membakar impulsif
+    """
+
+    def __init__(self, katalog=None, radius_antara_maks=po.RADIUS_ATAS_MAX, dorong_rendah=None):
+        self.katalog = kb.katalog_bawaan() if katalog is None else katalog
+        self.radius_antara_maks = radius_antara_maks
+        self._spiral = po.mask_dorong_rendah(self.katalog.isp, dorong_rendah).copy()
+        self._memo_kaki = {}
+
+    # ------------------------------------------------------
+    # Kaki (dimemo)
+    # ------------------------------------------------------
+
+    def pilihan_kaki(self, jari_orbit_awal, jari_orbit_akhir):
+        """Daftar _Kaki (jenis, ΔV per pembakaran, faktor massa E (pembakaran, F), mask boleh (F,))."""
+        kunci = (float(jari_orbit_awal), float(jari_orbit_akhir))
+        pilihan = self._memo_kaki.get(kunci)
+        if pilihan is not None:
+            return pilihan
+
+        _, deltaV1, deltaV2 = po.hitung_delta_v(jari_orbit_awal, jari_orbit_akhir)
+        daftar = [("hohmann", (abs(deltaV1), abs(deltaV2)))]
+        rb = self.radius_antara_maks
+        if rb is not None and rb > max(jari_orbit_awal, jari_orbit_akhir):
+            dv_bielliptik = delta_v_bielliptik(jari_orbit_awal, jari_orbit_akhir, rb)
+            if sum(dv_bielliptik) < sum(daftar[0][1]):
+                daftar.append(("bielliptik", dv_bielliptik))
+
+        impulsif = ~self._spiral
+        daftar = [(jenis, deltaV, impulsif) for jenis, deltaV in daftar]
+        if self._spiral.any():
+            daftar.append(("spiral", (po.hitung_delta_v_edelbaum(jari_orbit_awal, jari_orbit_akhir),),
+                           self._spiral))
+
+        pilihan = []
+        for jenis, deltaV, boleh in daftar:
+            if not boleh.any():
+                continue
+            # baris = pembakaran, kolom = bahan bakar; sama dengan solver "tertutup"
+            faktor = po.e ** (np.asarray(deltaV)[:, None] / self.katalog.kecepatan_buang[None, :])
+            pilihan.append(_Kaki(jenis, deltaV, faktor, boleh))
+        self._memo_kaki[kunci] = pilihan
+        return pilihan
+
+    # ------------------------------------------------------
+    # Pemrograman dinamis
+    # ------------------------------------------------------
+
+    def _maju(self, w, kaki):
+        """Biaya per kg setelah kaki dan bahan bakar terpilih tiap pembakaran."""
+        harga = self.katalog.harga
+        pilihan_bahan_bakar = []
+        for faktor in kaki.faktor:
+            kandidat = np.where(kaki.boleh, harga * (faktor - 1.0) + faktor * w, np.inf)
+            f = int(np.argmin(kandidat))
+            pilihan_bahan_bakar.append(f)
+            w = float(kandidat[f])
+        return w, pilihan_bahan_bakar
+
+    def rencanakan(self, jari_orbit_awal, daftar_target, massa_kosong, anggaran):
+        """Rencana biaya minimum untuk seluruh misi, atau prefiks terjauh yang terjangkau.
+
+        Kembalikan RencanaMisi; terjangkau=False berarti seluruh misi melebihi
+        anggaran dan pembakaran berisi rencana untuk kaki_terjangkau kaki
+        pertama (0 = tidak ada kaki yang terjangkau).
+        """
+        radius = [float(jari_orbit_awal)] + [float(r) for r in daftar_target]
+        if not daftar_target:
+            raise ValueError("daftar_target tidak boleh kosong")
+        for r in radius:
+            if r < po.RADIUS_BUMI or r > po.RADIUS_ATAS_MAX:
+                raise ValueError("radius harus di antara " + str(po.RADIUS_BUMI) + " dan "
+                                 + str(po.RADIUS_ATAS_MAX) + " m")
+        if massa_kosong <= 0:
+            raise ValueError("massa_kosong harus lebih besar dari 0")
+
+        # w[L] = biaya minimum per kg massa setelah kaki L (w[0] = 0)
+        w = [0.0]
+        keputusan = []
+        for dari, ke in zip(radius[:-1], radius[1:]):
+            terbaik = None
+            for kaki in self.pilihan_kaki(dari, ke):
+                w_kaki, bahan_bakar = self._maju(w[-1], kaki)
+                if terbaik is None or w_kaki < terbaik[0]:
+                    terbaik = (w_kaki, kaki, bahan_bakar)
+            w.append(terbaik[0])
+            keputusan.append(terbaik[1:])
+
+        # w naik monoton terhadap jumlah kaki, jadi prefiks terjauh dicari dari belakang
+        jumlah_kaki = len(keputusan)
+        while jumlah_kaki > 0 and massa_kosong * w[jumlah_kaki] > anggaran:
+            jumlah_kaki -= 1
+        terjangkau = jumlah_kaki == len(keputusan)
+        return self._rekonstruksi(keputusan[:jumlah_kaki], massa_kosong, terjangkau)
+
+    def _rekonstruksi(self, keputusan, massa_kosong, terjangkau):
+        # dari massa kosong di akhir, mundur pembakaran demi pembakaran
+        massa = float(massa_kosong)
+        pembakaran = []
+        for nomor_kaki in range(len(keputusan) - 1, -1, -1):
+            kaki, bahan_bakar = keputusan[nomor_kaki]
+            for k in range(len(bahan_bakar) - 1, -1, -1):
+                f = bahan_bakar[k]
+                massa_sebelum = massa * float(kaki.faktor[k, f])
+                massa_bahan_bakar = massa_sebelum - massa
+                pembakaran.append(Pembakaran(nomor_kaki, kaki.jenis, kaki.deltaV[k], f, massa_bahan_bakar,
+                                             po.hitung_biaya(massa_bahan_bakar, float(self.katalog.harga[f]))))
+                massa = massa_sebelum
+        pembakaran.reverse()
+        return RencanaMisi(terjangkau, len(keputusan), sum(p.biaya for p in pembakaran),
+                           massa - massa_kosong, massa, pembakaran)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perencana misi multi-kaki perpindahan orbit")
+    parser.add_argument("--awal", type=float, required=True, help="radius orbit awal (m)")
+    parser.add_argument("--target", type=float, nargs="+", required=True, help="radius target berurutan (m)")
+    parser.add_argument("--massa", type=float, required=True, help="massa kosong (kg)")
+    parser.add_argument("--anggaran", type=float, required=True, help="anggaran ($)")
+    parser.add_argument("--katalog", help="katalog bahan bakar CSV (nama, isp, harga[, pemasok, tingkat])")
+    parser.add_argument("--tanpa-bielliptik", action="store_true", help="hanya transfer Hohmann")
+    parser.add_argument("--tanpa-dorong-rendah", action="store_true",
+                        help="bahan bakar listrik juga dihitung sebagai pembakaran impulsif, tanpa kaki spiral")
+    args = parser.parse_args(argv)
+
+    katalog = kb.pangkas_pareto(kb.muat_katalog(args.katalog)) if args.katalog else None
+    perencana = PerencanaMisi(katalog, None if args.tanpa_bielliptik else po.RADIUS_ATAS_MAX,
+                              False if args.tanpa_dorong_rendah else None)
+    try:
+        rencana = perencana.rencanakan(args.awal, args.target, args.massa, args.anggaran)
+    except ValueError as galat:
+        print("Input tidak valid:", galat, file=sys.stderr)
+        return 2
+
+    nama = perencana.katalog.nama
+    for p in rencana.pembakaran:
+        print("Kaki", p.kaki + 1, "(" + p.jenis_kaki + ")", "ΔV =", round(p.deltaV, 2), "m/s |",
+              nama[p.bahan_bakar], "|", round(p.massa_bahan_bakar, 2), "kg |", round(p.biaya, 2), "$")
+    print("Massa awal:", round(rencana.massa_awal, 2), "kg ; bahan bakar:",
+          round(rencana.massa_bahan_bakar_total, 2), "kg ; biaya:", round(rencana.biaya_total, 2), "$")
+    if not rencana.terjangkau:
+        print("Anggaran hanya cukup untuk", rencana.kaki_terjangkau, "dari", len(args.target), "kaki.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
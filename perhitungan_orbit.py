@@ -0,0 +1,823 @@
+# ==========================================================
+# PERHITUNGAN ORBIT — rumus ΔV Hohmann, massa & biaya bahan bakar
+# Pustaka tanpa efek samping: import tidak mencetak, tidak meminta input,
+# dan tidak memuat NumPy. NumPy baru di-import saat fungsi batch / R3
+# pertama kali dipanggil, sehingga jalur skalar tetap cepat dimulai.
+# Solver, pencarian R3, kurva biaya, dan cek anggaran melapor ke modul
+# instrumentasi bila instrumentasi.AKTIF (bawaan: nonaktif).
+#
+# API skalar (tanpa NumPy):
+#   hitung_delta_v, hitung_delta_v_edelbaum, kecepatan_buang_dari_isp,
+#   selesaikan_bahan_bakar,
+#   hitung_bahan_bakar, hitung_biaya, saring_mampu_beli, hitung_skalar
+# API array (NumPy):
+#   hitung_delta_v_batch, hitung_delta_v_edelbaum_batch, kolom_dorong_rendah,
+#   mask_dorong_rendah, selesaikan_bahan_bakar_batch, hitung_batch,
+#   terapkan_dorong_rendah,
+#   hitung_biaya_batch, mampu_beli_batch, cari_orbit_maks, cari_orbit_maks_batch,
+#   mundur_ke_terjangkau_batch, buat_kurva_biaya, orbit_maks_dari_kurva
+#
+# Dorong rendah: mesin ion/Hall (Isp >= ISP_DORONG_RENDAH, lihat
+# kolom_dorong_rendah) tidak bisa membakar impulsif, jadi massa, biaya,
+# keterjangkauan, dan R3-nya memakai ΔV spiral Edelbaum |v(R1) - v(R2)|
+# (satu "pembakaran" kontinu), bukan dua pembakaran Hohmann. Parameter
+# dorong_rendah pada hitung_skalar, hitung_batch, biaya_ke_orbit,
+# cari_orbit_maks(_batch), dan buat_kurva_biaya: None = mask bawaan itu,
+# mask (F,) = pilihan sendiri, False = semua Hohmann.
+# ==========================================================
+
+import importlib
+from collections import namedtuple
+
+import instrumentasi as _ins
+
+
+class _ImporMalas:
+    """Pengganti modul yang baru di-import saat atributnya pertama kali dipakai."""
+
+    def __init__(self, nama_modul, nama_global):
+        self._nama_modul = nama_modul
+        self._nama_global = nama_global
+
+    def __getattr__(self, atribut):
+        modul = importlib.import_module(self._nama_modul)
+        globals()[self._nama_global] = modul
+        return getattr(modul, atribut)
+
+
+np = _ImporMalas("numpy", "np")
+
+# Konstanta
+e = 2.71828
+G = 6.67430 * (10 ** -11)
+massa_bumi = 5.972 * (10 ** 24)
+gravitasi_bumi = 9.80665
+
+# Batas wajar radius orbit (meter)
+RADIUS_BUMI = 6_371_000
+RADIUS_ATAS_MAX = 1_500_000_000
+
+# Daftar bahan bakar
+nama_bahan_bakar = [
+    "RP-1 / LOX",
+    "LH2 / LOX",
+    "CH4 / LOX (Metana)",
+    "Hypergolic (MMH/UDMH)",
+    "Monopropellant (Hydrazine)",
+    "Solid propellant",
+    "Electric (Xenon ion/Hall)"
+]
+
+isp_bahan_bakar = [330, 450, 360, 320, 220, 270, 3000]
+harga_bahan_bakar = [3.0, 20.0, 5.0, 300.0, 50.0, 6.0, 20000.0]
+
+jumlah_bahan_bakar = len(nama_bahan_bakar)
+
+# Isp (s) mulai dari sini dianggap propulsi listrik dorong rendah (spiral);
+# bahan bakar kimia terbaik pun masih di bawah ~470 s
+ISP_DORONG_RENDAH = 1000.0
+
+# Solver massa bahan bakar
+#   "tertutup"  : hasil bentuk-tertutup persamaan roket (1 eksponensial)
+#   "toleransi" : iterasi titik-tetap sampai selisih relatif <= toleransi
+#   "tetap"     : iterasi titik-tetap sebanyak ITERASI_TETAP (perilaku lama)
+MODE_SOLVER = "tertutup"
+TOLERANSI_SOLVER = 1e-12
+ITERASI_TETAP = 20
+ITERASI_MAKS = 10_000
+
+HasilSolver = namedtuple("HasilSolver", ["massa", "iterasi", "residu"])
+
+
+# ----------------------------------------------------------
+# Versi skalar (satu skenario, satu bahan bakar)
+# ----------------------------------------------------------
+
+def hitung_delta_v(jari_orbit_awal, jari_orbit_akhir):
+    """Kembalikan (kecepatan_R1, deltaV1, deltaV2) transfer Hohmann R1 -> R2."""
+    kecepatan_R1 = ((G * massa_bumi) / jari_orbit_awal) ** 0.5
+    deltaV1 = kecepatan_R1 * (((2 * jari_orbit_akhir) / (jari_orbit_awal + jari_orbit_akhir)) ** 0.5 - 1)
+    deltaV2 = kecepatan_R1 * ((jari_orbit_awal / jari_orbit_akhir) ** 0.5) * (1 - ((2 * jari_orbit_awal) / (jari_orbit_awal + jari_orbit_akhir)) ** 0.5)
+    return kecepatan_R1, deltaV1, deltaV2
+
+
+def hitung_delta_v_edelbaum(jari_orbit_awal, jari_orbit_akhir):
+    """ΔV spiral dorong rendah (Edelbaum) R1 -> R2: |v(R1) - v(R2)|."""
+    deltaV = ((G * massa_bumi) / jari_orbit_awal) ** 0.5 - ((G * massa_bumi) / jari_orbit_akhir) ** 0.5
+    return deltaV if deltaV >= 0 else -deltaV
+
+
+def selesaikan_bahan_bakar(deltaV1, deltaV2, kecepatan_buang, massa_kosong,
+                           mode=None, toleransi=None, iterasi_maks=None):
+    """Massa bahan bakar total (kg) untuk dua pembakaran.
+
+    Titik tetap dari  M = massa_kosong + b1 + b2  adalah
+    M = massa_kosong / (exp1 * exp2), sehingga bahan bakar total =
+    massa_kosong * (e ** ((|ΔV1| + |ΔV2|) / ve) - 1).
+
+    Kembalikan HasilSolver(massa, iterasi, residu); residu adalah selisih
+    relatif |M - (massa_kosong + b1 + b2)| / M pada iterasi terakhir.
+    """
+    if mode is None:
+        mode = MODE_SOLVER
+    if toleransi is None:
+        toleransi = TOLERANSI_SOLVER
+    if iterasi_maks is None:
+        iterasi_maks = ITERASI_TETAP if mode == "tetap" else ITERASI_MAKS
+
+    if not _ins.AKTIF:
+        return _selesaikan_skalar(deltaV1, deltaV2, kecepatan_buang, massa_kosong,
+                                  mode, toleransi, iterasi_maks)
+    mulai = _ins.mulai()
+    hasil = _selesaikan_skalar(deltaV1, deltaV2, kecepatan_buang, massa_kosong,
+                               mode, toleransi, iterasi_maks)
+    # batas tercapai = loop berhenti karena iterasi_maks, bukan karena konvergen
+    batas_tercapai = hasil.iterasi >= iterasi_maks and not hasil.residu <= toleransi
+    _ins.catat_solver("solver", mulai, 1, hasil.iterasi, int(batas_tercapai), hasil.residu)
+    return hasil
+
+
+def _selesaikan_skalar(deltaV1, deltaV2, kecepatan_buang, massa_kosong,
+                       mode, toleransi, iterasi_maks):
+    # gunakan magnitude ΔV untuk perhitungan exponent agar tidak menghasilkan exp>1
+    abs_dV1 = deltaV1 if deltaV1 >= 0 else -deltaV1
+    abs_dV2 = deltaV2 if deltaV2 >= 0 else -deltaV2
+
+    if mode == "tertutup":
+        exp12 = e ** (-(abs_dV1 + abs_dV2) / kecepatan_buang)
+        if exp12 > 0:
+            massa_total = massa_kosong / exp12
+            total_bahan_bakar = massa_total - massa_kosong
+            if total_bahan_bakar < 0:
+                total_bahan_bakar = 0.0
+            residu = (massa_kosong + massa_total * (1 - exp12) - massa_total) / massa_total
+            return HasilSolver(total_bahan_bakar, 0, residu if residu >= 0 else -residu)
+        # exp12 underflow (ΔV jauh melebihi ve) -> bahan bakar tak hingga
+        return HasilSolver(float("inf"), 0, float("inf"))
+    elif mode not in ("toleransi", "tetap"):
+        raise ValueError("mode solver tidak dikenal: " + str(mode))
+
+    exp1 = e ** (-abs_dV1 / kecepatan_buang)
+    exp2 = e ** (-abs_dV2 / kecepatan_buang)
+    massa_total = massa_kosong + 1000.0
+    residu = 0.0
+    j = 0
+    while j < iterasi_maks:
+        bahan_bakar_tahap1 = massa_total * (1 - exp1)
+        bahan_bakar_tahap2 = (massa_total - bahan_bakar_tahap1) * (1 - exp2)
+        massa_baru = massa_kosong + bahan_bakar_tahap1 + bahan_bakar_tahap2
+        residu = (massa_baru - massa_total) / massa_baru
+        if residu < 0:
+            residu = -residu
+        massa_total = massa_baru
+        j += 1
+        if mode == "toleransi" and residu <= toleransi:
+            break
+
+    # Pastikan non-negatif (safety)
+    if bahan_bakar_tahap1 < 0:
+        bahan_bakar_tahap1 = 0.0
+    if bahan_bakar_tahap2 < 0:
+        bahan_bakar_tahap2 = 0.0
+    return HasilSolver(bahan_bakar_tahap1 + bahan_bakar_tahap2, j, residu)
+
+
+def kecepatan_buang_dari_isp(isp):
+    """Effective exhaust velocity (m/s) dari Isp (s)."""
+    return isp * gravitasi_bumi
+
+
+def hitung_bahan_bakar(deltaV1, deltaV2, kecepatan_buang, massa_kosong, mode=None):
+    """Massa bahan bakar total (kg) saja, tanpa info iterasi/residu."""
+    return selesaikan_bahan_bakar(deltaV1, deltaV2, kecepatan_buang, massa_kosong, mode).massa
+
+
+def hitung_biaya(massa_bahan_bakar, harga):
+    """Biaya bahan bakar (USD), tidak pernah negatif."""
+    total_biaya = massa_bahan_bakar * harga
+    if total_biaya < 0:
+        total_biaya = 0.0
+    return total_biaya
+
+
+def saring_mampu_beli(biaya_bahan_bakar, anggaran):
+    """Indeks bahan bakar yang biayanya terhitung (>= 0) dan <= anggaran."""
+    if _ins.AKTIF:
+        _ins.tambah("cek_anggaran", "evaluasi", len(biaya_bahan_bakar))
+    daftar_mampu_beli = []
+    i = 0
+    while i < len(biaya_bahan_bakar):
+        if biaya_bahan_bakar[i] >= 0 and anggaran >= biaya_bahan_bakar[i]:
+            daftar_mampu_beli += [i]
+        i += 1
+    return daftar_mampu_beli
+
+
+def hitung_skalar(jari_orbit_awal, jari_orbit_akhir, massa_kosong, mode=None, dorong_rendah=None):
+    """Massa & biaya tiap bahan bakar untuk satu skenario (list, urutan katalog).
+
+    dorong_rendah : list bool per bahan bakar yang memakai ΔV spiral
+                    Edelbaum; None = Isp >= ISP_DORONG_RENDAH, False = semua
+                    Hohmann
+    """
+    _, deltaV1, deltaV2 = hitung_delta_v(jari_orbit_awal, jari_orbit_akhir)
+    if dorong_rendah is None:
+        dorong_rendah = [isp >= ISP_DORONG_RENDAH for isp in isp_bahan_bakar]
+    elif dorong_rendah is False:
+        dorong_rendah = [False] * jumlah_bahan_bakar
+    deltaV_spiral = None
+
+    massa_bahan_bakar = [0] * jumlah_bahan_bakar
+    biaya_bahan_bakar = [0] * jumlah_bahan_bakar
+    i = 0
+    while i < jumlah_bahan_bakar:
+        kecepatan_buang = kecepatan_buang_dari_isp(isp_bahan_bakar[i])
+        if dorong_rendah[i]:
+            if deltaV_spiral is None:
+                deltaV_spiral = hitung_delta_v_edelbaum(jari_orbit_awal, jari_orbit_akhir)
+            total_bahan_bakar = hitung_bahan_bakar(deltaV_spiral, 0.0, kecepatan_buang, massa_kosong, mode)
+        else:
+            total_bahan_bakar = hitung_bahan_bakar(deltaV1, deltaV2, kecepatan_buang, massa_kosong, mode)
+        massa_bahan_bakar[i] = total_bahan_bakar
+        biaya_bahan_bakar[i] = hitung_biaya(total_bahan_bakar, harga_bahan_bakar[i])
+        i += 1
+    return massa_bahan_bakar, biaya_bahan_bakar
+
+
+# ----------------------------------------------------------
+# Versi batch (N skenario × F bahan bakar dalam satu panggilan NumPy)
+# ----------------------------------------------------------
+
+def hitung_delta_v_batch(jari_orbit_awal, jari_orbit_akhir):
+    """Versi array dari hitung_delta_v; masukan dan keluaran berbentuk (N,)."""
+    r1 = np.asarray(jari_orbit_awal, dtype=np.float64)
+    r2 = np.asarray(jari_orbit_akhir, dtype=np.float64)
+    kecepatan_R1 = ((G * massa_bumi) / r1) ** 0.5
+    deltaV1 = kecepatan_R1 * (((2 * r2) / (r1 + r2)) ** 0.5 - 1)
+    deltaV2 = kecepatan_R1 * ((r1 / r2) ** 0.5) * (1 - ((2 * r1) / (r1 + r2)) ** 0.5)
+    return kecepatan_R1, deltaV1, deltaV2
+
+
+def hitung_delta_v_edelbaum_batch(jari_orbit_awal, jari_orbit_akhir):
+    """ΔV spiral dorong rendah (N,) antarorbit lingkaran sebidang: |v(R1) - v(R2)| (Edelbaum)."""
+    r1 = np.asarray(jari_orbit_awal, dtype=np.float64)
+    r2 = np.asarray(jari_orbit_akhir, dtype=np.float64)
+    return np.abs(((G * massa_bumi) / r1) ** 0.5 - ((G * massa_bumi) / r2) ** 0.5)
+
+
+def kolom_dorong_rendah(isp):
+    """Mask (F,) bahan bakar dorong rendah: Isp >= ISP_DORONG_RENDAH."""
+    return np.asarray(isp, dtype=np.float64) >= ISP_DORONG_RENDAH
+
+
+def mask_dorong_rendah(isp, dorong_rendah=None):
+    """Mask (F,) dari parameter dorong_rendah: None = kolom_dorong_rendah(isp), False = semua Hohmann."""
+    if dorong_rendah is None:
+        return kolom_dorong_rendah(isp)
+    return np.broadcast_to(np.asarray(dorong_rendah, dtype=bool), np.shape(isp))
+
+
+def selesaikan_bahan_bakar_batch(deltaV1, deltaV2, kecepatan_buang, massa_kosong,
+                                 mode=None, toleransi=None, iterasi_maks=None):
+    """Versi array dari selesaikan_bahan_bakar.
+
+    deltaV1, deltaV2, massa_kosong : (N,) ; kecepatan_buang : (F,)
+    Kembalikan HasilSolver dengan massa & residu (N, F) dan iterasi (N, F).
+    """
+    return _selesaikan_array(
+        np.abs(deltaV1)[:, None],
+        np.abs(deltaV2)[:, None],
+        np.asarray(kecepatan_buang, dtype=np.float64)[None, :],
+        np.asarray(massa_kosong, dtype=np.float64)[:, None],
+        mode, toleransi, iterasi_maks,
+    )
+
+
+def _selesaikan_array(abs_dV1, abs_dV2, ve, mk, mode=None, toleransi=None, iterasi_maks=None):
+    # semua masukan cukup saling broadcast, hasil per elemen
+    if mode is None:
+        mode = MODE_SOLVER
+    if toleransi is None:
+        toleransi = TOLERANSI_SOLVER
+    if iterasi_maks is None:
+        iterasi_maks = ITERASI_TETAP if mode == "tetap" else ITERASI_MAKS
+    if mode not in ("tertutup", "toleransi", "tetap"):
+        raise ValueError("mode solver tidak dikenal: " + str(mode))
+
+    if not _ins.AKTIF:
+        return _selesaikan_array_inti(abs_dV1, abs_dV2, ve, mk, mode, toleransi, iterasi_maks)
+    mulai = _ins.mulai()
+    hasil = _selesaikan_array_inti(abs_dV1, abs_dV2, ve, mk, mode, toleransi, iterasi_maks)
+    batas_tercapai = np.count_nonzero((hasil.iterasi >= iterasi_maks) & ~(hasil.residu <= toleransi))
+    _ins.catat_solver("solver_batch", mulai, hasil.massa.size, hasil.iterasi.sum(), batas_tercapai,
+                      np.max(hasil.residu) if hasil.residu.size else 0.0)
+    return hasil
+
+
+def _selesaikan_array_inti(abs_dV1, abs_dV2, ve, mk, mode, toleransi, iterasi_maks):
+    if mode == "tertutup":
+        exp12 = e ** (-(abs_dV1 + abs_dV2) / ve)
+        # exp12 underflow (ΔV jauh melebihi ve) -> massa_total = inf
+        with np.errstate(divide="ignore", invalid="ignore"):
+            massa_total = mk / exp12
+            residu = np.abs(mk + massa_total * (1 - exp12) - massa_total) / massa_total
+        total_bahan_bakar = np.maximum(massa_total - mk, 0.0)
+        iterasi = np.zeros(total_bahan_bakar.shape, dtype=np.int64)
+        return HasilSolver(total_bahan_bakar, iterasi, residu)
+
+    exp1 = e ** (-abs_dV1 / ve)
+    exp2 = e ** (-abs_dV2 / ve)
+    bentuk = np.broadcast_shapes(exp1.shape, exp2.shape, np.shape(mk))
+    massa_total = np.broadcast_to(mk + 1000.0, bentuk).copy()
+    bahan_bakar_tahap1 = np.zeros(bentuk)
+    bahan_bakar_tahap2 = np.zeros(bentuk)
+    residu = np.zeros(bentuk)
+    iterasi = np.zeros(bentuk, dtype=np.int64)
+    aktif = np.ones(bentuk, dtype=bool)
+    j = 0
+    while j < iterasi_maks and aktif.any():
+        b1 = massa_total * (1 - exp1)
+        b2 = (massa_total - b1) * (1 - exp2)
+        massa_baru = mk + b1 + b2
+        r = np.abs(massa_baru - massa_total) / massa_baru
+        bahan_bakar_tahap1 = np.where(aktif, b1, bahan_bakar_tahap1)
+        bahan_bakar_tahap2 = np.where(aktif, b2, bahan_bakar_tahap2)
+        residu = np.where(aktif, r, residu)
+        massa_total = np.where(aktif, massa_baru, massa_total)
+        iterasi += aktif
+        if mode == "toleransi":
+            aktif &= r > toleransi
+        j += 1
+
+    total_bahan_bakar = np.maximum(bahan_bakar_tahap1, 0.0) + np.maximum(bahan_bakar_tahap2, 0.0)
+    return HasilSolver(total_bahan_bakar, iterasi, residu)
+
+
+def hitung_batch(jari_orbit_awal, jari_orbit_akhir, massa_kosong,
+                 isp=None, harga=None, mode=None, dorong_rendah=None):
+    """Massa & biaya bahan bakar untuk banyak skenario sekaligus.
+
+    jari_orbit_awal, jari_orbit_akhir, massa_kosong : array (N,) atau skalar
+    isp, harga : array (F,), bawaan isp_bahan_bakar / harga_bahan_bakar
+    mode : mode solver (lihat MODE_SOLVER)
+    dorong_rendah : mask (F,) bahan bakar yang dihitung dengan ΔV spiral
+                    Edelbaum; None = kolom_dorong_rendah(isp), False = semua
+                    Hohmann
+
+    Kembalikan (massa, biaya), masing-masing array (N, F). Dengan isp,
+    harga, dan dorong_rendah bawaan, setiap baris cocok dengan hitung_skalar hingga
+    ~1e-11 relatif (bukan bit demi bit: pow/sqrt NumPy bisa berbeda 1 ulp
+    dari libm; lihat benchmarks/bench_batch.py).
+    """
+    if isp is None:
+        isp = isp_bahan_bakar
+    if harga is None:
+        harga = harga_bahan_bakar
+
+    r1, r2, mk = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(jari_orbit_awal, dtype=np.float64)),
+        np.atleast_1d(np.asarray(jari_orbit_akhir, dtype=np.float64)),
+        np.atleast_1d(np.asarray(massa_kosong, dtype=np.float64)),
+    )
+    kecepatan_buang = np.asarray(isp, dtype=np.float64) * gravitasi_bumi
+    harga = np.asarray(harga, dtype=np.float64)
+
+    _, deltaV1, deltaV2 = hitung_delta_v_batch(r1, r2)
+    spiral = mask_dorong_rendah(isp, dorong_rendah)
+    if not spiral.any():
+        total_bahan_bakar = selesaikan_bahan_bakar_batch(deltaV1, deltaV2, kecepatan_buang, mk, mode).massa
+        return total_bahan_bakar, hitung_biaya_batch(total_bahan_bakar, harga)
+    # satu solve (N, F): kolom spiral memakai ΔV Edelbaum sebagai satu pembakaran
+    abs_dV1 = np.where(spiral, hitung_delta_v_edelbaum_batch(r1, r2)[:, None], np.abs(deltaV1)[:, None])
+    abs_dV2 = np.where(spiral, 0.0, np.abs(deltaV2)[:, None])
+    total_bahan_bakar = _selesaikan_array(abs_dV1, abs_dV2, kecepatan_buang[None, :], mk[:, None], mode).massa
+    return total_bahan_bakar, hitung_biaya_batch(total_bahan_bakar, harga)
+
+
+def terapkan_dorong_rendah(massa_bahan_bakar, jari_orbit_awal, jari_orbit_akhir, kecepatan_buang,
+                           massa_kosong, dorong_rendah, mode=None):
+    """Timpa kolom dorong_rendah (mask (F,)) massa (N, F) dengan massa spiral Edelbaum; kembalikan massa."""
+    spiral = np.broadcast_to(np.asarray(dorong_rendah, dtype=bool), np.shape(kecepatan_buang))
+    if spiral.any():
+        deltaV = hitung_delta_v_edelbaum_batch(jari_orbit_awal, jari_orbit_akhir)
+        massa_bahan_bakar[:, spiral] = selesaikan_bahan_bakar_batch(
+            deltaV, np.zeros_like(deltaV), np.asarray(kecepatan_buang, dtype=np.float64)[spiral],
+            massa_kosong, mode).massa
+    return massa_bahan_bakar
+
+
+def hitung_biaya_batch(massa_bahan_bakar, harga):
+    """Versi array dari hitung_biaya (saling broadcast, mis. (N, F) × (F,)), tidak pernah negatif."""
+    return np.maximum(np.asarray(massa_bahan_bakar, dtype=np.float64)
+                      * np.asarray(harga, dtype=np.float64), 0.0)
+
+
+def mampu_beli_batch(biaya_bahan_bakar, anggaran):
+    """Versi array dari saring_mampu_beli: mask (N, F) biaya terhitung (>= 0) dan <= anggaran (N,)."""
+    biaya_bahan_bakar = np.asarray(biaya_bahan_bakar, dtype=np.float64)
+    if _ins.AKTIF:
+        _ins.tambah("cek_anggaran", "evaluasi", biaya_bahan_bakar.size)
+    anggaran = np.asarray(anggaran, dtype=np.float64)
+    return (biaya_bahan_bakar >= 0) & (biaya_bahan_bakar <= anggaran[..., None])
+
+
+# ----------------------------------------------------------
+# Orbit maksimum yang terjangkau anggaran (R3)
+# ----------------------------------------------------------
+
+# Total ΔV Hohmann naik sampai R2/R1 ≈ 15.58 (akar x³ - 15x² - 9x - 1 = 0),
+# setelah itu turun lagi; biaya monoton hanya di bawah rasio ini.
+RASIO_PUNCAK_HOHMANN = 15.581718738
+PRESISI_R3 = 1.0   # meter
+
+
+def biaya_ke_orbit(jari_orbit_awal, jari_orbit_target, massa_kosong,
+                   kecepatan_buang, harga, mode=None, dorong_rendah=None):
+    """Biaya bahan bakar R1 -> target, per elemen (semua argumen saling broadcast).
+
+    dorong_rendah (broadcast seperti kecepatan_buang): True = ΔV spiral
+    Edelbaum; None = kecepatan buang >= ISP_DORONG_RENDAH × g0.
+    """
+    _, deltaV1, deltaV2 = hitung_delta_v_batch(jari_orbit_awal, jari_orbit_target)
+    if dorong_rendah is None:
+        dorong_rendah = np.asarray(kecepatan_buang) >= ISP_DORONG_RENDAH * gravitasi_bumi
+    if np.any(dorong_rendah):
+        deltaV1 = np.where(dorong_rendah, hitung_delta_v_edelbaum_batch(jari_orbit_awal, jari_orbit_target),
+                           deltaV1)
+        deltaV2 = np.where(dorong_rendah, 0.0, deltaV2)
+    massa = _selesaikan_array(np.abs(deltaV1), np.abs(deltaV2), kecepatan_buang,
+                              np.asarray(massa_kosong, dtype=np.float64), mode).massa
+    return np.maximum(massa * harga, 0.0)
+
+
+def batas_pencarian_r3(jari_orbit_awal, jari_orbit_akhir):
+    """Ujung jauh bracket R3: R2, dibatasi puncak ΔV Hohmann saat menaikkan orbit."""
+    if jari_orbit_akhir > jari_orbit_awal:
+        return min(jari_orbit_akhir, jari_orbit_awal * RASIO_PUNCAK_HOHMANN)
+    return jari_orbit_akhir
+
+
+def cari_orbit_maks(jari_orbit_awal, jari_orbit_akhir, massa_kosong, anggaran,
+                    isp=None, harga=None, presisi=None, mode=None, dorong_rendah=None):
+    """Orbit terjauh ke arah R2 yang biayanya masih <= anggaran, per bahan bakar.
+
+    Bisection pada biaya(R) = anggaran di antara R1 (biaya 0) dan R2, untuk
+    semua bahan bakar sekaligus. Berlaku untuk menaikkan maupun menurunkan
+    orbit; bahan bakar yang sanggup mencapai R2 mendapat R3 = R2.
+    Hasil dibulatkan ke sisi yang terjangkau dengan galat <= presisi (m).
+    Bahan bakar dorong_rendah (mask (F,), bawaan kolom_dorong_rendah(isp))
+    memakai ΔV Edelbaum, yang naik monoton sampai R2 (tanpa puncak Hohmann);
+    dengan solver "tertutup" R3-nya dibalik langsung dari anggaran, tanpa bisection.
+
+    Kembalikan array (F,) jari-jari R3 (meter).
+    """
+    return cari_orbit_maks_batch([jari_orbit_awal], [jari_orbit_akhir], [massa_kosong], [anggaran],
+                                 isp, harga, presisi, mode, dorong_rendah)[0]
+
+
+def cari_orbit_maks_batch(jari_orbit_awal, jari_orbit_akhir, massa_kosong, anggaran,
+                          isp=None, harga=None, presisi=None, mode=None, dorong_rendah=None):
+    """Versi array dari cari_orbit_maks: masukan (N,), hasil (N, F)."""
+    if isp is None:
+        isp = isp_bahan_bakar
+    if harga is None:
+        harga = harga_bahan_bakar
+    if presisi is None:
+        presisi = PRESISI_R3
+
+    r1, r2, mk, anggaran = (a[:, None] for a in np.broadcast_arrays(
+        np.atleast_1d(np.asarray(jari_orbit_awal, dtype=np.float64)),
+        np.atleast_1d(np.asarray(jari_orbit_akhir, dtype=np.float64)),
+        np.atleast_1d(np.asarray(massa_kosong, dtype=np.float64)),
+        np.atleast_1d(np.asarray(anggaran, dtype=np.float64)),
+    ))
+    kecepatan_buang = np.asarray(isp, dtype=np.float64)[None, :] * gravitasi_bumi
+    harga = np.asarray(harga, dtype=np.float64)[None, :]
+    bentuk = (r1.shape[0], kecepatan_buang.shape[1])
+    spiral = mask_dorong_rendah(np.asarray(isp, dtype=np.float64), dorong_rendah)[None, :]
+
+    if _ins.AKTIF:
+        mulai = _ins.mulai()
+        hasil = _cari_orbit_maks_inti(r1, r2, mk, anggaran, kecepatan_buang, harga, spiral,
+                                      bentuk, presisi, mode)
+        _ins.catat_sejak("r3", mulai)
+        _ins.tambah("r3", "pencarian", r1.shape[0])
+        _ins.tambah("r3", "terpotong_puncak", np.count_nonzero(r2 > r1 * RASIO_PUNCAK_HOHMANN))
+        return hasil
+    return _cari_orbit_maks_inti(r1, r2, mk, anggaran, kecepatan_buang, harga, spiral,
+                                 bentuk, presisi, mode)
+
+
+def _cari_orbit_maks_inti(r1, r2, mk, anggaran, kecepatan_buang, harga, spiral, bentuk, presisi, mode):
+    # Bracket [R1, batas]: biaya(R1) = 0 selalu terjangkau; batas sama
+    # dengan batas_pencarian_r3 tetapi per baris (R2 untuk dorong rendah)
+    batas = np.where(r2 > r1, np.minimum(r2, r1 * RASIO_PUNCAK_HOHMANN), r2)
+    bawah = np.broadcast_to(r1, bentuk).copy()
+    atas = np.where(spiral, r2, batas)
+    # Periksa biaya di R2 sendiri, bukan di ujung bracket: di luar puncak
+    # biaya turun lagi, jadi R2 bisa terjangkau walau puncaknya tidak. Bila
+    # R2 tidak terjangkau, puncak (lebih mahal) juga tidak, sehingga
+    # bisection di [R1, atas] selalu mengapit titik potongnya.
+    terjangkau = biaya_ke_orbit(r1, r2, mk, kecepatan_buang, harga, mode, spiral) <= anggaran
+    if _ins.AKTIF:
+        _ins.tambah("r3", "evaluasi", terjangkau.size)
+
+    hasil = np.where(terjangkau, r2, bawah)
+    cari = ~terjangkau
+    if (MODE_SOLVER if mode is None else mode) == "tertutup":
+        # ΔV spiral monoton dan massa bentuk-tertutup bisa dibalik: R3 spiral
+        # langsung dari ΔV maksimum yang terbeli, tanpa bisection
+        tutup = cari & spiral
+        if tutup.any():
+            baris, kolom = np.nonzero(tutup)
+            hasil[tutup] = _r3_spiral_tertutup(r1[baris, 0], r2[baris, 0], mk[baris, 0], anggaran[baris, 0],
+                                               kecepatan_buang[0, kolom], harga[0, kolom], presisi)
+            cari &= ~tutup
+    if not cari.any():
+        return hasil
+
+    baris, kolom = np.nonzero(cari)
+    r1 = r1[baris, 0]
+    mk = mk[baris, 0]
+    anggaran = anggaran[baris, 0]
+    ve = kecepatan_buang[0, kolom]
+    hg = harga[0, kolom]
+    sp = spiral[0, kolom]
+    bawah = bawah[cari]
+    atas = atas[cari]
+    # Jumlah langkah per sel, bukan dari bracket terlebar: bracket spiral
+    # (sampai R2) tidak boleh menambah langkah sel Hohmann, agar R3 tiap
+    # sel tidak bergantung pada isi batch (mis. pencarian per Isp di cache)
+    langkah_sel = np.ceil(np.log2(np.maximum(np.abs(atas - bawah) / presisi, 1.0)))
+    langkah = int(langkah_sel.max())
+    langkah_min = int(langkah_sel.min())
+    for i in range(langkah):
+        tengah = 0.5 * (bawah + atas)
+        ok = biaya_ke_orbit(r1, tengah, mk, ve, hg, mode, sp) <= anggaran
+        if i >= langkah_min:
+            jalan = langkah_sel > i
+            tengah = np.where(jalan, tengah, np.where(ok, bawah, atas))
+        bawah = np.where(ok, tengah, bawah)
+        atas = np.where(ok, atas, tengah)
+
+    hasil[cari] = bawah
+    if _ins.AKTIF:
+        _ins.tambah("r3", "evaluasi", bawah.size * langkah)
+        _ins.tambah("r3", "iterasi", langkah)
+        # residu = lebar bracket akhir (meter)
+        _ins.catat_residu("r3", np.max(atas - bawah) if bawah.size else 0.0)
+    return hasil
+
+
+def _r3_spiral_tertutup(r1, r2, mk, anggaran, ve, harga, presisi):
+    # massa = mk·(e^(ΔV/ve) - 1)  ->  ΔV maks = ve·ln(1 + anggaran/harga/mk) / ln(e);
+    # v(R3) = v(R1) ∓ ΔV maks. Pembulatan bisa melewati anggaran beberapa ulp,
+    # jadi hasilnya tetap diperiksa dan digeser ke sisi terjangkau.
+    mu = G * massa_bumi
+    deltaV = ve * np.log1p(anggaran / harga / mk) / np.log(e)
+    kecepatan_R1 = (mu / r1) ** 0.5
+    kecepatan_R3 = np.where(r2 > r1, kecepatan_R1 - deltaV, kecepatan_R1 + deltaV)
+    r3 = np.clip(mu / kecepatan_R3 ** 2, np.minimum(r1, r2), np.maximum(r1, r2))
+    lewat = biaya_ke_orbit(r1, r3, mk, ve, harga, "tertutup", True) > anggaran
+    if _ins.AKTIF:
+        _ins.tambah("r3", "evaluasi", r3.size)
+    if lewat.any():
+        r3[lewat] = mundur_ke_terjangkau_batch(r1[lewat], r3[lewat], mk[lewat], anggaran[lewat], ve[lewat],
+                                               harga[lewat], presisi, "tertutup", True)
+    return r3
+
+
+def mundur_ke_terjangkau_batch(jari_orbit_awal, radius, massa_kosong, anggaran, kecepatan_buang, harga,
+                               presisi=None, mode=None, dorong_rendah=None):
+    """Geser radius (N,) yang biayanya melebihi anggaran ke arah R1 sampai terjangkau.
+
+    Semua masukan (N,) (dorong_rendah: mask (N,), None = menurut
+    kecepatan_buang seperti biaya_ke_orbit). Radius yang
+    sudah terjangkau dikembalikan apa adanya; sisanya mundur dengan langkah
+    presisi yang berlipat lalu dibelah dua sampai lebar <= presisi, jadi
+    hasilnya di sisi terjangkau seperti cari_orbit_maks. Dipakai untuk
+    memeriksa R3 yang dihitung dari masukan lain (mis. kunci cache yang
+    dibulatkan) terhadap masukan mentah.
+    """
+    if presisi is None:
+        presisi = PRESISI_R3
+    r1, radius, mk, anggaran, ve, hg = (np.array(a, dtype=np.float64) for a in np.broadcast_arrays(
+        jari_orbit_awal, radius, massa_kosong, anggaran, kecepatan_buang, harga))
+    sp = None if dorong_rendah is None else np.broadcast_to(np.asarray(dorong_rendah, dtype=bool), r1.shape)
+
+    def terjangkau(i, x):
+        return biaya_ke_orbit(r1[i], x, mk[i], ve[i], hg[i], mode, None if sp is None else sp[i]) <= anggaran[i]
+
+    semua = np.arange(r1.shape[0])
+    idx = semua[~terjangkau(semua, radius)]
+    evaluasi = r1.shape[0]
+    if idx.size:
+        arah = np.sign(radius[idx] - r1[idx])
+        atas = radius[idx]             # tidak terjangkau
+        bawah = r1[idx].copy()         # terjangkau (biaya 0)
+        langkah = np.full(idx.size, float(presisi))
+        aktif = np.arange(idx.size)
+        while aktif.size:
+            calon = atas[aktif] - arah[aktif] * langkah[aktif]
+            lewat = (calon - r1[idx[aktif]]) * arah[aktif] <= 0
+            calon = np.where(lewat, r1[idx[aktif]], calon)
+            ok = lewat | terjangkau(idx[aktif], calon)
+            evaluasi += aktif.size
+            bawah[aktif] = np.where(ok, calon, bawah[aktif])
+            atas[aktif] = np.where(ok, atas[aktif], calon)
+            langkah[aktif] *= 2
+            aktif = aktif[~ok]
+        while True:
+            lebar = np.abs(atas - bawah) > presisi
+            if not lebar.any():
+                break
+            i = np.nonzero(lebar)[0]
+            tengah = 0.5 * (atas[i] + bawah[i])
+            ok = terjangkau(idx[i], tengah)
+            evaluasi += i.size
+            bawah[i] = np.where(ok, tengah, bawah[i])
+            atas[i] = np.where(ok, atas[i], tengah)
+        radius[idx] = bawah
+    if _ins.AKTIF:
+        _ins.tambah("r3", "evaluasi", evaluasi)
+        _ins.tambah("r3", "mundur", idx.size)
+    return radius
+
+
+# ----------------------------------------------------------
+# Kurva biaya vs. radius (untuk tambah anggaran berulang)
+# ----------------------------------------------------------
+
+TITIK_AWAL_KURVA = 64
+TITIK_MAKS_KURVA = 16384
+
+KurvaBiaya = namedtuple("KurvaBiaya", ["jari_orbit_awal", "jari_orbit_akhir", "radius", "biaya",
+                                       "biaya_akhir", "massa_kosong", "kecepatan_buang", "harga",
+                                       "dorong_rendah", "presisi", "mode"])
+
+
+def buat_kurva_biaya(jari_orbit_awal, jari_orbit_akhir, massa_kosong, isp=None, harga=None,
+                     presisi=None, titik_awal=None, titik_maks=None, mode=None, dorong_rendah=None):
+    """Tabel biaya kumulatif vs. radius target, satu tabel per bahan bakar.
+
+    Grid awal berjarak logaritmik dari R1 ke batas_pencarian_r3 (ke R2
+    untuk bahan bakar dorong_rendah, bawaan kolom_dorong_rendah(isp)), lalu
+    segmen dibelah dua selama galat interpolasi linear (dinyatakan dalam
+    meter radius) melebihi presisi. Biaya dibuat monoton naik sepanjang
+    tabel sehingga bisa dicari terbalik dengan binary search. biaya_akhir
+    (F,) adalah biaya ke R2 sendiri, yang di luar puncak Hohmann lebih
+    murah dari ujung tabel. Parameter biaya ikut disimpan agar
+    orbit_maks_dari_kurva bisa memeriksa hasil interpolasi terhadap biaya
+    sebenarnya.
+    """
+    if isp is None:
+        isp = isp_bahan_bakar
+    if harga is None:
+        harga = harga_bahan_bakar
+    if presisi is None:
+        presisi = PRESISI_R3
+    if titik_awal is None:
+        titik_awal = TITIK_AWAL_KURVA
+    if titik_maks is None:
+        titik_maks = TITIK_MAKS_KURVA
+
+    kecepatan_buang = np.asarray(isp, dtype=np.float64) * gravitasi_bumi
+    harga = np.asarray(harga, dtype=np.float64)
+    spiral = mask_dorong_rendah(np.asarray(isp, dtype=np.float64), dorong_rendah).copy()
+    dasar_hohmann = np.geomspace(jari_orbit_awal, batas_pencarian_r3(jari_orbit_awal, jari_orbit_akhir),
+                                 titik_awal)
+    dasar_spiral = np.geomspace(jari_orbit_awal, jari_orbit_akhir, titik_awal)
+
+    if _ins.AKTIF:
+        mulai = _ins.mulai()
+
+    daftar_radius = []
+    daftar_biaya = []
+    for k in range(kecepatan_buang.shape[0]):
+        r = dasar_spiral if spiral[k] else dasar_hohmann
+        b = biaya_ke_orbit(jari_orbit_awal, r, massa_kosong, kecepatan_buang[k], harga[k], mode, spiral[k])
+        while r.shape[0] < titik_maks:
+            tengah = 0.5 * (r[:-1] + r[1:])
+            b_tengah = biaya_ke_orbit(jari_orbit_awal, tengah, massa_kosong, kecepatan_buang[k], harga[k],
+                                      mode, spiral[k])
+            kemiringan = np.abs(b[1:] - b[:-1]) / np.maximum(np.abs(r[1:] - r[:-1]), 1e-300)
+            galat = np.abs(b_tengah - 0.5 * (b[:-1] + b[1:])) / np.maximum(kemiringan, 1e-300)
+            perlu = galat > presisi
+            if not perlu.any():
+                break
+            sisa = titik_maks - r.shape[0]
+            if perlu.sum() > sisa and _ins.AKTIF:
+                _ins.tambah("kurva", "batas_tercapai")
+            if perlu.sum() > sisa:
+                # kuota titik hampir habis: belah hanya segmen dengan galat terbesar
+                perlu = np.zeros_like(perlu)
+                perlu[np.argsort(galat)[-sisa:]] = True
+            r = np.concatenate((r, tengah[perlu]))
+            b = np.concatenate((b, b_tengah[perlu]))
+            urutan = np.argsort(np.abs(r - jari_orbit_awal), kind="stable")
+            r = r[urutan]
+            b = b[urutan]
+        daftar_radius.append(r)
+        daftar_biaya.append(np.maximum.accumulate(b))
+
+    biaya_akhir = biaya_ke_orbit(jari_orbit_awal, jari_orbit_akhir, massa_kosong, kecepatan_buang, harga,
+                                 mode, spiral)
+
+    if _ins.AKTIF:
+        _ins.catat_sejak("kurva", mulai)
+        _ins.tambah("kurva", "evaluasi", sum(r.shape[0] for r in daftar_radius) + biaya_akhir.size)
+    return KurvaBiaya(float(jari_orbit_awal), float(jari_orbit_akhir), daftar_radius, daftar_biaya,
+                      biaya_akhir, float(massa_kosong), kecepatan_buang, harga, spiral, presisi, mode)
+
+
+def orbit_maks_dari_kurva(kurva, anggaran):
+    """R3 tiap bahan bakar untuk anggaran baru: binary search + interpolasi, O(log n).
+
+    anggaran : skalar, atau satu nilai per bahan bakar (F,)
+
+    Interpolasi linear bisa sedikit melewati radius yang terjangkau, jadi
+    hasilnya diperiksa dengan biaya_ke_orbit dan, bila melebihi anggaran,
+    dibelah dua ke arah titik tabel sebelumnya sampai <= presisi — sisi
+    terjangkau yang sama dengan cari_orbit_maks.
+    """
+    if _ins.AKTIF:
+        mulai = _ins.mulai()
+        hasil = _orbit_maks_dari_kurva(kurva, anggaran)
+        _ins.catat_sejak("cek_anggaran", mulai)
+        _ins.tambah("cek_anggaran", "evaluasi", len(kurva.radius))
+        return hasil
+    return _orbit_maks_dari_kurva(kurva, anggaran)
+
+
+def _biaya_ke_orbit_skalar(jari_orbit_awal, jari_orbit_target, massa_kosong,
+                          kecepatan_buang, harga, mode, spiral=False):
+    # biaya_ke_orbit untuk satu titik tanpa overhead array (dan tanpa instrumentasi solver)
+    if mode is None:
+        mode = MODE_SOLVER
+    if spiral:
+        deltaV1, deltaV2 = hitung_delta_v_edelbaum(jari_orbit_awal, jari_orbit_target), 0.0
+    else:
+        _, deltaV1, deltaV2 = hitung_delta_v(jari_orbit_awal, jari_orbit_target)
+    massa = _selesaikan_skalar(deltaV1, deltaV2, kecepatan_buang, massa_kosong, mode, TOLERANSI_SOLVER,
+                               ITERASI_TETAP if mode == "tetap" else ITERASI_MAKS).massa
+    return hitung_biaya(massa, harga)
+
+
+def _orbit_maks_dari_kurva(kurva, anggaran):
+    hasil = np.empty(len(kurva.radius))
+    per_bahan_bakar = np.ndim(anggaran) > 0
+    k = 0
+    while k < len(kurva.radius):
+        r = kurva.radius[k]
+        b = kurva.biaya[k]
+        a = anggaran[k] if per_bahan_bakar else anggaran
+        if a >= kurva.biaya_akhir[k]:
+            # R2 sendiri terjangkau, termasuk di luar puncak yang lebih mahal
+            hasil[k] = kurva.jari_orbit_akhir
+        elif a >= b[-1]:
+            # ujung tabel terjangkau tetapi R2 tidak: hanya terjadi karena
+            # pembulatan saat R2 adalah ujung tabel itu sendiri
+            hasil[k] = r[-1]
+        else:
+            idx = int(np.searchsorted(b, a, side="right"))
+            if idx == 0:
+                hasil[k] = kurva.jari_orbit_awal
+            else:
+                t = (a - b[idx - 1]) / (b[idx] - b[idx - 1])
+                hasil[k] = _mundur_ke_terjangkau(kurva, k, float(r[idx - 1]),
+                                                 float(r[idx - 1] + t * (r[idx] - r[idx - 1])), a)
+        k += 1
+    return hasil
+
+
+def _mundur_ke_terjangkau(kurva, k, titik_aman, radius, anggaran):
+    # Interpolasi linear bisa melewati radius terjangkau sedikit; mundur ke
+    # arah titik_aman (biaya tabel = maksimum kumulatif, jadi pasti
+    # terjangkau) dengan langkah presisi yang berlipat, lalu bisection
+    # sampai lebar <= presisi, sehingga hasilnya di sisi terjangkau seperti
+    # cari_orbit_maks.
+    def biaya(x):
+        return _biaya_ke_orbit_skalar(kurva.jari_orbit_awal, x, kurva.massa_kosong,
+                                      float(kurva.kecepatan_buang[k]), float(kurva.harga[k]), kurva.mode,
+                                      bool(kurva.dorong_rendah[k]))
+
+    if biaya(radius) <= anggaran:
+        return radius
+    arah = 1.0 if radius > titik_aman else -1.0
+    langkah = kurva.presisi
+    while True:
+        mundur = radius - arah * langkah
+        if (mundur - titik_aman) * arah <= 0:
+            mundur = titik_aman
+            break
+        if biaya(mundur) <= anggaran:
+            break
+        radius = mundur
+        langkah *= 2
+    while abs(radius - mundur) > kurva.presisi:
+        tengah = 0.5 * (radius + mundur)
+        if biaya(tengah) <= anggaran:
+            mundur = tengah
+        else:
+            radius = tengah
+    return mundur
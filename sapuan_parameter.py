@@ -0,0 +1,207 @@
+# ==========================================================
+# SAPUAN PARAMETER (multi-core) — studi trade-off misi
+# Grid R1 × R2 × massa_kosong × anggaran dipotong menjadi chunk lalu
+# dihitung paralel oleh process pool. Tiap worker menulis hasil chunk-nya
+# langsung ke array memory-mapped yang sudah dialokasikan (tidak ada objek
+# besar yang dikirim balik ke proses induk). Chunk yang selesai ditandai
+# di berkas terpisah sehingga sapuan bisa dilanjutkan setelah crash.
+#
+# Contoh:
+#   python sapuan_parameter.py hasil_sapuan \
+#       --r1 6571000:8371000:20 --r2 6771000:42164000:200 \
+#       --massa 950:100000:50 --anggaran 1e5:1e8:40 --proses 8
+#
+# Isi direktori keluaran:
+#   meta.json    : definisi grid, kolom, ukuran chunk
+#   hasil.dat    : float64 (N, kolom) — baris ke-n = indeks datar grid
+#   selesai.dat  : uint8 (jumlah_chunk,) — 1 bila chunk sudah ditulis
+# ==========================================================
+
+import argparse
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+import perhitungan_orbit as po
+
+UKURAN_CHUNK = 65_536
+
+
+def kolom_hasil(jumlah_bahan_bakar):
+    """Nama kolom hasil.dat; orbit_maks berisi NaN bila ada bahan bakar yang terjangkau."""
+    kolom = ["deltaV1", "deltaV2"]
+    for awalan in ("massa", "biaya", "orbit_maks"):
+        kolom += [awalan + "_" + str(i) for i in range(jumlah_bahan_bakar)]
+    return kolom
+
+
+def buat_sumbu(spesifikasi):
+    """'awal:akhir:jumlah' -> linspace, atau satu angka -> array 1 elemen."""
+    bagian = spesifikasi.split(":")
+    if len(bagian) == 1:
+        return np.array([float(bagian[0])])
+    if len(bagian) != 3:
+        raise ValueError("format sumbu harus 'awal:akhir:jumlah' atau satu angka: " + spesifikasi)
+    return np.linspace(float(bagian[0]), float(bagian[1]), int(bagian[2]))
+
+
+def validasi_sumbu(sumbu):
+    for nama in ("r1", "r2"):
+        if sumbu[nama].min() < po.RADIUS_BUMI or sumbu[nama].max() > po.RADIUS_ATAS_MAX:
+            raise ValueError(nama + " harus di antara " + str(po.RADIUS_BUMI) + " dan "
+                             + str(po.RADIUS_ATAS_MAX) + " m")
+    for nama in ("massa", "anggaran"):
+        if sumbu[nama].min() <= 0:
+            raise ValueError(nama + " harus lebih besar dari 0")
+
+
+# ----------------------------------------------------------
+# Worker
+# ----------------------------------------------------------
+
+def hitung_chunk(direktori, meta, nomor_chunk):
+    """Hitung satu chunk grid dan tulis langsung ke hasil.dat (dipanggil di worker)."""
+    jumlah = meta["jumlah_skenario"]
+    awal = nomor_chunk * meta["ukuran_chunk"]
+    akhir = min(awal + meta["ukuran_chunk"], jumlah)
+
+    sumbu = [np.asarray(meta["sumbu"][nama]) for nama in ("r1", "r2", "massa", "anggaran")]
+    indeks = np.unravel_index(np.arange(awal, akhir), [len(s) for s in sumbu])
+    r1, r2, mk, anggaran = (s[i] for s, i in zip(sumbu, indeks))
+
+    _, deltaV1, deltaV2 = po.hitung_delta_v_batch(r1, r2)
+    massa, biaya = po.hitung_batch(r1, r2, mk)
+    orbit_maks = np.full(massa.shape, np.nan)
+    tidak_mampu = ~(biaya <= anggaran[:, None]).any(axis=1)
+    if tidak_mampu.any():
+        orbit_maks[tidak_mampu] = po.cari_orbit_maks_batch(
+            r1[tidak_mampu], r2[tidak_mampu], mk[tidak_mampu], anggaran[tidak_mampu])
+
+    hasil = np.memmap(os.path.join(direktori, "hasil.dat"), dtype=np.float64, mode="r+",
+                      shape=(jumlah, len(meta["kolom"])))
+    hasil[awal:akhir] = np.column_stack((deltaV1, deltaV2, massa, biaya, orbit_maks))
+    hasil.flush()
+    del hasil
+
+    # tandai selesai hanya setelah data chunk benar-benar tersimpan
+    selesai = np.memmap(os.path.join(direktori, "selesai.dat"), dtype=np.uint8, mode="r+",
+                        shape=(meta["jumlah_chunk"],))
+    selesai[nomor_chunk] = 1
+    selesai.flush()
+    del selesai
+    return nomor_chunk
+
+
+def _hitung_chunk_bintang(argumen):
+    return hitung_chunk(*argumen)
+
+
+# ----------------------------------------------------------
+# Induk
+# ----------------------------------------------------------
+
+def siapkan_direktori(direktori, sumbu, ukuran_chunk, ulang=False):
+    """Buat (atau buka untuk dilanjutkan) direktori sapuan; kembalikan meta."""
+    jumlah = 1
+    for nama in ("r1", "r2", "massa", "anggaran"):
+        jumlah *= len(sumbu[nama])
+    meta = {
+        "sumbu": {nama: np.asarray(nilai).tolist() for nama, nilai in sumbu.items()},
+        "urutan_sumbu": ["r1", "r2", "massa", "anggaran"],
+        "jumlah_skenario": jumlah,
+        "ukuran_chunk": ukuran_chunk,
+        "jumlah_chunk": -(-jumlah // ukuran_chunk),
+        "nama_bahan_bakar": po.nama_bahan_bakar,
+        "isp_bahan_bakar": po.isp_bahan_bakar,
+        "harga_bahan_bakar": po.harga_bahan_bakar,
+        "kolom": kolom_hasil(po.jumlah_bahan_bakar),
+    }
+
+    os.makedirs(direktori, exist_ok=True)
+    jalur_meta = os.path.join(direktori, "meta.json")
+    if os.path.exists(jalur_meta) and not ulang:
+        with open(jalur_meta, encoding="utf-8") as f:
+            meta_lama = json.load(f)
+        if meta_lama != meta:
+            raise ValueError("direktori " + direktori + " berisi sapuan dengan parameter lain "
+                             "(gunakan --ulang untuk menimpa)")
+        return meta
+
+    # Alokasi awal berkas hasil & penanda chunk
+    np.memmap(os.path.join(direktori, "hasil.dat"), dtype=np.float64, mode="w+",
+              shape=(jumlah, len(meta["kolom"]))).flush()
+    np.memmap(os.path.join(direktori, "selesai.dat"), dtype=np.uint8, mode="w+",
+              shape=(meta["jumlah_chunk"],)).flush()
+    with open(jalur_meta, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    return meta
+
+
+def jalankan_sapuan(direktori, sumbu, ukuran_chunk=UKURAN_CHUNK, proses=None, ulang=False,
+                    laporan=None):
+    """Jalankan (atau lanjutkan) sapuan; kembalikan jumlah chunk yang dihitung sekarang."""
+    validasi_sumbu(sumbu)
+    meta = siapkan_direktori(direktori, sumbu, ukuran_chunk, ulang)
+    selesai = np.fromfile(os.path.join(direktori, "selesai.dat"), dtype=np.uint8)
+    sisa = np.nonzero(selesai == 0)[0].tolist()
+    if not sisa:
+        return 0
+
+    tugas = [(direktori, meta, n) for n in sisa]
+    with Pool(processes=proses) as pool:
+        k = 0
+        for _ in pool.imap_unordered(_hitung_chunk_bintang, tugas):
+            k += 1
+            if laporan is not None:
+                laporan(k, len(tugas))
+    return len(tugas)
+
+
+def buka_hasil(direktori):
+    """Buka hasil sapuan (read-only memmap) beserta meta-nya."""
+    with open(os.path.join(direktori, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+    hasil = np.memmap(os.path.join(direktori, "hasil.dat"), dtype=np.float64, mode="r",
+                      shape=(meta["jumlah_skenario"], len(meta["kolom"])))
+    return meta, hasil
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sapuan parameter multi-core perpindahan orbit")
+    parser.add_argument("direktori", help="direktori keluaran (dilanjutkan bila sudah ada)")
+    parser.add_argument("--r1", required=True, help="R1 (m): awal:akhir:jumlah atau satu nilai")
+    parser.add_argument("--r2", required=True, help="R2 (m): awal:akhir:jumlah atau satu nilai")
+    parser.add_argument("--massa", required=True, help="massa kosong (kg)")
+    parser.add_argument("--anggaran", required=True, help="anggaran ($)")
+    parser.add_argument("--proses", type=int, default=None, help="jumlah proses (bawaan: semua core)")
+    parser.add_argument("--ukuran-chunk", type=int, default=UKURAN_CHUNK)
+    parser.add_argument("--ulang", action="store_true", help="mulai ulang, timpa hasil lama")
+    args = parser.parse_args(argv)
+
+    try:
+        sumbu = {nama: buat_sumbu(getattr(args, nama)) for nama in ("r1", "r2", "massa", "anggaran")}
+        mulai = time.perf_counter()
+
+        def laporan(k, total):
+            print("\rChunk", k, "/", total, end="", flush=True)
+
+        dihitung = jalankan_sapuan(args.direktori, sumbu, args.ukuran_chunk, args.proses,
+                                   args.ulang, laporan)
+    except ValueError as galat:
+        print("Input tidak valid:", galat, file=sys.stderr)
+        return 2
+
+    waktu = time.perf_counter() - mulai
+    if dihitung == 0:
+        print("Semua chunk sudah selesai sebelumnya.")
+    else:
+        print("\nSelesai:", dihitung, "chunk dalam", round(waktu, 2), "detik")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,342 @@
+# ==========================================================
+# TABEL ΔV TERHITUNG (memory-mapped) untuk kutipan berlatensi rendah
+# Grid logaritmik u1 = ln R1, u2 = ln R2 di [RADIUS_BUMI, RADIUS_ATAS_MAX]
+# berisi G1 = ΔV1 / d dan G2 = ΔV2 / d dengan d = ln(R2 / R1). Keduanya
+# mulus di seluruh domain (ΔV sendiri berbelok tajam di R1 = R2 karena
+# magnitudonya), sehingga interpolasi bilinear memberi galat relatif yang
+# seragam, dan |ΔV| = |d| × G tetap tepat nol di diagonal.
+#
+# Rasio massa per bahan bakar tidak disimpan terpisah: ln(M0 / Mkosong) =
+# (|ΔV1| + |ΔV2|) / ve tepat linear terhadap ΔV, jadi satu tabel melayani
+# semua Isp. Per Isp katalog yang disimpan adalah batas galat rasio
+# massanya (galat ΔV diperbesar faktor z·e^z / (e^z - 1), z = ΔV / ve).
+#
+# Batas galat diukur saat tabel dibuat terhadap jalur eksak di titik
+# tengah setiap sel dan setiap sisi sel (letak galat bilinear terbesar),
+# lalu dikali FAKTOR_AMAN. periksa_tabel() mengujinya ulang terhadap
+# perhitungan_orbit pada sampel acak.
+#
+# Berkas: header JSON (UKURAN_HEADER byte) + float64 G1 (n, n) + G2 (n, n).
+# muat_tabel() hanya memetakan berkas (np.memmap, read-only): selesai
+# dalam milidetik dan halaman berkas dipakai bersama oleh semua proses.
+# Tabel hanya berisi ΔV Hohmann. Bahan bakar dorong rendah (bawaan
+# po.kolom_dorong_rendah) memakai ΔV spiral Edelbaum eksak, yang bentuk
+# tertutupnya sudah semurah satu pembacaan tabel.
+#
+# hitung_skalar_tabel() adalah jalur kutipan tunggal (Python murni, 8
+# pembacaan tabel); untuk batch besar hitung_batch_tabel() tersedia, tetapi
+# po.hitung_batch eksak biasanya sama cepat karena akses tabel acak.
+#
+#   python tabel_delta_v.py buat tabel_dv.bin --titik 2049
+#   python tabel_delta_v.py periksa tabel_dv.bin --sampel 1000000
+# ==========================================================
+
+import argparse
+import json
+import math
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+import perhitungan_orbit as po
+
+MAGIC = "tabel-delta-v"
+VERSI = 1
+UKURAN_HEADER = 4096
+JUMLAH_TITIK = 2049
+FAKTOR_AMAN = 2.0
+
+TabelDeltaV = namedtuple("TabelDeltaV", ["meta", "g1", "g2"])
+
+
+# ----------------------------------------------------------
+# Jalur eksak (bentuk stabil dekat R1 = R2)
+# ----------------------------------------------------------
+
+def _g_eksak(u1, u2):
+    """(ΔV1 / d, ΔV2 / d) eksak, d = u2 - u1; limit d -> 0 sama dengan v1 / 4."""
+    d = u2 - u1
+    rho = np.exp(d)
+    v1 = np.sqrt(po.G * po.massa_bumi * np.exp(-u1))
+    # sqrt(2ρ/(1+ρ)) - 1 = expm1(d) / ((1+ρ)(sqrt(2ρ/(1+ρ)) + 1)), tanpa pembatalan
+    with np.errstate(invalid="ignore", divide="ignore"):
+        em1_per_d = np.where(d == 0, 1.0, np.expm1(d) / d)
+    g1 = v1 * em1_per_d / ((1 + rho) * (np.sqrt(2 * rho / (1 + rho)) + 1))
+    g2 = v1 * em1_per_d / (np.sqrt(rho) * (1 + rho) * (1 + np.sqrt(2 / (1 + rho))))
+    return g1, g2
+
+
+# ----------------------------------------------------------
+# Pembuatan & pemuatan
+# ----------------------------------------------------------
+
+def buat_tabel(jalur, jumlah_titik=JUMLAH_TITIK, isp=None):
+    """Hitung tabel, ukur batas galat, lalu tulis ke jalur. Kembalikan meta."""
+    if isp is None:
+        isp = po.isp_bahan_bakar
+    u_min = math.log(po.RADIUS_BUMI)
+    u_maks = math.log(po.RADIUS_ATAS_MAX)
+    u = np.linspace(u_min, u_maks, jumlah_titik)
+    g1, g2 = _g_eksak(u[:, None], u[None, :])
+
+    galat = max(_galat_tengah(u, g1, g2, tengah_baris, tengah_kolom)
+                for tengah_baris, tengah_kolom in ((True, True), (True, False), (False, True)))
+    batas_galat = FAKTOR_AMAN * galat
+
+    # galat rasio massa per Isp: dikali z·e^z / (e^z - 1) pada ΔV total terbesar
+    dv_maks = float(np.max(np.abs(u[None, :] - u[:, None]) * (g1 + g2)))
+    batas_rasio = [_perbesaran_rasio(batas_galat, dv_maks, nilai_isp) for nilai_isp in isp]
+
+    meta = {
+        "magic": MAGIC,
+        "versi": VERSI,
+        "jumlah_titik": jumlah_titik,
+        "u_min": u_min,
+        "u_maks": u_maks,
+        "batas_galat_delta_v": batas_galat,
+        "delta_v_total_maks": dv_maks,
+        "isp": [float(x) for x in isp],
+        "batas_galat_rasio": batas_rasio,
+    }
+    header = json.dumps(meta).encode("utf-8")
+    if len(header) >= UKURAN_HEADER:
+        raise ValueError("katalog Isp terlalu besar untuk header tabel")
+    with open(jalur, "wb") as f:
+        f.write(header.ljust(UKURAN_HEADER, b" "))
+        f.write(np.ascontiguousarray(g1, dtype="<f8").tobytes())
+        f.write(np.ascontiguousarray(g2, dtype="<f8").tobytes())
+    return meta
+
+
+def _rata_tengah(g, tengah_baris, tengah_kolom):
+    # interpolasi bilinear tepat di tengah sisi / sel = rata-rata titik sudutnya
+    if tengah_baris:
+        g = 0.5 * (g[:-1] + g[1:])
+    if tengah_kolom:
+        g = 0.5 * (g[:, :-1] + g[:, 1:])
+    return g
+
+
+def _galat_tengah(u, g1, g2, tengah_baris, tengah_kolom, blok=256):
+    """Galat relatif maksimum interpolasi di tengah sel/sisi, per blok baris."""
+    u_baris = 0.5 * (u[:-1] + u[1:]) if tengah_baris else u
+    u_kolom = 0.5 * (u[:-1] + u[1:]) if tengah_kolom else u
+    galat = 0.0
+    for awal in range(0, u_baris.shape[0], blok):
+        akhir = min(awal + blok, u_baris.shape[0])
+        potongan = slice(awal, akhir + (1 if tengah_baris else 0))
+        eksak = _g_eksak(u_baris[awal:akhir, None], u_kolom[None, :])
+        for g, e in zip((g1, g2), eksak):
+            interpolasi = _rata_tengah(g[potongan], tengah_baris, tengah_kolom)
+            galat = max(galat, float(np.max(np.abs(interpolasi / e - 1))))
+    return galat
+
+
+def _perbesaran_rasio(batas_galat, delta_v_total, isp):
+    # rasio = b^(ΔV/ve) - 1, b = po.e; galat relatif ΔV diperbesar z·e^z / (e^z - 1)
+    z = delta_v_total / (isp * po.gravitasi_bumi) * math.log(po.e)
+    return batas_galat * (z * math.exp(z) / math.expm1(z) if z > 0 else 1.0)
+
+
+def muat_tabel(jalur):
+    """Petakan tabel dari berkas (read-only, tanpa salin)."""
+    with open(jalur, "rb") as f:
+        header = f.read(UKURAN_HEADER)
+    try:
+        meta = json.loads(header.decode("utf-8"))
+    except ValueError:
+        raise ValueError(jalur + " bukan berkas tabel ΔV")
+    if meta.get("magic") != MAGIC or meta.get("versi") != VERSI:
+        raise ValueError(jalur + " bukan berkas tabel ΔV versi " + str(VERSI))
+    n = meta["jumlah_titik"]
+    g = np.memmap(jalur, dtype="<f8", mode="r", offset=UKURAN_HEADER, shape=(2, n, n))
+    # ndarray biasa di atas pemetaan yang sama: pengindeksan tanpa overhead subkelas memmap
+    g = np.asarray(g)
+    return TabelDeltaV(meta, g[0], g[1])
+
+
+# ----------------------------------------------------------
+# Kueri
+# ----------------------------------------------------------
+
+def delta_v_tabel(tabel, jari_orbit_awal, jari_orbit_akhir):
+    """(ΔV1, ΔV2) bertanda seperti hitung_delta_v_batch, dari interpolasi tabel (N,)."""
+    meta = tabel.meta
+    n = meta["jumlah_titik"]
+    langkah = (meta["u_maks"] - meta["u_min"]) / (n - 1)
+    r1 = np.asarray(jari_orbit_awal, dtype=np.float64)
+    r2 = np.asarray(jari_orbit_akhir, dtype=np.float64)
+    u1 = np.log(r1)
+    u2 = np.log(r2)
+    # d lewat log1p agar galat relatifnya tetap kecil saat R1 ≈ R2
+    d = np.log1p((r2 - r1) / r1)
+    if np.any(u1 < meta["u_min"] - 1e-12) or np.any(u1 > meta["u_maks"] + 1e-12) \
+            or np.any(u2 < meta["u_min"] - 1e-12) or np.any(u2 > meta["u_maks"] + 1e-12):
+        raise ValueError("radius di luar domain tabel [RADIUS_BUMI, RADIUS_ATAS_MAX]")
+    x = (u1 - meta["u_min"]) / langkah
+    y = (u2 - meta["u_min"]) / langkah
+    i = np.clip(np.floor(x).astype(np.int64), 0, n - 2)
+    j = np.clip(np.floor(y).astype(np.int64), 0, n - 2)
+    tx = x - i
+    ty = y - j
+    hasil = []
+    for g in (tabel.g1, tabel.g2):
+        hasil.append(((1 - tx) * (1 - ty) * g[i, j] + (1 - tx) * ty * g[i, j + 1]
+                      + tx * (1 - ty) * g[i + 1, j] + tx * ty * g[i + 1, j + 1]) * d)
+    return hasil[0], hasil[1]
+
+
+def hitung_skalar_tabel(tabel, jari_orbit_awal, jari_orbit_akhir, massa_kosong,
+                        isp=None, harga=None, dorong_rendah=None):
+    """Jalur cepat satu kutipan tanpa NumPy per elemen; sama dengan po.hitung_skalar (mode "tertutup")."""
+    if isp is None:
+        isp = po.isp_bahan_bakar
+    if dorong_rendah is None:
+        dorong_rendah = [x >= po.ISP_DORONG_RENDAH for x in isp]
+    elif dorong_rendah is False:
+        dorong_rendah = [False] * len(isp)
+    if harga is None:
+        harga = po.harga_bahan_bakar
+    meta = tabel.meta
+    n = meta["jumlah_titik"]
+    u_min = meta["u_min"]
+    langkah = (meta["u_maks"] - u_min) / (n - 1)
+    if not (po.RADIUS_BUMI <= jari_orbit_awal <= po.RADIUS_ATAS_MAX
+            and po.RADIUS_BUMI <= jari_orbit_akhir <= po.RADIUS_ATAS_MAX):
+        raise ValueError("radius di luar domain tabel [RADIUS_BUMI, RADIUS_ATAS_MAX]")
+    x = (math.log(jari_orbit_awal) - u_min) / langkah
+    y = (math.log(jari_orbit_akhir) - u_min) / langkah
+    i = min(int(x), n - 2)
+    j = min(int(y), n - 2)
+    tx = x - i
+    ty = y - j
+    d = math.log1p((jari_orbit_akhir - jari_orbit_awal) / jari_orbit_awal)
+    g1 = tabel.g1.item
+    g2 = tabel.g2.item
+    w00 = (1 - tx) * (1 - ty)
+    w01 = (1 - tx) * ty
+    w10 = tx * (1 - ty)
+    w11 = tx * ty
+    dv_total = abs(d) * (w00 * (g1(i, j) + g2(i, j)) + w01 * (g1(i, j + 1) + g2(i, j + 1))
+                         + w10 * (g1(i + 1, j) + g2(i + 1, j)) + w11 * (g1(i + 1, j + 1) + g2(i + 1, j + 1)))
+
+    dv_spiral = po.hitung_delta_v_edelbaum(jari_orbit_awal, jari_orbit_akhir) if any(dorong_rendah) else 0.0
+
+    massa_bahan_bakar = [0] * len(isp)
+    biaya_bahan_bakar = [0] * len(isp)
+    i = 0
+    while i < len(isp):
+        dv = dv_spiral if dorong_rendah[i] else dv_total
+        massa_bahan_bakar[i] = massa_kosong * (po.e ** (dv / (isp[i] * po.gravitasi_bumi)) - 1)
+        biaya_bahan_bakar[i] = po.hitung_biaya(massa_bahan_bakar[i], harga[i])
+        i += 1
+    return massa_bahan_bakar, biaya_bahan_bakar
+
+
+def rasio_massa_tabel(tabel, jari_orbit_awal, jari_orbit_akhir, isp=None, dorong_rendah=None):
+    """Massa bahan bakar per kg massa kosong, (N, F); sama dengan solver "tertutup"."""
+    if isp is None:
+        isp = po.isp_bahan_bakar
+    r1 = np.atleast_1d(jari_orbit_awal)
+    r2 = np.atleast_1d(jari_orbit_akhir)
+    deltaV1, deltaV2 = delta_v_tabel(tabel, r1, r2)
+    kecepatan_buang = np.asarray(isp, dtype=np.float64) * po.gravitasi_bumi
+    deltaV = np.broadcast_to((np.abs(deltaV1) + np.abs(deltaV2))[:, None],
+                             (deltaV1.shape[0], kecepatan_buang.shape[0]))
+    spiral = po.mask_dorong_rendah(np.asarray(isp, dtype=np.float64), dorong_rendah)
+    if spiral.any():
+        deltaV = np.where(spiral[None, :], po.hitung_delta_v_edelbaum_batch(r1, r2)[:, None], deltaV)
+    return po.e ** (deltaV / kecepatan_buang[None, :]) - 1.0
+
+
+def hitung_batch_tabel(tabel, jari_orbit_awal, jari_orbit_akhir, massa_kosong, isp=None, harga=None,
+                       dorong_rendah=None):
+    """Pengganti po.hitung_batch lewat tabel; kembalikan (massa, biaya) (N, F)."""
+    if harga is None:
+        harga = po.harga_bahan_bakar
+    r1, r2, mk = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(jari_orbit_awal, dtype=np.float64)),
+        np.atleast_1d(np.asarray(jari_orbit_akhir, dtype=np.float64)),
+        np.atleast_1d(np.asarray(massa_kosong, dtype=np.float64)),
+    )
+    massa = rasio_massa_tabel(tabel, r1, r2, isp, dorong_rendah) * mk[:, None]
+    return massa, np.maximum(massa * np.asarray(harga, dtype=np.float64)[None, :], 0.0)
+
+
+def batas_galat_rasio(tabel, isp):
+    """Batas galat relatif rasio massa untuk Isp sembarang (bukan hanya katalog)."""
+    meta = tabel.meta
+    if isp in meta["isp"]:
+        return meta["batas_galat_rasio"][meta["isp"].index(isp)]
+    return _perbesaran_rasio(meta["batas_galat_delta_v"], meta["delta_v_total_maks"], isp)
+
+
+def periksa_tabel(tabel, jumlah_sampel=1_000_000, seed=0, isp=None):
+    """Bandingkan tabel dengan jalur eksak pada sampel log-seragam.
+
+    Kembalikan dict galat relatif maksimum ΔV dan rasio massa per Isp,
+    beserta batasnya; lempar ValueError bila ada batas yang terlampaui.
+    """
+    if isp is None:
+        isp = tabel.meta["isp"]
+    rng = np.random.default_rng(seed)
+    u = rng.uniform(tabel.meta["u_min"], tabel.meta["u_maks"], (2, int(jumlah_sampel)))
+    r1, r2 = np.exp(u)
+    r1 = np.clip(r1, po.RADIUS_BUMI, po.RADIUS_ATAS_MAX)
+    r2 = np.clip(r2, po.RADIUS_BUMI, po.RADIUS_ATAS_MAX)
+    # d sangat kecil: rumus eksak perhitungan_orbit sendiri kehilangan digit
+    cukup_jauh = np.abs(np.log(r2 / r1)) > 1e-6
+    r1, r2 = r1[cukup_jauh], r2[cukup_jauh]
+
+    _, dv1, dv2 = po.hitung_delta_v_batch(r1, r2)
+    t1, t2 = delta_v_tabel(tabel, r1, r2)
+    galat_dv = float(max(np.max(np.abs(t1 / dv1 - 1)), np.max(np.abs(t2 / dv2 - 1))))
+
+    massa = po.selesaikan_bahan_bakar_batch(dv1, dv2, np.asarray(isp) * po.gravitasi_bumi,
+                                            np.ones_like(r1), "tertutup").massa
+    # yang diuji adalah tabel ΔV Hohmann, jadi semua kolom Hohmann
+    rasio = rasio_massa_tabel(tabel, r1, r2, isp, dorong_rendah=False)
+    galat_rasio = np.max(np.abs(rasio / massa - 1), axis=0).tolist()
+    batas_rasio = [batas_galat_rasio(tabel, x) for x in isp]
+
+    hasil = {
+        "jumlah_sampel": int(r1.shape[0]),
+        "galat_delta_v": galat_dv,
+        "batas_galat_delta_v": tabel.meta["batas_galat_delta_v"],
+        "galat_rasio": galat_rasio,
+        "batas_galat_rasio": batas_rasio,
+    }
+    if galat_dv > tabel.meta["batas_galat_delta_v"] or any(
+            g > b for g, b in zip(galat_rasio, batas_rasio)):
+        raise ValueError("galat tabel melampaui batas: " + json.dumps(hasil))
+    return hasil
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tabel ΔV / rasio massa memory-mapped")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+    p_buat = sub.add_parser("buat", help="hitung dan tulis tabel")
+    p_buat.add_argument("jalur")
+    p_buat.add_argument("--titik", type=int, default=JUMLAH_TITIK, help="titik grid per sumbu")
+    p_periksa = sub.add_parser("periksa", help="uji tabel terhadap jalur eksak")
+    p_periksa.add_argument("jalur")
+    p_periksa.add_argument("--sampel", type=float, default=1e6)
+    p_periksa.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        if args.perintah == "buat":
+            meta = buat_tabel(args.jalur, args.titik)
+            print("Tabel", args.jalur, "ditulis; batas galat relatif ΔV =", meta["batas_galat_delta_v"])
+            return 0
+        hasil = periksa_tabel(muat_tabel(args.jalur), args.sampel, args.seed)
+    except (OSError, ValueError) as galat:
+        print(galat, file=sys.stderr)
+        return 1
+    print(json.dumps(hasil, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# ==========================================================
+# TES REGRESI perhitungan_orbit
+# Jalankan: python -m pytest -q
+# ==========================================================
+
+import perhitungan_orbit as po
+
+LEO = 6.771e6
+MASSA_KOSONG = 1000.0
+
+
+def biaya_r3(r3, k, massa_kosong=MASSA_KOSONG, jari_orbit_awal=LEO):
+    return float(po.biaya_ke_orbit(jari_orbit_awal, r3, massa_kosong,
+                                   po.kecepatan_buang_dari_isp(po.isp_bahan_bakar[k]),
+                                   po.harga_bahan_bakar[k]))
+
+
+def test_r2_di_luar_puncak_terjangkau_walau_puncak_tidak():
+    # R2/R1 jauh di atas RASIO_PUNCAK_HOHMANN: RP-1 sanggup ke R2 (~$6182)
+    # tetapi tidak ke puncak biaya, jadi R3 harus R2, bukan titik sebelum puncak
+    r2 = 1.5e9
+    anggaran = 6939.86
+    _, biaya = po.hitung_skalar(LEO, r2, MASSA_KOSONG)
+    assert biaya[0] <= anggaran
+    assert biaya_r3(LEO * po.RASIO_PUNCAK_HOHMANN, 0) > anggaran
+
+    r3 = po.cari_orbit_maks(LEO, r2, MASSA_KOSONG, anggaran)
+    assert r3[0] == r2
+    for k in range(1, po.jumlah_bahan_bakar):
+        assert r3[k] < LEO * po.RASIO_PUNCAK_HOHMANN
+        assert biaya_r3(r3[k], k) <= anggaran
+
+
+def test_kurva_biaya_r2_di_luar_puncak_terjangkau():
+    # jalur "tambah anggaran" (kurva) harus memberi R3 yang sama dengan cari_orbit_maks
+    r2 = 1.5e9
+    anggaran = 6939.86
+    kurva = po.buat_kurva_biaya(LEO, r2, MASSA_KOSONG)
+    r3 = po.orbit_maks_dari_kurva(kurva, anggaran)
+    assert r3[0] == r2
+    for k in range(1, po.jumlah_bahan_bakar):
+        assert biaya_r3(r3[k], k) <= anggaran
+
+
+def test_bahan_bakar_listrik_bawaan_memakai_spiral_edelbaum():
+    # mesin listrik tidak bisa membakar impulsif: kutipan bawaan memakai ΔV Edelbaum
+    geo = 42_164_000.0
+    listrik = po.jumlah_bahan_bakar - 1
+    assert po.isp_bahan_bakar[listrik] >= po.ISP_DORONG_RENDAH
+    massa, biaya = po.hitung_skalar(LEO, geo, MASSA_KOSONG)
+    spiral = po.hitung_bahan_bakar(po.hitung_delta_v_edelbaum(LEO, geo), 0.0,
+                                   po.kecepatan_buang_dari_isp(po.isp_bahan_bakar[listrik]), MASSA_KOSONG)
+    assert massa[listrik] == spiral
+    assert massa[listrik] > po.hitung_skalar(LEO, geo, MASSA_KOSONG, dorong_rendah=False)[0][listrik]
+
+    massa_b, biaya_b = po.hitung_batch(LEO, geo, MASSA_KOSONG)
+    assert abs(massa_b[0, listrik] / spiral - 1) < 1e-11
+    # anggaran yang cukup untuk Hohmann tetapi tidak untuk spiral
+    anggaran = 0.5 * (biaya[listrik] + po.hitung_skalar(LEO, geo, MASSA_KOSONG, dorong_rendah=False)[1][listrik])
+    assert listrik not in po.saring_mampu_beli(biaya, anggaran)
+    r3 = po.cari_orbit_maks(LEO, geo, MASSA_KOSONG, anggaran)
+    assert r3[listrik] < geo
+    assert biaya_r3(r3[listrik], listrik) <= anggaran